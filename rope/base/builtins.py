@@ -2,7 +2,7 @@
 import inspect
 
 import rope.base.evaluate
-from rope.base import pynames, pyobjects, arguments, utils, ast
+from rope.base import pynames, pyobjects, arguments, utils, ast, stubs
 
 
 class BuiltinModule(pyobjects.AbstractModule):
@@ -39,6 +39,9 @@ class BuiltinModule(pyobjects.AbstractModule):
     @property
     @utils.saveit
     def module(self):
+        if self.pycore is not None and \
+           self.pycore.project.prefs.get('extension_stubs', True):
+            return self.pycore.extension_cache.get_stub(self.name)
         try:
             result = __import__(self.name)
             for token in self.name.split('.')[1:]:
@@ -111,6 +114,8 @@ class BuiltinUnknown(_BuiltinElement, pyobjects.PyObject):
         self.type = pyobjects.get_unknown()
 
     def get_name(self):
+        if isinstance(self.builtin, stubs.Stub):
+            return self.builtin.__name__
         return getattr(type(self.builtin), '__name__', None)
 
     @utils.saveit
@@ -119,6 +124,8 @@ class BuiltinUnknown(_BuiltinElement, pyobjects.PyObject):
 
 
 def _object_attributes(obj, parent):
+    if isinstance(obj, stubs.Stub):
+        return _stub_attributes(obj, parent)
     attributes = {}
     for name in dir(obj):
         if name == 'None':
@@ -140,6 +147,20 @@ def _object_attributes(obj, parent):
     return attributes
 
 
+def _stub_attributes(stub, parent):
+    attributes = {}
+    for name, child in stub.get_attributes().iteritems():
+        if child.kind == 'class':
+            pyobject = BuiltinClass(child, {}, parent=parent)
+        elif child.kind == 'function':
+            pyobject = BuiltinFunction(builtin=child, argnames=child.argnames,
+                                       parent=parent)
+        else:
+            pyobject = BuiltinUnknown(builtin=child)
+        attributes[name] = BuiltinName(pyobject)
+    return attributes
+
+
 def _create_builtin_type_getter(cls):
     def _get_builtin(*args):
         if not hasattr(cls, '_generated'):
@@ -1,9 +1,9 @@
 import datetime
-import difflib
 import os
 import time
 import warnings
 
+import rope.base.codeanalyze
 import rope.base.fscommands
 from rope.base import taskhandle, exceptions, utils
 
@@ -167,10 +167,9 @@ class ChangeContents(Change):
                 old = self.resource.read()
             else:
                 old = ''
-        result = difflib.unified_diff(
-            old.splitlines(True), new.splitlines(True),
-            'a/' + self.resource.path, 'b/' + self.resource.path)
-        return ''.join(list(result))
+        diff = rope.base.codeanalyze.LineDiff(old, new)
+        return ''.join(diff.unified_diff('a/' + self.resource.path,
+                                         'b/' + self.resource.path))
 
     def get_changed_resources(self):
         return [self.resource]
@@ -321,6 +320,8 @@ class _ResourceOperations(object):
         self.direct_commands = rope.base.fscommands.FileSystemCommands()
 
     def _get_fscommands(self, resource):
+        if self.project.overlay is not None:
+            return self.project.overlay
         if self.project.is_ignored(resource):
             return self.direct_commands
         return self.fscommands
@@ -354,10 +355,10 @@ class _ResourceOperations(object):
 
     def _create_resource(self, file_name, kind='file'):
         resource_path = self.project._get_resource_path(file_name)
-        if os.path.exists(resource_path):
+        resource = self.project.get_file(file_name)
+        if resource.exists():
             raise exceptions.RopeError('Resource <%s> already exists'
                                        % resource_path)
-        resource = self.project.get_file(file_name)
         if not resource.parent.exists():
             raise exceptions.ResourceNotFoundError(
                 'Parent folder of <%s> does not exist' % resource.path)
@@ -372,8 +373,7 @@ class _ResourceOperations(object):
 
 
 def _get_destination_for_move(resource, destination):
-    dest_path = resource.project._get_resource_path(destination)
-    if os.path.isdir(dest_path):
+    if resource.project._get_kind(destination) == 'folder':
         if destination != '':
             return destination + '/' + resource.name
         else:
@@ -1,8 +1,12 @@
+import array
 import bisect
+import difflib
 import re
 import token
 import tokenize
 
+from rope.base import utils
+
 
 class ChangeCollector(object):
 
@@ -16,46 +20,77 @@ class ChangeCollector(object):
         self.changes.append((start, end, new_text))
 
     def get_changed(self):
-        if not self.changes:
+        """Return the changed text or `None` if nothing has changed"""
+        changed = self._sort_changes()
+        if not changed:
+            return None
+        result = ''.join(self.get_changed_chunks())
+        if changed is _OVERLAPPING and result == self.text:
             return None
-        def compare_changes(change1, change2):
-            return cmp(change1[:2], change2[:2])
-        self.changes.sort(compare_changes)
-        pieces = []
+        return result
+
+    def get_changed_chunks(self):
+        """Generate the pieces of the changed text in order
+
+        Joining the chunks gives the changed text; they can be written
+        out without building the whole text in memory.  Unlike
+        `get_changed()`, the original text is generated when nothing
+        has changed.
+        """
+        self._sort_changes()
+        text = self.text
         last_changed = 0
-        for change in self.changes:
-            start, end, text = change
-            pieces.append(self.text[last_changed:start] + text)
+        for start, end, new_text in self.changes:
+            if last_changed < start:
+                yield text[last_changed:start]
+            if new_text:
+                yield new_text
             last_changed = end
-        if last_changed < len(self.text):
-            pieces.append(self.text[last_changed:])
-        result = ''.join(pieces)
-        if result != self.text:
-            return result
+        if last_changed < len(text):
+            yield text[last_changed:]
+
+    def _sort_changes(self):
+        """Sort the changes and tell whether they change the text
+
+        Overlapping changes are allowed; the later change is inserted
+        after the text of the former.  Since they might still produce
+        the original text, `_OVERLAPPING` is returned for them.
+        """
+        self.changes.sort(key=_change_region)
+        result = False
+        last_end = 0
+        for start, end, new_text in self.changes:
+            if start < last_end:
+                return _OVERLAPPING
+            last_end = end
+            if not result and (end - start != len(new_text) or
+                               self.text[start:end] != new_text):
+                result = True
+        return result
+
+
+_OVERLAPPING = object()
+
+def _change_region(change):
+    return change[0], change[1]
 
 
 class SourceLinesAdapter(object):
     """Adapts source to Lines interface
 
-    Note: The creation of this class is expensive.
+    Line starts are computed on first use and shared between adapters
+    created for the same source.
     """
 
     def __init__(self, source_code):
         self.code = source_code
-        self.starts = None
-        self._initialize_line_starts()
+        self._starts = None
 
-    def _initialize_line_starts(self):
-        self.starts = []
-        self.starts.append(0)
-        try:
-            i = 0
-            while True:
-                i = self.code.index('\n', i) + 1
-                self.starts.append(i)
-        except ValueError:
-            pass
-        self.starts.append(len(self.code) + 1)
+    @property
+    def starts(self):
+        if self._starts is None:
+            self._starts = _line_starts(self.code)
+        return self._starts
 
     def get_line(self, lineno):
         return self.code[self.starts[lineno - 1]:
@@ -74,6 +109,76 @@ class SourceLinesAdapter(object):
         return self.starts[lineno] - 1
 
 
+@utils.lru_cached(7)
+def _line_starts(code):
+    starts = array.array('l', [0])
+    starts.extend([match.end() for match in _newline.finditer(code)])
+    starts.append(len(code) + 1)
+    return starts
+
+_newline = re.compile('\n')
+
+
+class LineDiff(object):
+    """Compares the lines of two texts
+
+    Unlike `difflib.Differ` it does not look for similar lines in
+    changed blocks, which is slow for large texts.
+    """
+
+    def __init__(self, old, new):
+        self.old_lines = old.splitlines(True)
+        self.new_lines = new.splitlines(True)
+        self.matcher = difflib.SequenceMatcher(None, self.old_lines,
+                                               self.new_lines)
+
+    def get_changed_ranges(self):
+        """Return the ``(start, end)`` ranges of changed old lines
+
+        These are the lines of the old text that are replaced or
+        removed.  Line numbers start from 1 and the ranges are
+        inclusive.
+        """
+        return [(i1 + 1, i2)
+                for tag, i1, i2, j1, j2 in self.matcher.get_opcodes()
+                if tag in ('replace', 'delete')]
+
+    def unified_diff(self, fromfile='', tofile='', n=3):
+        """Generate the lines of a unified diff
+
+        The result is the same as `difflib.unified_diff()`.
+        """
+        started = False
+        for group in self.matcher.get_grouped_opcodes(n):
+            if not started:
+                started = True
+                yield '--- %s\n' % fromfile
+                yield '+++ %s\n' % tofile
+            first, last = group[0], group[-1]
+            yield '@@ -%s +%s @@\n' % (_unified_range(first[1], last[2]),
+                                       _unified_range(first[3], last[4]))
+            for tag, i1, i2, j1, j2 in group:
+                if tag == 'equal':
+                    for line in self.old_lines[i1:i2]:
+                        yield ' ' + line
+                    continue
+                if tag in ('replace', 'delete'):
+                    for line in self.old_lines[i1:i2]:
+                        yield '-' + line
+                if tag in ('replace', 'insert'):
+                    for line in self.new_lines[j1:j2]:
+                        yield '+' + line
+
+
+def _unified_range(start, stop):
+    length = stop - start
+    if length == 1:
+        return '%s' % (start + 1)
+    if not length:
+        return '%s,0' % start
+    return '%s,%s' % (start + 1, length)
+
+
 class ArrayLinesAdapter(object):
 
     def __init__(self, lines):
@@ -41,6 +41,9 @@ def set_prefs(prefs):
 
     # If `True`, rope analyzes each module when it is being saved.
     prefs['automatic_soa'] = True
+    # If `True`, automatic SOA is performed in a background thread;
+    # see `PyCore.get_soa_scheduler()`.
+    prefs['background_soa'] = False
     # The depth of calls to follow in static object analysis
     prefs['soa_followed_calls'] = 0
 
@@ -51,6 +54,12 @@ def set_prefs(prefs):
     # Rope can check the validity of its object DB when running.
     prefs['validate_objectdb'] = True
 
+    # If `True`, objects inferred for names are cached and are not
+    # inferred again after changing modules they do not depend on.
+    prefs['cache_inferred_objects'] = True
+    # Should rope save the cached inferred objects or not.
+    prefs['save_inferred_objects'] = False
+
     # How many undos to hold?
     prefs['max_history_items'] = 32
 
@@ -70,6 +79,15 @@ def set_prefs(prefs):
     # Add all standard c-extensions to extension_modules list.
     prefs['import_dynload_stdmods'] = True
 
+    # If `True`, extension modules are inspected in a separate process
+    # and the results are saved in the rope folder, instead of
+    # importing them in rope's process.
+    prefs['extension_stubs'] = True
+
+    # If `True`, a single process is kept running for inspecting
+    # extension modules.
+    prefs['introspection_server'] = False
+
     # If `True` modules with syntax errors are considered to be empty.
     # The default value is `False`; When `False` syntax errors raise
     # `rope.base.exceptions.ModuleSyntaxError` exception.
@@ -45,6 +45,13 @@ def eval_str2(holding_scope, name):
 
 
 class ScopeNameFinder(object):
+    """Find the pynames at offsets of a module
+
+    The same expressions are often used many times in a scope (like
+    ``self.pycore``).  The results of evaluating them are kept in the
+    module and are forgotten with its concluded data.
+
+    """
 
     def __init__(self, pymodule):
         self.module_scope = pymodule.get_scope()
@@ -105,7 +112,16 @@ class ScopeNameFinder(object):
             name = self.worder.get_from_aliased(offset)
         else:
             name = self.worder.get_primary_at(offset)
-        return eval_str2(holding_scope, name)
+        return self._eval_str2(holding_scope, name)
+
+    def _eval_str2(self, holding_scope, name):
+        evaluations = self.module_scope.pyobject._evaluations
+        if evaluations.get() is None:
+            evaluations.set({})
+        key = (holding_scope, name)
+        if key not in evaluations.get():
+            evaluations.get()[key] = eval_str2(holding_scope, name)
+        return evaluations.get()[key]
 
     def get_enclosing_function(self, offset):
         function_parens = self.worder.find_parens_start_from_inside(offset)
@@ -0,0 +1,260 @@
+"""A graph of the imports of the modules of a project
+
+`ImportGraph` knows which modules of a project import which others.
+The names imported by each module (including the imports inside
+functions and classes) are found by parsing it once; they are saved
+in the rope folder and are found again only for modules that change.
+Imported names are resolved to modules when the graph is used.  A
+package is represented by its ``__init__.py`` file.
+
+"""
+from rope.base import ast, exceptions, resourceobserver
+
+
+class ImportGraph(object):
+    """The imports of the python files of a project"""
+
+    def __init__(self, pycore):
+        self.pycore = pycore
+        self.project = pycore.project
+        self._names = None
+        self._changed = False
+        self._resolved = {}
+        self._imports = None
+        self._importers = None
+        self._indicator = resourceobserver.ChangeIndicator()
+        observer = resourceobserver.ResourceObserver(
+            changed=self._resource_changed, moved=self._resource_moved,
+            created=self._resource_moved, removed=self._resource_moved)
+        self.project.add_observer(observer)
+        self.project.data_files.add_write_hook(self.write)
+
+    def get_imports(self, resource):
+        """Return the modules `resource` imports"""
+        self._update()
+        return _sorted(self._imports.get(resource, []))
+
+    def get_importers(self, resource):
+        """Return the modules that import `resource`"""
+        self._update()
+        return _sorted(self._importers.get(self._module(resource), []))
+
+    def get_transitive_imports(self, resource):
+        """Return the modules `resource` imports directly or indirectly"""
+        self._update()
+        return self._closure(self._imports, [resource])
+
+    def get_transitive_importers(self, resource):
+        """Return the modules that import `resource` directly or not"""
+        self._update()
+        return self._closure(self._importers, [self._module(resource)])
+
+    def get_used_modules(self, resource):
+        """Return the modules module `resource` might use
+
+        These are the module itself, the modules it imports directly
+        or indirectly and the child modules of imported packages
+        (which are attributes of these packages).
+        """
+        self._update()
+        result = set()
+        stack = [self._module(resource)]
+        while stack:
+            module = stack.pop()
+            if module in result:
+                continue
+            result.add(module)
+            stack.extend(self._imports.get(module, []))
+            if module.name == '__init__.py':
+                stack.extend(self._child_modules(module.parent))
+        return _sorted(result)
+
+    def get_distances(self, resource):
+        """Return a dict of modules to their distance from `resource`
+
+        The distance of two modules is the number of imports between
+        them, ignoring the direction of the imports.  Modules that
+        are not connected to `resource` are not included.
+        """
+        self._update()
+        module = self._module(resource)
+        result = {module: 0}
+        current = [module]
+        while current:
+            found = []
+            for module in current:
+                for neighbor in self._imports.get(module, set()) | \
+                                self._importers.get(module, set()):
+                    if neighbor not in result:
+                        result[neighbor] = result[module] + 1
+                        found.append(neighbor)
+            current = found
+        return result
+
+    def _child_modules(self, folder):
+        result = []
+        for child in folder.get_children():
+            if child.is_folder():
+                if child.has_child('__init__.py'):
+                    result.append(child.get_child('__init__.py'))
+            elif self.pycore.is_python_file(child):
+                result.append(child)
+        return result
+
+    def get_dependents(self, resource):
+        """Return the modules that might use module `resource`
+
+        These are the module itself and the modules that import
+        `resource` or its parent packages, directly or through other
+        modules.  Modules with syntax errors are always included.  For
+        modules outside the project all python files are returned.
+        """
+        if resource.project != self.project:
+            return self.pycore.get_python_files()
+        self._update()
+        modules = [self._module(resource)]
+        folder = resource.parent
+        while folder.path != '' and folder.has_child('__init__.py'):
+            modules.append(folder.get_child('__init__.py'))
+            folder = folder.parent
+        result = set(self._closure(self._importers, modules))
+        result.add(modules[0])
+        for path, (indicator, names) in self._names.iteritems():
+            if names is None:
+                result.add(self.project.get_file(path))
+        return _sorted(result)
+
+    def _module(self, resource):
+        if resource.is_folder() and resource.has_child('__init__.py'):
+            return resource.get_child('__init__.py')
+        return resource
+
+    def _closure(self, graph, resources):
+        result = set()
+        stack = list(resources)
+        while stack:
+            resource = stack.pop()
+            for child in graph.get(resource, []):
+                if child not in result:
+                    result.add(child)
+                    stack.append(child)
+        return _sorted(result)
+
+    def _update(self):
+        if self._names is None:
+            self._names = self.project.data_files.read_data(
+                'importgraph', compress=True)
+            if self._names is None:
+                self._names = {}
+        names = {}
+        for resource in self.pycore.get_python_files():
+            indicator = self._indicator.get_indicator(resource)
+            old = self._names.get(resource.path)
+            if old is not None and old[0] == indicator:
+                names[resource.path] = old
+            else:
+                names[resource.path] = (indicator,
+                                        _imported_names(resource))
+                self._imports = None
+        if len(names) != len(self._names):
+            self._imports = None
+        if self._names != names:
+            self._changed = True
+            self._names = names
+        if self._imports is None:
+            self._make_graph()
+
+    def _make_graph(self):
+        self._imports = {}
+        self._importers = {}
+        for path, (indicator, names) in self._names.iteritems():
+            resource = self.project.get_file(path)
+            imported = set()
+            for name, level in names or []:
+                module = self._resolve(resource.parent, name, level)
+                if module is not None and module != resource:
+                    imported.add(module)
+            self._imports[resource] = imported
+            for module in imported:
+                self._importers.setdefault(module, set()).add(resource)
+
+    def _resolve(self, folder, name, level):
+        key = (folder.path, name, level)
+        if key not in self._resolved:
+            self._resolved[key] = None
+            try:
+                if level:
+                    module = self.pycore.find_relative_module(
+                        name, folder, level)
+                else:
+                    module = self.pycore.find_module(name, folder)
+            except exceptions.ResourceNotFoundError:
+                module = None
+            if module is not None and module.project == self.project:
+                module = self._module(module)
+                if not module.is_folder():
+                    self._resolved[key] = module.path
+        path = self._resolved[key]
+        if path is not None:
+            return self.project.get_file(path)
+
+    def _resource_changed(self, resource):
+        if self._names is not None:
+            self._names.pop(resource.path, None)
+        self._imports = None
+
+    def _resource_moved(self, resource, new_resource=None):
+        self._resolved.clear()
+        self._imports = None
+
+    def write(self):
+        if self._changed:
+            self.project.data_files.write_data('importgraph', self._names,
+                                               compress=True)
+            self._changed = False
+
+
+def _sorted(resources):
+    return sorted(resources, key=lambda resource: resource.path)
+
+
+def _imported_names(resource):
+    """Return ``(name, level)`` tuples of the modules `resource` imports
+
+    Returns `None` if it has syntax errors.
+    """
+    try:
+        node = ast.parse(resource.read())
+    except (SyntaxError, exceptions.RopeError):
+        return None
+    visitor = _ImportedNamesVisitor()
+    ast.walk(node, visitor)
+    return sorted(visitor.names)
+
+
+class _ImportedNamesVisitor(object):
+
+    def __init__(self):
+        self.names = set()
+
+    def _Import(self, node):
+        for alias in node.names:
+            self._add(alias.name, 0)
+
+    def _ImportFrom(self, node):
+        level = node.level or 0
+        if node.module:
+            self._add(node.module, level)
+        else:
+            self.names.add(('', level))
+        for alias in node.names:
+            if alias.name != '*':
+                name = alias.name
+                if node.module:
+                    name = node.module + '.' + name
+                self.names.add((name, level))
+
+    def _add(self, name, level):
+        tokens = name.split('.')
+        for index in range(len(tokens)):
+            self.names.add(('.'.join(tokens[:index + 1]), level))
@@ -1,6 +1,7 @@
 """A few useful functions for using rope as a library"""
 import os.path
 
+import rope.base.oi.parallelsoa
 import rope.base.project
 import rope.base.pycore
 from rope.base import taskhandle
@@ -52,14 +53,14 @@ def report_change(project, path, old_content):
         rope.base.pycore.perform_soa_on_changed_scopes(project, resource,
                                                        old_content)
 
-def analyze_modules(project, task_handle=taskhandle.NullTaskHandle()):
+def analyze_modules(project, task_handle=taskhandle.NullTaskHandle(),
+                    processes=1):
     """Perform static object analysis on all python files in the project
 
-    Note that this might be really time consuming.
+    Note that this might be really time consuming.  If `processes` is
+    more than one, modules are analyzed in that many processes.
     """
     resources = project.pycore.get_python_files()
     job_set = task_handle.create_jobset('Analyzing Modules', len(resources))
-    for resource in resources:
-        job_set.started_job(resource.path)
-        project.pycore.analyze_module(resource)
-        job_set.finished_job()
+    rope.base.oi.parallelsoa.analyze_modules(project.pycore, resources,
+                                             job_set, processes)
@@ -0,0 +1,267 @@
+"""A cache of inferred objects that survives unrelated changes
+
+The objects inferred for names are kept in the concluded data of
+modules, which is forgotten whenever a module changes.
+`InferenceCache` keeps the objects inferred for assigned names in
+textual form (see `rope.base.oi.transform`) with the versions of
+what their inference depended on:
+
+* the change indicators of the module of the name and of the
+  modules it might use (see `ImportGraph.get_used_modules()`), and
+  of the modules of the objects read from the objectdb; with the
+  number of changes reported for them, since modification times
+  might not change after quick edits
+* the hashes of what was read from the objectdb
+* the python files and source folders of the project
+
+These are recorded while inferring a name; names inferred in the
+process add their versions, too.  So the cached objects of a
+module are used again after changing modules it does not use.  If
+``save_inferred_objects`` project config is set, they are saved in
+the rope folder, too.
+
+Only the names of cached modules (not `PyCore.get_string_module()`
+ones) are cached.  The local names of functions are not cached,
+since their objects can depend on the arguments of a call.
+
+"""
+from rope.base import resourceobserver
+
+
+class InferenceCache(object):
+    """Textual objects inferred for the assigned names of a project"""
+
+    def __init__(self, pycore):
+        self.pycore = pycore
+        self.project = pycore.project
+        self.object_info = pycore.object_info
+        self._entries = None
+        self._changed = False
+        self._layout = None
+        self._current_layout = None
+        self._recordings = []
+        self._indicators = {}
+        self._change_counts = {}
+        self._versions = {}
+        self._used_modules = {}
+        self._interned = {}
+        self._indicator = resourceobserver.ChangeIndicator()
+        observer = resourceobserver.ResourceObserver(
+            changed=self._resource_changed, moved=self._resource_moved,
+            created=self._resource_moved, removed=self._resource_moved)
+        self.project.add_observer(observer)
+        self.object_info.objectdb.add_read_observer(self._objectdb_read)
+        self.project.data_files.add_write_hook(self.write)
+
+    def get_assigned_object(self, pyname, infer):
+        """Return the object `infer(pyname)` infers for `pyname`"""
+        key = self._get_key(pyname)
+        if key is None:
+            return infer(pyname)
+        entries = self._get_entries()
+        if key in entries:
+            textual, versions = entries[key]
+            if self._is_valid(versions):
+                result = self.object_info.to_pyobject(textual)
+                if result is not None:
+                    self._add_used(*versions)
+                    return result
+            del entries[key]
+            self._changed = True
+        self._recordings.append((set(), {}))
+        try:
+            result = infer(pyname)
+        finally:
+            modules, reads = self._recordings.pop()
+        modules.add(key[1])
+        used = self._get_used_modules(modules)
+        self._add_used(used, reads=reads)
+        if result is not None:
+            self._save(key, result, used, reads)
+        return result
+
+    def _get_key(self, pyname):
+        pymodule = pyname.module
+        resource = pymodule.get_resource()
+        if resource is None or \
+           self.pycore.module_cache.module_map.get(resource) is not pymodule:
+            return None
+        assignments = []
+        for assignment in pyname.assignments:
+            node = assignment.ast_node
+            lineno = getattr(node, 'lineno', None)
+            if lineno is None:
+                return None
+            assignments.append((lineno, getattr(node, 'col_offset', None),
+                                tuple(assignment.levels),
+                                assignment.evaluation,
+                                assignment.assign_type))
+        scope = pymodule.get_scope().get_inner_scope_for_line(
+            assignments[0][0])
+        if scope.get_kind() == 'Function' and \
+           pyname in scope.get_names().values():
+            return None
+        return ('assigned', self._module_path(resource), tuple(assignments))
+
+    def _save(self, key, result, used, reads):
+        textual = self.object_info.to_textual(result)
+        if not _is_exact(textual):
+            return
+        restored = self.object_info.to_pyobject(textual)
+        if restored is None or type(restored) != type(result) or \
+           type(restored.get_type()) != type(result.get_type()):
+            return
+        version = self._get_version(used)
+        if version is not None:
+            reads = tuple(sorted(reads.items()))
+            self._get_entries()[key] = (textual, (used, version, reads))
+            self._changed = True
+
+    def _is_valid(self, versions):
+        used, version, reads = versions
+        if self._get_version(used) != version:
+            return False
+        objectdb = self.object_info.objectdb
+        for query, data_hash in reads:
+            if hash(objectdb.get_data(query)) != data_hash:
+                return False
+        return True
+
+    def _add_used(self, used, version=None, reads=()):
+        if self._recordings:
+            modules, recorded = self._recordings[-1]
+            modules.update(used)
+            recorded.update(reads)
+
+    def _objectdb_read(self, query):
+        if not self._recordings:
+            return
+        modules, reads = self._recordings[-1]
+        data = self.object_info.objectdb.get_data(query)
+        reads[query] = hash(data)
+        modules.add(query[1])
+        _add_defined_paths(data, modules)
+
+    def _get_used_modules(self, paths):
+        """Return a frozenset of the paths of modules `paths` use"""
+        result = set()
+        for path in paths:
+            if path not in self._used_modules:
+                used = None
+                resource = self._path_to_resource(path)
+                if resource is not None:
+                    graph = self.pycore.import_graph
+                    used = [self._module_path(module) for module in
+                            graph.get_used_modules(resource)]
+                self._used_modules[path] = used
+            if self._used_modules[path] is not None:
+                result.update(self._used_modules[path])
+        result = frozenset(result)
+        return self._interned.setdefault(result, result)
+
+    def _get_version(self, paths):
+        """Return a hash of the indicators of modules in `paths`
+
+        The number of changes reported for each module is included.
+        Returns `None` if some of them are changed in the project
+        overlay, whose indicators are not kept after removing it.
+        """
+        if paths not in self._versions:
+            indicators = []
+            for path in sorted(paths):
+                if path not in self._indicators:
+                    self._indicators[path] = self._get_indicator(path)
+                indicators.append((self._indicators[path],
+                                   self._change_counts.get(path, 0)))
+            version = hash(tuple(indicators))
+            for indicator, count in indicators:
+                if indicator is not None and indicator[0] == 'overlay':
+                    version = None
+            self._versions[paths] = version
+        return self._versions[paths]
+
+    def _get_indicator(self, path):
+        resource = self._path_to_resource(path)
+        if resource is not None:
+            try:
+                return self._indicator.get_indicator(resource)
+            except OSError:
+                pass
+
+    def _path_to_resource(self, path):
+        resource = self.object_info.to_pyobject.path_to_resource(path)
+        if resource is not None and resource.project == self.project:
+            return resource
+
+    def _module_path(self, resource):
+        if resource.is_folder() and resource.has_child('__init__.py'):
+            resource = resource.get_child('__init__.py')
+        return self.object_info.to_textual.resource_to_path(resource)
+
+    def _get_entries(self):
+        if self._entries is None:
+            data = None
+            if self._persist:
+                data = self.project.data_files.read_data('inferred',
+                                                         compress=True)
+            self._entries = {}
+            if data is not None:
+                self._layout, self._entries = data
+        if self._current_layout is None:
+            self._current_layout = self._get_layout()
+        if self._layout != self._current_layout:
+            self._layout = self._current_layout
+            self._entries.clear()
+        return self._entries
+
+    def _get_layout(self):
+        """Return a hash of the files that can change imported modules"""
+        paths = [resource.path
+                 for resource in self.pycore.get_python_files()]
+        folders = [folder.path
+                   for folder in self.pycore.get_source_folders()]
+        return hash((tuple(sorted(paths)), tuple(sorted(folders)),
+                     tuple(self.project.prefs.get('python_path', []))))
+
+    def _resource_changed(self, resource):
+        self._indicators.pop(resource.path, None)
+        self._change_counts[resource.path] = \
+            self._change_counts.get(resource.path, 0) + 1
+        self._versions.clear()
+        self._used_modules.clear()
+
+    def _resource_moved(self, resource, new_resource=None):
+        self._resource_changed(resource)
+        if new_resource is not None:
+            self._resource_changed(new_resource)
+        self._current_layout = None
+
+    def write(self):
+        if self._changed and self._persist and self._entries is not None:
+            self.project.data_files.write_data(
+                'inferred', (self._layout, self._entries), compress=True)
+            self._changed = False
+
+    @property
+    def _persist(self):
+        return self.project.prefs.get('save_inferred_objects', False)
+
+
+def _is_exact(textual):
+    """Return `False` if `textual` has unknown parts"""
+    if textual[0] == 'unknown':
+        return False
+    for part in textual[1:]:
+        if isinstance(part, tuple) and not _is_exact(part):
+            return False
+    return True
+
+
+def _add_defined_paths(textual, paths):
+    """Add the paths of the modules of objects in `textual`"""
+    if isinstance(textual, (tuple, frozenset)):
+        if len(textual) > 1 and isinstance(textual, tuple) and \
+           textual[0] == 'defined':
+            paths.add(textual[1])
+        for part in textual:
+            _add_defined_paths(part, paths)
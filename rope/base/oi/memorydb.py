@@ -39,6 +39,12 @@ class MemoryDB(objectdb.FileDict):
     def __delitem__(self, file):
         del self._files[file]
 
+    def snapshot(self):
+        return self._files
+
+    def restore(self, snapshot):
+        self._files = snapshot
+
     def write(self):
         if self.persist:
             self.project.data_files.write_data('objectdb', self._files,
@@ -7,6 +7,7 @@ class ObjectDB(object):
         self.db = db
         self.validation = validation
         self.observers = []
+        self.read_observers = []
         self.files = db.files
 
     def validate_files(self):
@@ -33,21 +34,41 @@ class ObjectDB(object):
         return self.files.keys()
 
     def get_returned(self, path, key, args):
+        self._read(('returned', path, key, args))
         scope_info = self._get_scope_info(path, key, readonly=True)
         result = scope_info.get_returned(args)
         if self.validation.is_value_valid(result):
             return result
 
     def get_pername(self, path, key, name):
+        self._read(('pername', path, key, name))
         scope_info = self._get_scope_info(path, key, readonly=True)
         result = scope_info.get_per_name(name)
         if self.validation.is_value_valid(result):
             return result
 
     def get_callinfos(self, path, key):
+        self._read(('callinfos', path, key))
         scope_info = self._get_scope_info(path, key, readonly=True)
         return scope_info.get_call_infos()
 
+    def get_data(self, query):
+        """Return the data read for `query` as a hashable object
+
+        `query` is what read observers receive: a
+        ``('returned', path, key, args)``, ``('pername', path, key,
+        name)`` or ``('callinfos', path, key)`` tuple.
+        """
+        kind, path, key = query[:3]
+        scope_info = self._get_scope_info(path, key, readonly=True)
+        if kind == 'returned':
+            return scope_info.get_returned(query[3])
+        if kind == 'pername':
+            return scope_info.get_per_name(query[3])
+        return frozenset([(call_info.get_parameters(),
+                           call_info.get_returned())
+                          for call_info in scope_info.get_call_infos()])
+
     def add_callinfo(self, path, key, args, returned):
         scope_info = self._get_scope_info(path, key, readonly=False)
         old_returned = scope_info.get_returned(args)
@@ -60,9 +81,31 @@ class ObjectDB(object):
         if self.validation.is_more_valid(value, old_value):
             scope_info.save_per_name(name, value)
 
+    def snapshot(self):
+        """Return a picklable snapshot of the information of this db
+
+        It can be passed to `restore()` of another `ObjectDB`, for
+        instance in another process.  It should not be modified.
+        """
+        return self.db.snapshot()
+
+    def restore(self, snapshot):
+        """Replace the information of this db with `snapshot`"""
+        old_files = set(self.files.keys())
+        self.db.restore(snapshot)
+        new_files = set(self.files.keys())
+        for path in old_files - new_files:
+            self._file_removed(path)
+        for path in new_files - old_files:
+            self._file_added(path)
+
     def add_file_list_observer(self, observer):
         self.observers.append(observer)
 
+    def add_read_observer(self, observer):
+        """Call `observer` with a query for each read; see `get_data()`"""
+        self.read_observers.append(observer)
+
     def write(self):
         self.db.write()
 
@@ -81,6 +124,10 @@ class ObjectDB(object):
             print self.files, self.files[path], self.files[path][key]
         return result
 
+    def _read(self, query):
+        for observer in self.read_observers:
+            observer(query)
+
     def _file_removed(self, path):
         for observer in self.observers:
             observer.removed(path)
@@ -134,6 +181,12 @@ class FileDict(UserDict.DictMixin):
     def rename(self, key, new_key):
         pass
 
+    def snapshot(self):
+        pass
+
+    def restore(self, snapshot):
+        pass
+
 
 class ScopeInfo(object):
 
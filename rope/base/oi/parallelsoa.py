@@ -0,0 +1,169 @@
+"""Static object analysis of many modules
+
+`analyze_modules()` analyzes modules either in the current process or
+in a pool of worker processes.  Each worker opens its own project with
+a snapshot of the objectdb and sends back the object information it
+collects, which is then merged into the objectdb of the main project.
+See `rope.base.parallel`.
+
+"""
+from rope.base import ast, exceptions, parallel
+from rope.base.oi import objectdb
+
+
+def analyze_modules(pycore, resources, job_set, processes=1):
+    """Perform static object analysis on `resources`
+
+    If `processes` is more than one, modules are analyzed in that many
+    worker processes.  Otherwise, when ``soa_followed_calls`` project
+    config is set, modules are analyzed in `callers_first()` order.
+    Workers analyze modules with the object information collected
+    before the analysis started, so the order of modules does not
+    matter for them.
+
+    """
+    if processes is None or processes <= 1 or len(resources) < 2:
+        if pycore.project.prefs.get('soa_followed_calls', 0):
+            resources = callers_first(pycore, resources)
+        for resource in resources:
+            job_set.started_job(resource.path)
+            pycore.analyze_module(resource)
+            job_set.finished_job()
+        return
+    project = pycore.project
+    results = parallel.imap_unordered(
+        project, processes, _analyze_in_worker,
+        [(resource.path,) for resource in resources],
+        _init_worker)
+    try:
+        for path, records in results:
+            job_set.started_job(path)
+            if records is None:
+                # analyzing again to raise the same errors
+                pycore.analyze_module(project.get_resource(path))
+            else:
+                _merge_records(pycore.object_info.objectdb, records)
+            job_set.finished_job()
+    finally:
+        results.close()
+        pycore.module_cache.forget_all_data()
+
+
+def callers_first(pycore, resources):
+    """Sort `resources` so that modules come before the ones they import
+
+    Modules in import cycles are ordered arbitrarily.
+    """
+    imports = {}
+    for resource in resources:
+        imports[resource] = _imported_modules(pycore, resource)
+    visited = set()
+    result = []
+    for resource in resources:
+        if resource in visited:
+            continue
+        visited.add(resource)
+        stack = [(resource, iter(imports[resource]))]
+        while stack:
+            current, children = stack[-1]
+            for child in children:
+                if child in imports and child not in visited:
+                    visited.add(child)
+                    stack.append((child, iter(imports[child])))
+                    break
+            else:
+                stack.pop()
+                result.append(current)
+    result.reverse()
+    return result
+
+
+def _imported_modules(pycore, resource):
+    try:
+        node = ast.parse(resource.read())
+    except (SyntaxError, exceptions.RopeError):
+        return []
+    visitor = _ImportsVisitor(pycore, resource.parent)
+    for child in ast.get_child_nodes(node):
+        ast.walk(child, visitor)
+    return visitor.imported
+
+
+class _ImportsVisitor(object):
+
+    def __init__(self, pycore, folder):
+        self.pycore = pycore
+        self.folder = folder
+        self.imported = []
+
+    def _Import(self, node):
+        for alias in node.names:
+            self._add(self.pycore.find_module(alias.name, self.folder))
+
+    def _ImportFrom(self, node):
+        if node.level:
+            module = self.pycore.find_relative_module(
+                node.module, self.folder, node.level)
+        else:
+            module = self.pycore.find_module(node.module, self.folder)
+        self._add(module)
+
+    def _FunctionDef(self, node):
+        for child in node.body:
+            ast.walk(child, self)
+
+    def _ClassDef(self, node):
+        for child in node.body:
+            ast.walk(child, self)
+
+    def _add(self, module):
+        if module is None:
+            return
+        if module.is_folder():
+            if not module.has_child('__init__.py'):
+                return
+            module = module.get_child('__init__.py')
+        self.imported.append(module)
+
+
+def _merge_records(db, records):
+    for kind, path, key, name, value in records:
+        if kind == 'callinfo':
+            db.add_callinfo(path, key, name, value)
+        else:
+            db.add_pername(path, key, name, value)
+
+
+class _RecordingObjectDB(objectdb.ObjectDB):
+    """An `ObjectDB` that records the information added to it"""
+
+    def __init__(self, db, validation):
+        super(_RecordingObjectDB, self).__init__(db, validation)
+        self.records = []
+
+    def add_callinfo(self, path, key, args, returned):
+        self.records.append(('callinfo', path, key, args, returned))
+        super(_RecordingObjectDB, self).add_callinfo(path, key,
+                                                     args, returned)
+
+    def add_pername(self, path, key, name, value):
+        self.records.append(('pername', path, key, name, value))
+        super(_RecordingObjectDB, self).add_pername(path, key, name, value)
+
+
+_objectdb = None
+
+def _init_worker(project):
+    global _objectdb
+    object_info = project.pycore.object_info
+    _objectdb = _RecordingObjectDB(object_info.objectdb.db,
+                                   object_info.validation)
+    object_info.objectdb = _objectdb
+
+def _analyze_in_worker(project, path):
+    _objectdb.records = []
+    try:
+        project.pycore.analyze_module(project.get_resource(path))
+    except exceptions.RopeError:
+        return path, None
+    return path, _objectdb.records
@@ -57,6 +57,14 @@ def _handle_first_parameter(pyobject, parameters):
 def infer_assigned_object(pyname):
     if not pyname.assignments:
         return
+    pycore = pyname.module.pycore
+    if pycore.project.prefs.get('cache_inferred_objects', True):
+        return pycore.inference_cache.get_assigned_object(
+            pyname, _infer_assigned_object)
+    return _infer_assigned_object(pyname)
+
+
+def _infer_assigned_object(pyname):
     for assignment in reversed(pyname.assignments):
         result = _infer_assignment(assignment, pyname.module)
         if result is not None:
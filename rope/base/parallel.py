@@ -0,0 +1,67 @@
+"""Running tasks on a project in worker processes
+
+Each worker process opens its own copy of the project, without a
+rope folder, when it starts and restores a snapshot of the objectdb
+of the project in it (see `ObjectDB.snapshot()`).  Tasks are
+module-level functions that are called with that project; their
+arguments and return values are pickled.
+
+"""
+import cPickle as pickle
+
+import rope.base.project
+
+
+def imap_unordered(project, processes, function, args_list,
+                   initializer=None, initargs=()):
+    """Generate ``function(worker_project, *args)`` for `args_list`
+
+    The tasks are run in `processes` worker processes and the results
+    are generated as they finish.  If `initializer` is given, each
+    worker calls ``initializer(worker_project, *initargs)`` after
+    opening its project.  The workers are terminated when the
+    generator finishes or is closed.
+
+    """
+    import multiprocessing
+    pool = multiprocessing.Pool(
+        processes, _init_worker,
+        (project.address, _picklable_prefs(project.prefs),
+         project.pycore.object_info.objectdb.snapshot(),
+         initializer, initargs))
+    try:
+        tasks = [(function, args) for args in args_list]
+        for result in pool.imap_unordered(_call_in_worker, tasks):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _picklable_prefs(prefs):
+    result = {}
+    for key, value in prefs.prefs.items():
+        try:
+            pickle.dumps(value, 2)
+        except Exception:
+            continue
+        result[key] = value
+    return result
+
+
+_project = None
+
+def _init_worker(address, prefs, snapshot, initializer, initargs):
+    global _project
+    prefs = dict(prefs)
+    prefs.update({'automatic_soa': False, 'automatic_soi': False,
+                  'validate_objectdb': False, 'save_objectdb': False,
+                  'save_history': False})
+    _project = rope.base.project.Project(address, ropefolder=None, **prefs)
+    _project.pycore.object_info.objectdb.restore(snapshot)
+    if initializer is not None:
+        initializer(_project, *initargs)
+
+def _call_in_worker(task):
+    function, args = task
+    return function(_project, *args)
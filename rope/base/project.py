@@ -1,7 +1,9 @@
 import cPickle as pickle
 import os
 import shutil
+import stat
 import sys
+import time
 import warnings
 
 import rope.base.fscommands
@@ -29,18 +31,31 @@ class _Project(object):
         get nonexistent `Resource`\s.
 
         """
-        path = self._get_resource_path(resource_name)
-        if not os.path.exists(path):
+        kind = self._get_kind(resource_name)
+        if kind is None:
             raise exceptions.ResourceNotFoundError(
                 'Resource <%s> does not exist' % resource_name)
-        elif os.path.isfile(path):
+        elif kind == 'file':
             return File(self, resource_name)
-        elif os.path.isdir(path):
+        elif kind == 'folder':
             return Folder(self, resource_name)
         else:
             raise exceptions.ResourceNotFoundError('Unknown resource '
                                                    + resource_name)
 
+    def _get_kind(self, resource_name):
+        """Return ``'file'``, ``'folder'``, ``'unknown'`` or `None`"""
+        if self.overlay is not None:
+            return self.overlay.get_kind(resource_name)
+        path = self._get_resource_path(resource_name)
+        if not os.path.exists(path):
+            return None
+        elif os.path.isfile(path):
+            return 'file'
+        elif os.path.isdir(path):
+            return 'folder'
+        return 'unknown'
+
     def validate(self, folder):
         """Validate files and folders contained in this folder
 
@@ -88,6 +103,9 @@ class _Project(object):
     def get_prefs(self):
         return self.prefs
 
+    # An `Overlay` for keeping changes in memory
+    overlay = None
+
     def _get_resource_path(self, name):
         pass
 
@@ -198,12 +216,17 @@ class Project(_Project):
         return self.ignored.does_match(resource)
 
     def sync(self):
-        """Closes project open resources"""
-        self.close()
+        """Write the data of the project in the rope folder"""
+        self.pycore.lock.acquire()
+        try:
+            self.data_files.write()
+        finally:
+            self.pycore.lock.release()
 
     def close(self):
         """Closes project open resources"""
-        self.data_files.write()
+        self.pycore.close()
+        self.sync()
 
     def set(self, key, value):
         """Set the `key` preference to `value`"""
@@ -258,6 +281,7 @@ class _FileListCacher(object):
     def __init__(self, project):
         self.project = project
         self.files = None
+        self.folders = {}
         rawobserver = ResourceObserver(
             self._changed, self._invalid, self._invalid,
             self._invalid, self._invalid)
@@ -266,15 +290,59 @@ class _FileListCacher(object):
     def get_files(self):
         if self.files is None:
             self.files = set()
-            self._add_files(self.project.root)
+            folders = None
+            if self.project.overlay is None:
+                folders = self.folders
+                self.folders = {}
+            self._add_files('', folders)
         return self.files
 
-    def _add_files(self, folder):
-        for child in folder.get_children():
-            if child.is_folder():
-                self._add_files(child)
-            elif not self.project.is_ignored(child):
-                self.files.add(child)
+    def _add_files(self, path, folders):
+        files, children = self._list_folder(path, folders)
+        prefix = path and path + '/'
+        ignored = self.project.ignored
+        for name in files:
+            child = prefix + name
+            if not ignored.does_match_path(child):
+                self.files.add(File(self.project, child))
+        for name in children:
+            child = prefix + name
+            if not ignored.does_match_path(child):
+                self._add_files(child, folders)
+
+    def _list_folder(self, path, folders):
+        """Return the names of files and folders in `path`
+
+        Symbolic links are ignored.  Listings are reused while the
+        modification time of the folder does not change.  If `folders`
+        is `None`, the project overlay is listed.
+        """
+        if folders is None:
+            return self.project.overlay.list_folder(path)
+        real_path = self.project._get_resource_path(path)
+        try:
+            mtime = os.stat(real_path).st_mtime
+        except OSError:
+            return [], []
+        if path in folders and folders[path][0] == mtime:
+            self.folders[path] = folders[path]
+            return folders[path][1:]
+        files = []
+        children = []
+        for name in os.listdir(real_path):
+            try:
+                mode = os.lstat(os.path.join(real_path, name)).st_mode
+            except OSError:
+                continue
+            if stat.S_ISREG(mode):
+                files.append(name)
+            elif stat.S_ISDIR(mode):
+                children.append(name)
+        # folders changed in the last few seconds can change again
+        # without changing their mtime
+        if time.time() - mtime > 2:
+            self.folders[path] = (mtime, files, children)
+        return files, children
 
     def _changed(self, resource):
         if resource.is_folder():
@@ -284,6 +352,143 @@ class _FileListCacher(object):
         self.files = None
 
 
+class Overlay(object):
+    """Changes to the resources of a project kept in memory
+
+    While `Project.overlay` is set, resources are created, changed,
+    moved and removed in the overlay instead of on disk (it replaces
+    `Project.fscommands`) and are read from it.  Removing the overlay
+    discards these changes.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.files = {}
+        self.folders = set()
+        self.removed = set()
+        self.versions = {}
+
+    def get_kind(self, path):
+        if path in self.files:
+            return 'file'
+        if path in self.folders:
+            return 'folder'
+        if self._is_removed(path):
+            return None
+        real_path = self.project._get_resource_path(path)
+        if os.path.isfile(real_path):
+            return 'file'
+        if os.path.isdir(real_path):
+            return 'folder'
+        if os.path.exists(real_path):
+            return 'unknown'
+
+    def read(self, path):
+        if path in self.files:
+            return self.files[path]
+        if self._is_removed(path):
+            raise IOError('Resource <%s> does not exist' % path)
+        return open(self.project._get_resource_path(path), 'rb').read()
+
+    def listdir(self, path):
+        result = set()
+        prefix = path and path + '/'
+        if not self._is_removed(path):
+            real_path = self.project._get_resource_path(path)
+            if os.path.isdir(real_path):
+                for name in os.listdir(real_path):
+                    if prefix + name not in self.removed:
+                        result.add(name)
+        for child in list(self.files) + list(self.folders):
+            if child.startswith(prefix) and '/' not in child[len(prefix):]:
+                result.add(child[len(prefix):])
+        return sorted(result)
+
+    def list_folder(self, path):
+        """Return the names of files and folders in `path`"""
+        files = []
+        folders = []
+        prefix = path and path + '/'
+        for name in self.listdir(path):
+            child = prefix + name
+            real_path = self.project._get_resource_path(child)
+            if child not in self.files and child not in self.folders and \
+               os.path.islink(real_path):
+                continue
+            kind = self.get_kind(child)
+            if kind == 'file':
+                files.append(name)
+            elif kind == 'folder':
+                folders.append(name)
+        return files, folders
+
+    def get_indicator(self, path):
+        """Return a change indicator if `path` is changed in memory"""
+        if path in self.versions:
+            return ('overlay', self.versions[path])
+
+    def _is_removed(self, path):
+        while True:
+            if path in self.removed:
+                return True
+            if not path:
+                return False
+            path = path.rpartition('/')[0]
+
+    # the `rope.base.fscommands` interface
+
+    def create_file(self, real_path):
+        self._write(self._path(real_path), '')
+
+    def create_folder(self, real_path):
+        path = self._path(real_path)
+        self.folders.add(path)
+        self._changed(path)
+
+    def move(self, real_path, new_real_path):
+        path = self._path(real_path)
+        new_path = self._path(new_real_path)
+        self._copy(path, new_path)
+        self._remove(path)
+
+    def remove(self, real_path):
+        self._remove(self._path(real_path))
+
+    def write(self, real_path, data):
+        self._write(self._path(real_path), data)
+
+    def _path(self, real_path):
+        path = real_path[len(self.project.address):].lstrip(os.path.sep)
+        return path.replace(os.path.sep, '/')
+
+    def _write(self, path, data):
+        self.files[path] = data
+        self._changed(path)
+
+    def _changed(self, path):
+        self.versions[path] = self.versions.get(path, 0) + 1
+
+    def _copy(self, path, new_path):
+        kind = self.get_kind(path)
+        if kind == 'file':
+            self._write(new_path, self.read(path))
+        elif kind == 'folder':
+            self.folders.add(new_path)
+            self._changed(new_path)
+            for name in self.listdir(path):
+                self._copy(path + '/' + name, new_path + '/' + name)
+
+    def _remove(self, path):
+        prefix = path + '/'
+        for child in list(self.files):
+            if child == path or child.startswith(prefix):
+                del self.files[child]
+        for child in list(self.folders):
+            if child == path or child.startswith(prefix):
+                self.folders.remove(child)
+        self.removed.add(path)
+
+
 class _DataFiles(object):
 
     def __init__(self, project):
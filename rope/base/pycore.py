@@ -1,12 +1,17 @@
 import bisect
-import difflib
+import functools
+import logging
 import sys
+import threading
+import time
 import warnings
 
 import rope.base.oi.doa
+import rope.base.oi.inferencecache
 import rope.base.oi.objectinfo
 import rope.base.oi.soa
-from rope.base import ast, exceptions, taskhandle, utils, stdmods
+from rope.base import (ast, codeanalyze, exceptions, taskhandle, utils,
+                       stdmods, stubs, importgraph)
 from rope.base.exceptions import ModuleNotFoundError
 from rope.base.pyobjectsdef import PyModule, PyPackage, PyClass
 import rope.base.resources
@@ -14,10 +19,24 @@ import rope.base.resourceobserver
 from rope.base import builtins
 
 
+def _locked(method):
+    """Call `method` while holding `PyCore.lock`"""
+    @functools.wraps(method)
+    def newmethod(self, *args, **kwds):
+        self.lock.acquire()
+        try:
+            return method(self, *args, **kwds)
+        finally:
+            self.lock.release()
+    return newmethod
+
+
 class PyCore(object):
 
     def __init__(self, project):
         self.project = project
+        self.lock = threading.RLock()
+        self._lookups = None
         self._init_resource_observer()
         self.cache_observers = []
         self.module_cache = _ModuleCache(self)
@@ -60,6 +79,25 @@ class PyCore(object):
         auto_soa = self.project.prefs.get('automatic_soi', None)
         return self.project.prefs.get('automatic_soa', auto_soa)
 
+    _soa_scheduler = None
+
+    def get_soa_scheduler(self):
+        """Return the `SOAScheduler` used if ``background_soa`` is set
+
+        A new scheduler is created after the previous one is stopped.
+        """
+        if self._soa_scheduler is None or self._soa_scheduler.is_stopped():
+            self._soa_scheduler = SOAScheduler(self)
+        return self._soa_scheduler
+
+    def close(self):
+        """Stop background SOA and the introspection server, if any"""
+        if self._soa_scheduler is not None:
+            self._soa_scheduler.stop()
+            self._soa_scheduler.join()
+        if self.extension_cache.stubs is not None:
+            self.extension_cache.stubs.close()
+
     def _file_changed_for_soa(self, resource, new_resource=None):
         old_contents = self.project.history.\
                        contents_before_current_change(resource)
@@ -102,6 +140,7 @@ class PyCore(object):
             raise ModuleNotFoundError('Module %s not found' % name)
         return self.resource_to_pyobject(module)
 
+    @_locked
     def get_string_module(self, code, resource=None, force_errors=False):
         """Returns a `PyObject` object for the given code
 
@@ -116,6 +155,7 @@ class PyCore(object):
         """Returns a `Scope` object for the given code"""
         return self.get_string_module(code, resource).get_scope()
 
+    @_locked
     def _invalidate_resource_cache(self, resource, new_resource=None):
         for observer in self.cache_observers:
             observer(resource)
@@ -152,9 +192,38 @@ class PyCore(object):
 
         returns None if it can not be found
         """
-        return self._find_module(modname, folder)
+        return self._lookup(self._find_module, modname, folder)
 
     def find_relative_module(self, modname, folder, level):
+        return self._lookup(self._find_relative_module,
+                            modname, folder, level)
+
+    def cache_module_lookups(self, enabled=True):
+        """Start or stop caching the modules and source folders found
+
+        When many modules are analyzed while the project does not
+        change (like when organizing the imports of a package), the
+        same modules are looked up over and over again.  While caching
+        is enabled, `find_module()`, `find_relative_module()` and
+        `get_source_folders()` remember their results; they are
+        forgotten when it is disabled.
+
+        """
+        if enabled:
+            if self._lookups is None:
+                self._lookups = {}
+        else:
+            self._lookups = None
+
+    def _lookup(self, function, *args):
+        if self._lookups is None:
+            return function(*args)
+        key = (function.__name__,) + args
+        if key not in self._lookups:
+            self._lookups[key] = function(*args)
+        return self._lookups[key]
+
+    def _find_relative_module(self, modname, folder, level):
         for i in range(level - 1):
             folder = folder.parent
         if modname == '':
@@ -183,14 +252,19 @@ class PyCore(object):
     #    packages, that is most of the time
     #  - We need a separate resource observer; `self.observer`
     #    does not get notified about module and folder creations
+    # They are cached only while `cache_module_lookups()` is enabled.
     def get_source_folders(self):
         """Returns project source folders"""
+        return list(self._lookup(self._get_source_folders))
+
+    def _get_source_folders(self):
         if self.project.root is None:
             return []
         result = list(self._custom_source_folders)
         result.extend(self._find_source_folders(self.project.root))
         return result
 
+    @_locked
     def resource_to_pyobject(self, resource, force_errors=False):
         return self.module_cache.get_pymodule(resource, force_errors)
 
@@ -237,6 +311,7 @@ class PyCore(object):
         runner.run()
         return runner
 
+    @_locked
     def analyze_module(self, resource, should_analyze=lambda py: True,
                        search_subscopes=lambda py: True, followed_calls=None):
         """Analyze `resource` module for static object inference
@@ -287,6 +362,18 @@ class PyCore(object):
             source_folder = source_folder.parent
         return module_name
 
+    @property
+    @utils.saveit
+    def import_graph(self):
+        """The `rope.base.importgraph.ImportGraph` of the project"""
+        return importgraph.ImportGraph(self)
+
+    @property
+    @utils.saveit
+    def inference_cache(self):
+        """The `rope.base.oi.inferencecache.InferenceCache` of the project"""
+        return rope.base.oi.inferencecache.InferenceCache(self)
+
     @property
     @utils.cacheit
     def extension_modules(self):
@@ -338,6 +425,7 @@ class _ExtensionCache(object):
     def __init__(self, pycore):
         self.pycore = pycore
         self.extensions = {}
+        self.stubs = None
 
     def get_pymodule(self, name):
         if name == '__builtin__':
@@ -347,9 +435,34 @@ class _ExtensionCache(object):
             self.extensions[name] = builtins.BuiltinModule(name, self.pycore)
         return self.extensions.get(name)
 
+    def get_stub(self, name):
+        """Return the `rope.base.stubs.Stub` of extension module `name`"""
+        return self.get_stubs([name])[name]
+
+    def get_stubs(self, names):
+        """Return a dict of extension module names to their stubs
+
+        The modules that are not described yet are described together.
+        """
+        if self.stubs is None:
+            self.stubs = stubs.StubCache(self.pycore.project)
+        return self.stubs.get_stubs(names)
+
 
 def perform_soa_on_changed_scopes(project, resource, old_contents):
+    """Analyze the scopes of `resource` changed since `old_contents`
+
+    If ``background_soa`` project config is set, the analysis is
+    scheduled using `PyCore.get_soa_scheduler()`.
+    """
     pycore = project.pycore
+    if project.prefs.get('background_soa', False):
+        pycore.get_soa_scheduler().add(resource, old_contents)
+    else:
+        _analyze_changed_scopes(pycore, resource, old_contents)
+
+
+def _analyze_changed_scopes(pycore, resource, old_contents):
     if resource.exists() and pycore.is_python_file(resource):
         try:
             new_contents = resource.read()
@@ -368,6 +481,136 @@ def perform_soa_on_changed_scopes(project, resource, old_contents):
             pass
 
 
+class SOAScheduler(object):
+    """Performs SOA on changed modules in a background thread
+
+    Repeated changes to a module are analyzed once and the most
+    recently changed module is analyzed first.  Stopping `task_handle`
+    cancels the remaining analyses.
+
+    Each analysis holds `PyCore.lock`, which `PyCore` holds while
+    creating, analyzing and invalidating modules, too.  Since rope
+    infers objects lazily, other threads that use the objects of the
+    project while the scheduler runs should hold it, too.
+
+    """
+
+    def __init__(self, pycore, task_handle=None):
+        self.pycore = pycore
+        if task_handle is None:
+            task_handle = taskhandle.TaskHandle('Background SOA')
+        self.task_handle = task_handle
+        self.task_handle.add_observer(self._task_changed)
+        self.condition = threading.Condition()
+        self.pending = {}
+        self.clock = 0
+        self.running = False
+        self.thread = None
+
+    def add(self, resource, old_contents):
+        """Schedule analyzing the changes of `resource`
+
+        `old_contents` is the contents of `resource` before the
+        change.  If the module is already scheduled, the contents
+        given the first time is kept.
+        """
+        self.condition.acquire()
+        try:
+            if self.task_handle.is_stopped():
+                return
+            self.clock += 1
+            if resource in self.pending:
+                old_contents = self.pending[resource][1]
+            self.pending[resource] = (self.clock, old_contents)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run)
+                self.thread.setDaemon(True)
+                self.thread.start()
+            self.condition.notifyAll()
+        finally:
+            self.condition.release()
+
+    def wait_until_quiescent(self, timeout=None):
+        """Wait until no analysis is pending or running
+
+        Returns `False` if the scheduler was still busy after
+        `timeout` seconds.
+        """
+        self.condition.acquire()
+        try:
+            if timeout is not None:
+                end = time.time() + timeout
+            while self.pending or self.running:
+                if timeout is None:
+                    self.condition.wait()
+                else:
+                    remaining = end - time.time()
+                    if remaining <= 0:
+                        return False
+                    self.condition.wait(remaining)
+            return True
+        finally:
+            self.condition.release()
+
+    def stop(self):
+        """Cancel pending analyses and stop the background thread"""
+        self.task_handle.stop()
+
+    def is_stopped(self):
+        return self.task_handle.is_stopped()
+
+    def join(self, timeout=None):
+        """Wait until the background thread of a stopped scheduler ends"""
+        self.condition.acquire()
+        try:
+            thread = self.thread
+        finally:
+            self.condition.release()
+        if thread is not None:
+            thread.join(timeout)
+
+    def _task_changed(self):
+        if self.task_handle.is_stopped():
+            self.condition.acquire()
+            try:
+                self.pending.clear()
+                self.condition.notifyAll()
+            finally:
+                self.condition.release()
+
+    def _next(self):
+        self.condition.acquire()
+        try:
+            self.running = False
+            self.condition.notifyAll()
+            while not self.pending and not self.task_handle.is_stopped():
+                self.condition.wait()
+            if self.task_handle.is_stopped():
+                return None
+            resource = max(self.pending,
+                           key=lambda resource: self.pending[resource][0])
+            old_contents = self.pending.pop(resource)[1]
+            self.running = True
+            return resource, old_contents
+        finally:
+            self.condition.release()
+
+    def _run(self):
+        while True:
+            job = self._next()
+            if job is None:
+                break
+            self.pycore.lock.acquire()
+            try:
+                try:
+                    _analyze_changed_scopes(self.pycore, *job)
+                except Exception:
+                    logging.getLogger('rope').exception(
+                        'Background SOA of <%s> failed' % job[0].path)
+            finally:
+                self.pycore.lock.release()
+
+
 class _TextChangeDetector(object):
 
     def __init__(self, old, new):
@@ -376,16 +619,10 @@ class _TextChangeDetector(object):
         self._set_diffs()
 
     def _set_diffs(self):
-        differ = difflib.Differ()
+        diff = codeanalyze.LineDiff(self.old, self.new)
         self.lines = []
-        lineno = 0
-        for line in differ.compare(self.old.splitlines(True),
-                                   self.new.splitlines(True)):
-            if line.startswith(' '):
-                lineno += 1
-            elif line.startswith('-'):
-                lineno += 1
-                self.lines.append(lineno)
+        for start, end in diff.get_changed_ranges():
+            self.lines.extend(range(start, end + 1))
 
     def is_changed(self, start, end):
         """Tell whether any of start till end lines have changed
@@ -5,6 +5,8 @@ from rope.base import exceptions, utils
 class PyName(object):
     """References to `PyObject`\s inside python programs"""
 
+    __slots__ = ()
+
     def get_object(self):
         """Return the `PyObject` object referenced by this `PyName`"""
 
@@ -14,6 +16,8 @@ class PyName(object):
 
 class DefinedName(PyName):
 
+    __slots__ = ('pyobject',)
+
     def __init__(self, pyobject):
         self.pyobject = pyobject
 
@@ -27,9 +31,13 @@ class DefinedName(PyName):
 class AssignedName(PyName):
     """Only a placeholder"""
 
+    __slots__ = ()
+
 
 class UnboundName(PyName):
 
+    __slots__ = ('pyobject',)
+
     def __init__(self, pyobject=None):
         self.pyobject = pyobject
         if self.pyobject is None:
@@ -45,6 +53,8 @@ class UnboundName(PyName):
 class AssignmentValue(object):
     """An assigned expression"""
 
+    __slots__ = ('ast_node', 'levels', 'evaluation', 'assign_type')
+
     def __init__(self, ast_node, levels=None, evaluation='',
                  assign_type=False):
         """The `level` is `None` for simple assignments and is
@@ -71,6 +81,8 @@ class AssignmentValue(object):
 class EvaluatedName(PyName):
     """A name whose object will be evaluated later"""
 
+    __slots__ = ('module', 'lineno', 'callback', 'pyobject')
+
     def __init__(self, callback, module=None, lineno=None):
         self.module = module
         self.lineno = lineno
@@ -91,9 +103,14 @@ class EvaluatedName(PyName):
 class ParameterName(PyName):
     """Only a placeholder"""
 
+    __slots__ = ()
+
 
 class ImportedModule(PyName):
 
+    __slots__ = ('importing_module', 'module_name', 'level', 'resource',
+                 'pymodule')
+
     def __init__(self, importing_module, module_name=None,
                  level=0, resource=None):
         self.importing_module = importing_module
@@ -140,6 +157,9 @@ class ImportedModule(PyName):
 
 class ImportedName(PyName):
 
+    __slots__ = ('imported_module', 'imported_name',
+                 '_calling_get_object_', '_calling_get_definition_location_')
+
     def __init__(self, imported_module, imported_name):
         self.imported_module = imported_module
         self.imported_name = imported_name
@@ -174,6 +194,8 @@ def _circular_inference():
 
 class _Inferred(object):
 
+    __slots__ = ('get_inferred', 'concluded', 'temp', '_calling_get_')
+
     def __init__(self, get_inferred, concluded=None):
         self.get_inferred = get_inferred
         self.concluded = concluded
@@ -5,6 +5,9 @@ from rope.base.pynames import *
 
 class AssignedName(pynames.AssignedName):
 
+    __slots__ = ('lineno', 'module', 'assignments', 'pyobject',
+                 '_calling__get_inferred_')
+
     def __init__(self, lineno=None, module=None, pyobject=None):
         self.lineno = lineno
         self.module = module
@@ -34,6 +37,8 @@ class AssignedName(pynames.AssignedName):
 
 class ParameterName(pynames.ParameterName):
 
+    __slots__ = ('pyfunction', 'index')
+
     def __init__(self, pyfunction, index):
         self.pyfunction = pyfunction
         self.index = index
@@ -285,6 +285,8 @@ class _PyModule(PyDefinedObject, AbstractModule):
         self.concluded_data = []
         AbstractModule.__init__(self)
         PyDefinedObject.__init__(self, pycore, ast_node, None)
+        # see `rope.base.evaluate.ScopeNameFinder`
+        self._evaluations = self._get_concluded_data()
 
     def _get_concluded_data(self):
         new_data = _ConcludedData()
@@ -3,6 +3,7 @@ import rope.base.evaluate
 import rope.base.builtins
 import rope.base.oi.soi
 import rope.base.pyscopes
+import rope.base.simplify
 from rope.base import (pynamesdef as pynames, exceptions, ast,
                        astutils, pyobjects, fscommands, arguments, utils)
 from rope.base.pyobjects import *
@@ -25,6 +26,19 @@ class PyFunction(pyobjects.PyFunction):
     def _create_concluded_attributes(self):
         return {}
 
+    def _get_defined_objects(self):
+        # the body of functions is visited only when their names are
+        # needed; the classes and functions defined in them are found
+        # without visiting their expressions
+        if self.defineds is None:
+            self.defineds = []
+            for node in _get_defined_nodes(self.ast_node.body):
+                if isinstance(node, ast.ClassDef):
+                    self.defineds.append(PyClass(self.pycore, node, self))
+                else:
+                    self.defineds.append(PyFunction(self.pycore, node, self))
+        return self.defineds
+
     def _create_scope(self):
         return rope.base.pyscopes.FunctionScope(self.pycore, self,
                                                 _FunctionVisitor)
@@ -204,7 +218,8 @@ class PyModule(pyobjects.PyModule):
     @utils.saveit
     def logical_lines(self):
         """A `LogicalLinesFinder`"""
-        return rope.base.codeanalyze.CachingLogicalLineFinder(self.lines)
+        return rope.base.codeanalyze.CachingLogicalLineFinder(
+            self.lines, generate=rope.base.simplify.logical_line_generator)
 
 
 class PyPackage(pyobjects.PyPackage):
@@ -319,12 +334,15 @@ class _ScopeVisitor(object):
             return None
 
     def _ClassDef(self, node):
-        pyclass = PyClass(self.pycore, node, self.owner_object)
+        pyclass = self._create_pydefined(PyClass, node)
         self.names[node.name] = pynames.DefinedName(pyclass)
         self.defineds.append(pyclass)
 
+    def _create_pydefined(self, type_, node):
+        return type_(self.pycore, node, self.owner_object)
+
     def _FunctionDef(self, node):
-        pyfunction = PyFunction(self.pycore, node, self.owner_object)
+        pyfunction = self._create_pydefined(PyFunction, node)
         for decorator in pyfunction.decorators:
             if isinstance(decorator, ast.Name) and decorator.id == 'property':
                 if isinstance(self, _ClassVisitor):
@@ -470,6 +488,12 @@ class _FunctionVisitor(_ScopeVisitor):
         super(_FunctionVisitor, self).__init__(pycore, owner_object)
         self.returned_asts = []
         self.generator = False
+        self.pydefineds = {}
+        for pydefined in owner_object._get_defined_objects():
+            self.pydefineds[pydefined.get_ast()] = pydefined
+
+    def _create_pydefined(self, type_, node):
+        return self.pydefineds[node]
 
     def _Return(self, node):
         if node.value is not None:
@@ -523,6 +547,23 @@ class _ClassInitVisitor(_AssignVisitor):
         pass
 
 
+def _get_defined_nodes(nodes):
+    """Generate the class and function nodes defined in `nodes`
+
+    Only compound statements are searched; nested definitions are
+    not.
+    """
+    for node in nodes:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            yield node
+            continue
+        for field in ('body', 'handlers', 'orelse', 'finalbody'):
+            children = getattr(node, field, None)
+            if isinstance(children, list):
+                for child in _get_defined_nodes(children):
+                    yield child
+
+
 class StarImport(object):
 
     def __init__(self, imported_module):
@@ -1,3 +1,5 @@
+import bisect
+
 import rope.base.builtins
 import rope.base.codeanalyze
 import rope.base.pynames
@@ -6,6 +8,10 @@ from rope.base import ast, exceptions, utils
 
 class Scope(object):
 
+    __slots__ = ('pycore', 'pyobject', 'parent',
+                 utils.saved_name('get_scopes'),
+                 utils.saved_name('get_logical_end'))
+
     def __init__(self, pycore, pyobject, parent_scope):
         self.pycore = pycore
         self.pyobject = pyobject
@@ -103,6 +109,8 @@ class Scope(object):
 
 class GlobalScope(Scope):
 
+    __slots__ = ('names', utils.saved_name('_scope_finder'))
+
     def __init__(self, pycore, module):
         super(GlobalScope, self).__init__(pycore, module, None)
         self.names = module._get_concluded_data()
@@ -146,13 +154,14 @@ class GlobalScope(Scope):
 
 class FunctionScope(Scope):
 
+    __slots__ = ('names', 'returned_asts', 'is_generator', 'visitor')
+
     def __init__(self, pycore, pyobject, visitor):
         super(FunctionScope, self).__init__(pycore, pyobject,
                                             pyobject.parent.get_scope())
         self.names = None
         self.returned_asts = None
         self.is_generator = None
-        self.defineds = None
         self.visitor = visitor
 
     def _get_names(self):
@@ -169,7 +178,6 @@ class FunctionScope(Scope):
             self.names.update(self.pyobject.get_parameters())
             self.returned_asts = new_visitor.returned_asts
             self.is_generator = new_visitor.generator
-            self.defineds = new_visitor.defineds
 
     def _get_returned_asts(self):
         if self.names is None:
@@ -184,11 +192,6 @@ class FunctionScope(Scope):
     def get_names(self):
         return self._get_names()
 
-    def _create_scopes(self):
-        if self.defineds is None:
-            self._visit_function()
-        return [pydefined.get_scope() for pydefined in self.defineds]
-
     def get_kind(self):
         return 'Function'
 
@@ -201,6 +204,8 @@ class FunctionScope(Scope):
 
 class ClassScope(Scope):
 
+    __slots__ = ()
+
     def __init__(self, pycore, pyobject):
         super(ClassScope, self).__init__(pycore, pyobject,
                                          pyobject.parent.get_scope())
@@ -213,9 +218,18 @@ class ClassScope(Scope):
 
 
 class _HoldingScopeFinder(object):
+    """Find the scopes holding lines of a module
+
+    The indents of the logical lines of the module are found in one
+    pass and the start lines of the subscopes of each scope are
+    sorted; both `get_holding_scope()` and `find_scope_end()` use
+    binary search on them.
+
+    """
 
     def __init__(self, pymodule):
         self.pymodule = pymodule
+        self._subscopes = {}
 
     def get_indents(self, lineno):
         return rope.base.codeanalyze.count_line_indents(
@@ -228,23 +242,25 @@ class _HoldingScopeFinder(object):
         if line_indents is None:
             line_indents = self.get_indents(lineno)
         current_scope = module_scope
-        new_scope = current_scope
-        while new_scope is not None and \
-              (new_scope.get_kind() == 'Module' or
-               self._get_scope_indents(new_scope) <= line_indents):
-            current_scope = new_scope
+        while True:
             if current_scope.get_start() == lineno and \
                current_scope.get_kind() != 'Module':
                 return current_scope
-            new_scope = None
-            for scope in current_scope.get_scopes():
-                if scope.get_start() <= lineno:
-                    if lineno <= scope.get_end():
-                        new_scope = scope
-                        break
-                else:
-                    break
-        return current_scope
+            new_scope = self._get_subscope_for_line(current_scope, lineno)
+            if new_scope is None or \
+               self._get_scope_indents(new_scope) > line_indents:
+                return current_scope
+            current_scope = new_scope
+
+    def _get_subscope_for_line(self, scope, lineno):
+        if scope not in self._subscopes:
+            scopes = scope.get_scopes()
+            starts = [subscope.get_start() for subscope in scopes]
+            self._subscopes[scope] = (starts, scopes)
+        starts, scopes = self._subscopes[scope]
+        index = bisect.bisect(starts, lineno) - 1
+        if index >= 0 and lineno <= scopes[index].get_end():
+            return scopes[index]
 
     def _is_empty_line(self, lineno):
         line = self.lines.get_line(lineno)
@@ -267,15 +283,42 @@ class _HoldingScopeFinder(object):
             body_indents = self._get_scope_indents(scope) + 4
         else:
             body_indents = self._get_body_indents(scope)
-        for l in self.logical_lines.generate_starts(
-            min(end + 1, self.lines.length()), self.lines.length() + 1):
-            if not self._is_empty_line(l):
-                if self.get_indents(l) < body_indents:
-                    return end
-                else:
-                    end = l
+        starts, indents, dedents = self._indented_lines
+        first = bisect.bisect(starts, end)
+        index = first
+        while index < len(starts) and indents[index] >= body_indents:
+            index = dedents[index]
+        if index > first:
+            return starts[index - 1]
         return end
 
+    @property
+    @utils.saveit
+    def _indented_lines(self):
+        """The starts of non-empty logical lines and their indents
+
+        `dedents[i]` is the index of the first line after line `i`
+        that is less indented than it.
+        """
+        starts = []
+        indents = []
+        dedents = []
+        unmatched = []
+        for lineno in self.logical_lines.generate_starts(
+            1, self.lines.length() + 1):
+            if self._is_empty_line(lineno):
+                continue
+            line_indents = self.get_indents(lineno)
+            while unmatched and indents[unmatched[-1]] > line_indents:
+                dedents[unmatched.pop()] = len(starts)
+            unmatched.append(len(starts))
+            starts.append(lineno)
+            indents.append(line_indents)
+            dedents.append(None)
+        for index in unmatched:
+            dedents[index] = len(starts)
+        return starts, indents, dedents
+
     @property
     def lines(self):
         return self.pymodule.lines
@@ -295,6 +338,8 @@ class TemporaryScope(Scope):
     parent scopes.
     """
 
+    __slots__ = ('names',)
+
     def __init__(self, pycore, parent_scope, names):
         super(TemporaryScope, self).__init__(
             pycore, parent_scope.pyobject, parent_scope)
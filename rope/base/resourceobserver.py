@@ -244,6 +244,10 @@ class ChangeIndicator(object):
 
     def get_indicator(self, resource):
         """Return the modification time and size of a `Resource`."""
+        if resource.project.overlay is not None:
+            indicator = resource.project.overlay.get_indicator(resource.path)
+            if indicator is not None:
+                return indicator
         path = resource.real_path
         # on dos, mtime does not change for a folder when files are added
         if os.name != 'posix' and os.path.isdir(path):
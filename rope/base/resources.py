@@ -30,6 +30,8 @@ class Resource(object):
         """Create this resource"""
 
     def exists(self):
+        if self.project.overlay is not None:
+            return self.project.overlay.get_kind(self.path) is not None
         return os.path.exists(self.real_path)
 
     @property
@@ -85,6 +87,8 @@ class File(Resource):
             raise exceptions.ModuleDecodeError(self.path, e.reason)
 
     def read_bytes(self):
+        if self.project.overlay is not None:
+            return self.project.overlay.read(self.path)
         return open(self.real_path, 'rb').read()
 
     def write(self, contents):
@@ -115,7 +119,11 @@ class Folder(Resource):
     def get_children(self):
         """Return the children of this folder"""
         result = []
-        for name in os.listdir(self.real_path):
+        if self.project.overlay is not None:
+            names = self.project.overlay.listdir(self.path)
+        else:
+            names = os.listdir(self.real_path)
+        for name in names:
             try:
                 child = self.get_child(name)
             except exceptions.ResourceNotFoundError:
@@ -174,6 +182,7 @@ class _ResourceMatcher(object):
     def __init__(self):
         self.patterns = []
         self._compiled_patterns = []
+        self._compiled_pattern = None
 
     def set_patterns(self, patterns):
         """Specify which resources to match
@@ -183,25 +192,33 @@ class _ResourceMatcher(object):
 
         """
         self._compiled_patterns = None
+        self._compiled_pattern = None
         self.patterns = patterns
 
     def _add_pattern(self, pattern):
         re_pattern = pattern.replace('.', '\\.').\
                      replace('*', '[^/]*').replace('?', '[^/]').\
-                     replace('//', '/(.*/)?')
-        re_pattern = '^(.*/)?' + re_pattern + '(/.*)?$'
+                     replace('//', '/(?:.*/)?')
+        re_pattern = '^(?:.*/)?' + re_pattern + '(?:/.*)?$'
         self.compiled_patterns.append(re.compile(re_pattern))
 
     def does_match(self, resource):
-        for pattern in self.compiled_patterns:
-            if pattern.match(resource.path):
-                return True
+        if self.does_match_path(resource.path):
+            return True
         path = os.path.join(resource.project.address,
                             *resource.path.split('/'))
         if os.path.islink(path):
             return True
         return False
 
+    def does_match_path(self, path):
+        """Match the resource `path` without checking symbolic links"""
+        if self._compiled_pattern is None:
+            patterns = [pattern.pattern
+                        for pattern in self.compiled_patterns]
+            self._compiled_pattern = re.compile('|'.join(patterns) or '(?!)')
+        return self._compiled_pattern.match(path) is not None
+
     @property
     def compiled_patterns(self):
         if self._compiled_patterns is None:
@@ -2,12 +2,12 @@
 
 This module is here to help source code analysis.
 """
+import bisect
 import re
 
 from rope.base import codeanalyze, utils
 
 
-@utils.cached(7)
 def real_code(source):
     """Simplify `source` for analysis
 
@@ -21,35 +21,119 @@ def real_code(source):
     The resulting code is a lot easier to analyze if we are interested
     only in offsets.
     """
-    collector = codeanalyze.ChangeCollector(source)
-    for start, end in ignored_regions(source):
-        if source[start] == '#':
-            replacement = ' ' * (end - start)
-        else:
-            replacement = '"%s"' % (' ' * (end - start - 2))
-        collector.add_change(start, end, replacement)
-    source = collector.get_changed() or source
-    collector = codeanalyze.ChangeCollector(source)
+    return analyze(source).code
+
+
+def ignored_regions(source):
+    """Return ignored regions like strings and comments in `source` """
+    return analyze(source).ignored
+
+
+@utils.lru_cached(7)
+def analyze(source):
+    """Return the `SimplifiedSource` of `source`"""
+    return SimplifiedSource(source)
+
+
+class SimplifiedSource(object):
+    """The result of scanning `source` once
+
+    `code` is the simplified code as returned by `real_code()` and
+    `ignored` is the list of ``(start, end)`` offsets of strings and
+    comments.  The ``(start, end)`` line numbers of non-blank logical
+    lines are available in `logical_lines`.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.code, self.ignored, self._breaks = _scan(source)
+
+    def get_ignored_region(self, offset):
+        """Return the string or comment region containing `offset`"""
+        index = bisect.bisect(self._ignored_starts, offset)
+        if index > 0 and offset < self.ignored[index - 1][1]:
+            return self.ignored[index - 1]
+
+    @property
+    @utils.saveit
+    def _ignored_starts(self):
+        return [start for start, end in self.ignored]
+
+    @property
+    @utils.saveit
+    def logical_lines(self):
+        source = self.source
+        result = []
+        line = 1
+        last = 0
+        for offset in self._breaks + [len(source)]:
+            end_line = line + source.count('\n', last, offset)
+            if end_line != line or source[last:offset].strip():
+                result.append((line, end_line))
+            line = end_line + 1
+            last = offset + 1
+        return result
+
+
+def logical_line_generator(lines):
+    """A `CachingLogicalLineFinder` generator for `SourceLinesAdapter`\s"""
+    return analyze(lines.code).logical_lines
+
+
+def _scan(source):
+    """Simplify `source` in a single pass
+
+    Returns the simplified code, the ignored regions and the offsets
+    of newlines that end logical lines.
+    """
+    pieces = []
+    ignored = []
+    breaks = []
+    last = 0
     parens = 0
-    for match in _parens.finditer(source):
-        i = match.start()
+    unterminated = False
+    for match in _tokens.finditer(source):
+        start, end = match.span()
         c = match.group()
         if c in '({[':
             parens += 1
+            continue
         if c in ')}]':
             parens -= 1
-        if c == '\n' and parens > 0:
-            collector.add_change(i, i + 1, ' ')
-    source = collector.get_changed() or source
-    return source.replace('\\\n', '  ').replace('\t', ' ').replace(';', '\n')
-
-
-@utils.cached(7)
-def ignored_regions(source):
-    """Return ignored regions like strings and comments in `source` """
-    return [(match.start(), match.end()) for match in _str.finditer(source)]
+            continue
+        if c == '\n':
+            if parens > 0:
+                replacement = ' '
+            else:
+                if parens == 0 and not unterminated:
+                    breaks.append(start)
+                continue
+        elif c == '\\\n':
+            replacement = parens > 0 and '\\ ' or '  '
+        elif c == '\t':
+            replacement = ' '
+        elif c == ';':
+            replacement = '\n'
+        elif c[0] == '#':
+            ignored.append((start, end))
+            replacement = ' ' * (end - start)
+        else:
+            ignored.append((start, end))
+            replacement = '"%s"' % (' ' * (end - start - 2))
+            quote = c[-1]
+            if c.lstrip('uUrR') == quote * 2 and \
+               source[end:end + 1] == quote:
+                # an unterminated triple quoted string
+                unterminated = True
+        pieces.append(source[last:start])
+        pieces.append(replacement)
+        last = end
+    if not pieces:
+        return source, ignored, breaks
+    pieces.append(source[last:])
+    return ''.join(pieces), ignored, breaks
 
 
-_str = re.compile('%s|%s' % (codeanalyze.get_comment_pattern(),
-                             codeanalyze.get_string_pattern()))
-_parens = re.compile(r'[\({\[\]}\)\n]')
+_tokens = re.compile('%s|%s|[\\(\\{\\[\\]\\}\\)\\n\\t;]|\\\\\\n' %
+                     (codeanalyze.get_comment_pattern(),
+                      codeanalyze.get_string_pattern()))
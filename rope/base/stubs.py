@@ -0,0 +1,321 @@
+"""Descriptions of extension modules
+
+Instead of importing extension modules in rope's process, they are
+imported and described in a separate python process (this module is
+run as a script for that purpose; it should not import other rope
+modules).  If ``introspection_server`` project config is set, a
+single `IntrospectionServer` process is used for all modules.  The
+descriptions are saved in the rope folder, in a data
+file for each python version, and are used by `rope.base.builtins`
+through `Stub` objects.
+
+"""
+import cPickle as pickle
+import imp
+import inspect
+import os
+import subprocess
+import sys
+import threading
+
+
+class StubCache(object):
+    """Descriptions of the extension modules of a project
+
+    The processes that describe modules are killed if they do not
+    describe a module in `timeout` seconds; that module is treated
+    like modules that cannot be imported.
+    """
+
+    def __init__(self, project, timeout=30):
+        self.project = project
+        self.timeout = timeout
+        self._descriptions = None
+        self._changed = False
+        self._server = None
+        self.project.data_files.add_write_hook(self.write)
+
+    def get_stub(self, name):
+        """Return the `Stub` of module `name`
+
+        Returns `None` if the module cannot be imported.
+        """
+        return self.get_stubs([name])[name]
+
+    def get_stubs(self, names):
+        """Return a dict of module names to `Stub`\s
+
+        Modules that are not described yet are described together.
+        """
+        descriptions = self._get_descriptions()
+        keys = {}
+        missing = []
+        for name in names:
+            keys[name] = _module_key(name)
+            if name not in descriptions or \
+               descriptions[name][0] != keys[name]:
+                missing.append(name)
+        if missing:
+            described = self._describe(missing)
+            if described is not None:
+                for name, description in zip(missing, described):
+                    descriptions[name] = (keys[name], description)
+                self._changed = True
+        result = {}
+        for name in names:
+            result[name] = None
+            if name in descriptions and descriptions[name][1] is not None:
+                result[name] = Stub(descriptions[name][1])
+        return result
+
+    def _describe(self, names):
+        if self.project.prefs.get('introspection_server', False):
+            if self._server is None:
+                self._server = IntrospectionServer(self.timeout)
+            return self._server.describe(names)
+        return _describe_in_process(names, self.timeout)
+
+    def _get_descriptions(self):
+        if self._descriptions is None:
+            self._descriptions = self.project.data_files.read_data(
+                self._data_name, compress=True)
+            if self._descriptions is None:
+                self._descriptions = {}
+        return self._descriptions
+
+    def write(self):
+        if self._changed:
+            self.project.data_files.write_data(
+                self._data_name, self._descriptions, compress=True)
+            self._changed = False
+
+    def close(self):
+        """Stop the introspection server, if any"""
+        if self._server is not None:
+            self._server.close()
+
+    @property
+    def _data_name(self):
+        return 'stubs-%s.%s.%s' % sys.version_info[:3]
+
+
+class Stub(object):
+    """The description of an object in an extension module
+
+    `kind` is one of ``'class'``, ``'function'`` and ``'object'``.
+    For objects, `__name__` is the name of their type.
+    """
+
+    def __init__(self, description):
+        (self.kind, self.__name__, self.__doc__,
+         self.argnames, self._attributes) = description
+
+    def get_attributes(self):
+        """Return a dict of attribute names to `Stub`\s"""
+        result = {}
+        if self._attributes is not None:
+            for name, description in self._attributes.iteritems():
+                result[name] = Stub(description)
+        return result
+
+
+def describe(name, depth=2):
+    """Describe module `name`
+
+    Only attributes `depth` levels deep are described.
+    """
+    module = __import__(name)
+    for token in name.split('.')[1:]:
+        module = getattr(module, token)
+    return _describe(module, depth)
+
+
+def _describe(obj, depth):
+    argnames = []
+    if inspect.isclass(obj):
+        kind = 'class'
+        name = getattr(obj, '__name__', None)
+    elif inspect.isroutine(obj):
+        kind = 'function'
+        name = getattr(obj, '__name__', None)
+        try:
+            argnames = [arg for arg in inspect.getargspec(obj)[0]
+                        if isinstance(arg, str)]
+        except TypeError:
+            pass
+    else:
+        kind = 'object'
+        name = type(obj).__name__
+    try:
+        doc = getattr(obj, '__doc__', None)
+    except Exception:
+        doc = None
+    if not isinstance(doc, basestring):
+        doc = None
+    attributes = None
+    if depth > 0:
+        attributes = {}
+        for child_name in dir(obj):
+            if child_name == 'None':
+                continue
+            try:
+                child = getattr(obj, child_name)
+            except Exception:
+                # descriptors are allowed to raise AttributeError
+                # even if they are in dir()
+                continue
+            attributes[child_name] = _describe(child, depth - 1)
+    return (kind, name, doc, argnames, attributes)
+
+
+def _module_key(name):
+    """Return the path and modification time of module `name`
+
+    Modules are found without importing them; `None` is returned for
+    modules that cannot be found or are built into the interpreter.
+    """
+    path = None
+    try:
+        for token in name.split('.'):
+            file, path, description = imp.find_module(
+                token, path and [path])
+            if file is not None:
+                file.close()
+        return path, os.path.getmtime(path)
+    except (ImportError, OSError):
+        return None
+
+
+class IntrospectionServer(object):
+    """A python process that describes modules
+
+    The process is started when needed and receives lists of module
+    names through a pipe.  If it does not answer in `timeout`
+    seconds, it is killed.
+    """
+
+    def __init__(self, timeout=30):
+        self.timeout = timeout
+        self.process = None
+
+    def describe(self, names):
+        """Return the descriptions of modules in `names`
+
+        Modules are described one at a time.  The description of a
+        module is `None` if it cannot be imported or if the server
+        does not describe it in time; the remaining modules are
+        described in a new process then.  Returns `None` if the
+        server cannot be started.
+        """
+        result = []
+        for name in names:
+            if self.process is None or self.process.poll() is not None:
+                self.process = _start_process(['--server'],
+                                              stdin=subprocess.PIPE)
+                if self.process is None:
+                    return None
+            process = self.process
+            def read():
+                pickle.dump([name], process.stdin, 2)
+                process.stdin.flush()
+                return pickle.load(process.stdout)
+            described = _call_or_kill(process, read, self.timeout)
+            if described is None:
+                self.process = None
+                result.append(None)
+            else:
+                result.extend(described)
+        return result
+
+    def close(self):
+        if self.process is not None:
+            _kill(self.process)
+            self.process = None
+
+
+def _start_process(args, **kwds):
+    script = os.path.splitext(__file__)[0] + '.py'
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([path for path in sys.path if path])
+    null = open(os.devnull, 'w')
+    try:
+        try:
+            return subprocess.Popen(
+                [sys.executable, script] + args, env=env,
+                stdout=subprocess.PIPE, stderr=null, **kwds)
+        except OSError:
+            return None
+    finally:
+        null.close()
+
+
+def _describe_in_process(names, timeout=30):
+    server = IntrospectionServer(timeout)
+    try:
+        return server.describe(names)
+    finally:
+        server.close()
+
+
+def _call_or_kill(process, function, timeout):
+    """Return the value of `function()` that talks to `process`
+
+    If it fails or does not return in `timeout` seconds, `process` is
+    killed and `None` is returned.
+    """
+    result = []
+    def call():
+        try:
+            result.append(function())
+        except Exception:
+            pass
+    thread = threading.Thread(target=call)
+    thread.setDaemon(True)
+    thread.start()
+    thread.join(timeout)
+    if not result:
+        _kill(process)
+        return None
+    return result[0]
+
+
+def _kill(process):
+    if process.poll() is None:
+        try:
+            process.kill()
+        except OSError:
+            pass
+    process.wait()
+
+
+def _describe_all(names):
+    result = []
+    for name in names:
+        try:
+            result.append(describe(name))
+        except Exception:
+            result.append(None)
+    return result
+
+
+def _main(args):
+    # modules may write to stdout when imported
+    output = os.fdopen(os.dup(sys.stdout.fileno()), 'wb')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    if args == ['--server']:
+        while True:
+            try:
+                names = pickle.load(sys.stdin)
+            except EOFError:
+                break
+            pickle.dump(_describe_all(names), output, 2)
+            output.flush()
+    else:
+        pickle.dump(_describe_all(args), output, 2)
+    output.close()
+
+
+if __name__ == '__main__':
+    # not importing rope modules instead of standard ones
+    del sys.path[0]
+    _main(sys.argv[1:])
@@ -2,17 +2,35 @@ import warnings
 
 
 def saveit(func):
-    """A decorator that caches the return value of a function"""
+    """A decorator that caches the return value of a function
 
-    name = '_' + func.__name__
+    The value is saved in an attribute named `saved_name(func)`;
+    classes with `__slots__` should reserve a slot for it.
+    """
+
+    name = saved_name(func)
     def _wrapper(self, *args, **kwds):
-        if not hasattr(self, name):
-            setattr(self, name, func(self, *args, **kwds))
-        return getattr(self, name)
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            result = func(self, *args, **kwds)
+            setattr(self, name, result)
+            return result
     return _wrapper
 
 cacheit = saveit
 
+def saved_name(func):
+    """Return the attribute name `saveit` uses for `func`
+
+    `func` can be a function or its name.  Names never start with two
+    underscores so that they are not mangled in `__slots__`.
+    """
+    name = getattr(func, '__name__', func)
+    if name.startswith('_'):
+        return '_saved' + name
+    return '_' + name
+
 def prevent_recursion(default):
     """A decorator that returns the return value of `default` in recursions"""
     def decorator(func):
@@ -76,3 +94,52 @@ class _Cached(object):
         if len(self.cache) > self.count:
             del self.cache[0]
         return result
+
+
+def lru_cached(size):
+    """A least-recently-used caching decorator for one-argument functions
+
+    The argument itself is the key so lookups compare hashes (which
+    python caches for `str` objects), then identities and only then
+    contents; calling the function again with the same source string
+    costs a dictionary lookup.  The decorated function keeps `hits` and
+    `misses` counters and can be emptied with `clear()`.
+    """
+    def decorator(func):
+        return _LRUCached(func, size)
+    return decorator
+
+class _LRUCached(object):
+
+    def __init__(self, func, size):
+        self.func = func
+        self.size = size
+        self.cache = {}
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+        self.__name__ = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __call__(self, key):
+        self.clock += 1
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.hits += 1
+            entry[0] = self.clock
+            return entry[1]
+        self.misses += 1
+        result = self.func(key)
+        if len(self.cache) >= self.size:
+            self._evict()
+        self.cache[key] = [self.clock, result]
+        return result
+
+    def _evict(self):
+        oldest = min(self.cache.items(), key=lambda item: item[1][0])
+        del self.cache[oldest[0]]
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
@@ -104,6 +104,7 @@ class AutoImport(object):
         """Generate global name cache for modules listed in `modules`"""
         job_set = task_handle.create_jobset(
             'Generatig autoimport cache for modules', len(modules))
+        self._describe_extension_modules(modules)
         for modname in modules:
             job_set.started_job('Working on <%s>' % modname)
             if modname.endswith('.*'):
@@ -115,6 +116,13 @@ class AutoImport(object):
                 self.update_module(modname, underlined)
             job_set.finished_job()
 
+    def _describe_extension_modules(self, modules):
+        pycore = self.project.pycore
+        names = [name for name in modules
+                 if name in pycore.extension_modules]
+        if names and self.project.prefs.get('extension_stubs', True):
+            pycore.extension_cache.get_stubs(names)
+
     def clear_cache(self):
         """Clear all entries in global-name cache
 
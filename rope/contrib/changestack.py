@@ -15,9 +15,12 @@ of each other as one bigger command.  It can be used like::
   stack.pop_all()
   changes = stack.merged()
 
-Now `changes` can be previewed or performed as before.
+Now `changes` can be previewed or performed as before.  Pushed changes
+are performed on a `rope.base.project.Overlay` and are kept in memory;
+only the merged changes are written to disk.
 """
 
+import rope.base.project
 from rope.base import change
 
 
@@ -27,14 +30,36 @@ class ChangeStack(object):
         self.project = project
         self.description = description
         self.stack = []
+        self.overlay = None
 
     def push(self, changes):
+        """Perform `changes` in memory
+
+        If performing them fails, they are not pushed and if no
+        changes were pushed before, the overlay of the project is
+        removed.
+        """
+        if self.project.overlay is None:
+            self.overlay = rope.base.project.Overlay(self.project)
+            self.project.overlay = self.overlay
+        try:
+            changes.do()
+        except Exception:
+            if not self.stack:
+                self._remove_overlay()
+            raise
         self.stack.append(changes)
-        self.project.do(changes)
 
     def pop_all(self):
-        for i in range(len(self.stack)):
-            self.project.history.undo(drop=True)
+        for changes in reversed(self.stack):
+            changes.undo()
+        self._remove_overlay()
+
+    def _remove_overlay(self):
+        if self.overlay is not None and \
+           self.project.overlay is self.overlay:
+            self.project.overlay = None
+        self.overlay = None
 
     def merged(self):
         result = change.ChangeSet(self.description)
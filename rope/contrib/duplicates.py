@@ -0,0 +1,284 @@
+"""Finding duplicate code
+
+`find_duplicates()` finds groups of similar expressions and statement
+sequences in a project.  Two fragments are similar if they are the
+same after renaming their variables consistently, like the
+``${name}`` wildcards of `rope.refactor.similarfinder`.  As an
+example::
+
+  for group in find_duplicates(project, min_size=20):
+      for resource, (start, end) in group.occurrences:
+          print '%s: %s' % (resource.path, start)
+      print
+
+Modules are processed one at a time and only structural hashes of
+their large fragments are kept; these hashes ignore variable names.
+Only the modules with colliding hashes are parsed again to find the
+regions of the fragments and to check that their names match.  If
+`processes` is more than one, modules are processed in that many
+worker processes (see `rope.base.parallel`).
+
+"""
+from rope.base import ast, parallel, taskhandle
+from rope.refactor import patchedast
+
+
+def find_duplicates(project, resources=None, min_size=16, processes=1,
+                    task_handle=taskhandle.NullTaskHandle()):
+    """Find duplicate expressions and statements in `resources`
+
+    `min_size` is the minimum number of AST nodes in reported
+    fragments.  For statements, the shortest sequence of consecutive
+    statements of at least `min_size` nodes starting at each
+    statement is considered.  Fragments inside larger duplicates are
+    not reported.
+
+    It returns a list of `DuplicateGroup`\s, larger ones first.
+    """
+    if resources is None:
+        resources = project.pycore.get_python_files()
+    paths = [resource.path for resource in resources]
+    job_set = task_handle.create_jobset('Hashing Fragments', len(paths))
+    buckets = {}
+    results = _map(project, processes, _hash_fragments,
+                   [(path, min_size) for path in paths], job_set)
+    for path, fragments in results:
+        for hash_, size, key in fragments:
+            buckets.setdefault((hash_, size), []).append((path, key))
+
+    keys_by_path = {}
+    for bucket in buckets.values():
+        if len(bucket) > 1:
+            for path, key in bucket:
+                keys_by_path.setdefault(path, []).append(key)
+    job_set = task_handle.create_jobset('Checking Duplicates',
+                                        len(keys_by_path))
+    regions = {}
+    results = _map(project, processes, _check_fragments,
+                   [(path, keys_by_path[path], min_size)
+                    for path in keys_by_path], job_set)
+    for path, checked in results:
+        for key, region, canonical in checked:
+            regions[(path, key)] = (region, canonical)
+    return _make_groups(project, buckets, regions)
+
+
+class DuplicateGroup(object):
+    """A group of similar fragments
+
+    `occurrences` is a list of ``(resource, (start, end))`` tuples and
+    `size` is the number of AST nodes in each fragment.
+    """
+
+    def __init__(self, size, occurrences):
+        self.size = size
+        self.occurrences = occurrences
+
+    def __repr__(self):
+        return '<%s size=%s occurrences=%s>' % (
+            self.__class__.__name__, self.size, len(self.occurrences))
+
+
+def _map(project, processes, function, args_list, job_set):
+    """Generate ``function(project, *args)`` for `args_list`"""
+    if processes is None or processes <= 1 or len(args_list) < 2:
+        for args in args_list:
+            job_set.started_job(args[0])
+            yield function(project, *args)
+            job_set.finished_job()
+        return
+    results = parallel.imap_unordered(project, processes,
+                                      function, args_list)
+    try:
+        for result in results:
+            job_set.started_job(result[0])
+            yield result
+            job_set.finished_job()
+    finally:
+        results.close()
+
+
+def _make_groups(project, buckets, regions):
+    groups = []
+    for (hash_, size), bucket in buckets.items():
+        if len(bucket) < 2:
+            continue
+        similars = {}
+        for path, key in bucket:
+            if (path, key) in regions:
+                region, canonical = regions[(path, key)]
+                similars.setdefault(canonical, []).append((path, region))
+        for occurrences in similars.values():
+            if len(occurrences) > 1:
+                occurrences.sort()
+                groups.append(DuplicateGroup(size, occurrences))
+    groups.sort(key=lambda group: (-group.size, group.occurrences))
+    result = []
+    reported = {}
+    for group in groups:
+        for path, region in group.occurrences:
+            if not _is_inside(reported.get(path, []), region):
+                break
+        else:
+            continue
+        for path, region in group.occurrences:
+            reported.setdefault(path, []).append(region)
+        result.append(group)
+    for group in result:
+        group.occurrences = [(project.get_resource(path), region)
+                             for path, region in group.occurrences]
+    return result
+
+
+def _is_inside(regions, region):
+    for start, end in regions:
+        if start <= region[0] and region[1] <= end:
+            return True
+    return False
+
+
+def _parse(project, path):
+    source = project.get_resource(path).read()
+    try:
+        return source, ast.parse(source)
+    except SyntaxError:
+        return source, None
+
+
+def _hash_fragments(project, path, min_size):
+    source, node = _parse(project, path)
+    if node is None:
+        return path, []
+    hasher = _FragmentHasher(min_size)
+    hasher.add(node)
+    return path, hasher.fragments
+
+
+def _check_fragments(project, path, keys, min_size):
+    """Return the regions and canonical hashes of fragments in `keys`
+
+    Fragments that no longer exist (the module might have changed
+    since hashing) or whose regions cannot be found are skipped.
+    """
+    source, node = _parse(project, path)
+    if node is None:
+        return path, []
+    patchedast.patch_ast(node, source, lazy=True)
+    hasher = _FragmentHasher(min_size, keep_nodes=True)
+    hasher.add(node)
+    result = []
+    for key in keys:
+        index, count = key
+        if index + max(count, 1) > len(hasher.nodes):
+            continue
+        if count == 0:
+            nodes = [hasher.nodes[index]]
+        else:
+            nodes = hasher.nodes[index:index + count]
+        try:
+            region = (patchedast.node_region(nodes[0])[0],
+                      patchedast.node_region(nodes[-1])[1])
+        except patchedast.MismatchedTokenError:
+            continue
+        result.append((key, region, _canonical_hash(nodes, {})))
+    return path, result
+
+
+class _FragmentHasher(object):
+    """Compute structural hashes of large fragments
+
+    Variable names are ignored in these hashes.  `fragments` holds
+    ``(hash, size, key)`` tuples; `key` is ``(index, 0)`` for the
+    expression with preorder `index` and ``(index, count)`` for
+    `count` statements starting at the statement with preorder
+    `index`.  Statements of a list have consecutive indices in
+    `nodes`, kept if `keep_nodes` is `True`.
+    """
+
+    def __init__(self, min_size, keep_nodes=False):
+        self.min_size = min_size
+        self.keep_nodes = keep_nodes
+        self.nodes = []
+        self.count = 0
+        self.fragments = []
+
+    def add(self, node):
+        """Return the hash and the size of `node`"""
+        index = self._index(node)
+        result, size = self._hash(node)
+        if size >= self.min_size and isinstance(node, ast.expr):
+            self.fragments.append((result, size, (index, 0)))
+        return result, size
+
+    def _index(self, node):
+        self.count += 1
+        if self.keep_nodes:
+            self.nodes.append(node)
+        return self.count - 1
+
+    def _hash(self, node):
+        if isinstance(node, ast.Name):
+            return _name_hash, 1
+        hashes = [node.__class__.__name__]
+        size = 1
+        for child in ast.get_children(node):
+            if isinstance(child, ast.expr_context):
+                continue
+            if isinstance(child, ast.AST):
+                child_hash, child_size = self.add(child)
+            elif isinstance(child, (list, tuple)):
+                child_hash, child_size = self._add_list(child)
+            else:
+                child_hash, child_size = hash(child), 0
+            hashes.append(child_hash)
+            size += child_size
+        return hash(tuple(hashes)), size
+
+    def _add_list(self, nodes):
+        if not nodes or not isinstance(nodes[0], ast.stmt):
+            entries = []
+            for node in nodes:
+                if isinstance(node, ast.AST):
+                    entries.append(self.add(node))
+                else:
+                    entries.append((hash(node), 0))
+        else:
+            # statements are indexed first so that the statements of
+            # a list have consecutive indices
+            indices = [self._index(node) for node in nodes]
+            entries = [self._hash(node) for node in nodes]
+            self._add_sequences(indices, entries)
+        return (hash(tuple([node_hash for node_hash, size in entries])),
+                sum([size for node_hash, size in entries]))
+
+    def _add_sequences(self, indices, entries):
+        for start in range(len(entries)):
+            size = 0
+            for end in range(start, len(entries)):
+                size += entries[end][1]
+                if size >= self.min_size:
+                    hashes = tuple([node_hash for node_hash, node_size
+                                    in entries[start:end + 1]])
+                    self.fragments.append(
+                        (hash(hashes), size,
+                         (indices[start], end - start + 1)))
+                    break
+
+
+_name_hash = hash(('Name',))
+
+
+def _canonical_hash(node, names):
+    """Hash `node` with variables numbered in the order they appear"""
+    if isinstance(node, ast.Name):
+        return hash(('Name', names.setdefault(node.id, len(names))))
+    if isinstance(node, ast.AST):
+        hashes = [node.__class__.__name__]
+        for child in ast.get_children(node):
+            if not isinstance(child, ast.expr_context):
+                hashes.append(_canonical_hash(child, names))
+        return hash(tuple(hashes))
+    if isinstance(node, (list, tuple)):
+        return hash(tuple([_canonical_hash(child, names)
+                           for child in node]))
+    return hash(node)
@@ -1,3 +1,5 @@
+import itertools
+
 import rope.base.codeanalyze
 import rope.base.evaluate
 import rope.base.pyobjects
@@ -17,20 +19,47 @@ def find_occurrences(project, resource, offset, unsure=False, resources=None,
     in the project are searched.
 
     """
+    finder = _occurrences_finder(project, resource, offset,
+                                 unsure, in_hierarchy)
+    if resources is None:
+        resources = project.pycore.get_python_files()
+    job_set = task_handle.create_jobset('Finding Occurrences',
+                                        count=len(resources))
+    return _find_locations(finder, resources, job_set)
+
+
+def iter_occurrences(project, resource, offset, unsure=False,
+                     resources=None, in_hierarchy=False, limit=None,
+                     task_handle=taskhandle.NullTaskHandle()):
+    """Generate the `Location`\s `find_occurrences()` returns
+
+    The locations of each module are generated as soon as it is
+    searched.  Modules are searched in the order `sort_resources()`
+    returns them; if you stop the iteration, the remaining ones are
+    not searched.  At most `limit` locations are generated if it is
+    not `None`.
+
+    """
+    finder = _occurrences_finder(project, resource, offset,
+                                 unsure, in_hierarchy)
+    if resources is None:
+        resources = project.pycore.get_python_files()
+    resources = sort_resources(project, resource, resources)
+    job_set = task_handle.create_jobset('Finding Occurrences',
+                                        count=len(resources))
+    return _iter_locations(finder, resources, job_set, limit)
+
+
+def _occurrences_finder(project, resource, offset, unsure, in_hierarchy):
     name = worder.get_name_at(resource, offset)
     this_pymodule = project.pycore.resource_to_pyobject(resource)
     primary, pyname = rope.base.evaluate.eval_location2(
         this_pymodule, offset)
     def is_match(occurrence):
         return unsure
-    finder = occurrences.create_finder(
+    return occurrences.create_finder(
         project.pycore, name, pyname, unsure=is_match,
         in_hierarchy=in_hierarchy, instance=primary)
-    if resources is None:
-        resources = project.pycore.get_python_files()
-    job_set = task_handle.create_jobset('Finding Occurrences',
-                                        count=len(resources))
-    return _find_locations(finder, resources, job_set)
 
 
 def find_implementations(project, resource, offset, resources=None,
@@ -40,6 +69,31 @@ def find_implementations(project, resource, offset, resources=None,
     Finds the places a method is implemented.  Returns a list of
     `Location`\s.
     """
+    finder = _implementations_finder(project, resource, offset)
+    if resources is None:
+        resources = project.pycore.get_python_files()
+    job_set = task_handle.create_jobset('Finding Implementations',
+                                        count=len(resources))
+    return _find_locations(finder, resources, job_set)
+
+
+def iter_implementations(project, resource, offset, resources=None,
+                         limit=None, task_handle=taskhandle.NullTaskHandle()):
+    """Generate the `Location`\s `find_implementations()` returns
+
+    Like `iter_occurrences()`, locations are generated as modules are
+    searched.
+    """
+    finder = _implementations_finder(project, resource, offset)
+    if resources is None:
+        resources = project.pycore.get_python_files()
+    resources = sort_resources(project, resource, resources)
+    job_set = task_handle.create_jobset('Finding Implementations',
+                                        count=len(resources))
+    return _iter_locations(finder, resources, job_set, limit)
+
+
+def _implementations_finder(project, resource, offset):
     name = worder.get_name_at(resource, offset)
     this_pymodule = project.pycore.resource_to_pyobject(resource)
     pyname = rope.base.evaluate.eval_location(this_pymodule, offset)
@@ -58,12 +112,21 @@ def find_implementations(project, resource, offset, resources=None,
             return False
     filters = [is_defined, not_self,
                occurrences.InHierarchyFilter(pyname, True)]
-    finder = occurrences.Finder(project.pycore, name, filters=filters)
-    if resources is None:
-        resources = project.pycore.get_python_files()
-    job_set = task_handle.create_jobset('Finding Implementations',
-                                        count=len(resources))
-    return _find_locations(finder, resources, job_set)
+    return occurrences.Finder(project.pycore, name, filters=filters)
+
+
+def sort_resources(project, resource, resources):
+    """Sort `resources` by how likely they use names of `resource`
+
+    `resource` comes first, then the modules of its package and then
+    other modules by their distance from `resource` in the import
+    graph (see `rope.base.importgraph.ImportGraph.get_distances()`).
+    """
+    distances = project.pycore.import_graph.get_distances(resource)
+    def key(module):
+        return (module != resource, module.parent != resource.parent,
+                distances.get(module, len(distances)), module.path)
+    return sorted(resources, key=key)
 
 
 def find_definition(project, code, offset, resource=None, maxfixes=1):
@@ -101,10 +164,20 @@ class Location(object):
 
 
 def _find_locations(finder, resources, job_set):
-    result = []
+    return list(_iter_locations(finder, resources, job_set))
+
+
+def _iter_locations(finder, resources, job_set, limit=None):
     for resource in resources:
+        if limit is not None and limit <= 0:
+            break
         job_set.started_job(resource.path)
-        for occurrence in finder.find_occurrences(resource):
-            result.append(Location(occurrence))
+        found = finder.find_occurrences(resource)
+        if limit is not None:
+            found = itertools.islice(found, limit)
+        locations = [Location(occurrence) for occurrence in found]
         job_set.finished_job()
-    return result
+        for location in locations:
+            yield location
+        if limit is not None:
+            limit -= len(locations)
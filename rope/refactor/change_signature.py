@@ -3,7 +3,7 @@ import copy
 import rope.base.exceptions
 from rope.base import pyobjects, taskhandle, evaluate, worder, codeanalyze, utils
 from rope.base.change import ChangeContents, ChangeSet
-from rope.refactor import occurrences, functionutils
+from rope.refactor import occurrences, functionutils, parallelchanges
 
 
 class ChangeSignature(object):
@@ -40,11 +40,25 @@ class ChangeSignature(object):
                            pyclass.parent[pyclass.get_name()])
 
     def _change_calls(self, call_changer, in_hierarchy=None, resources=None,
-                      handle=taskhandle.NullTaskHandle()):
+                      handle=taskhandle.NullTaskHandle(), processes=1,
+                      changers=None):
         if resources is None:
             resources = self.pycore.get_python_files()
         changes = ChangeSet('Changing signature of <%s>' % self.name)
         job_set = handle.create_jobset('Collecting Changes', len(resources))
+        get_changed_source = self._get_source_changer(call_changer,
+                                                      in_hierarchy)
+        factory = None
+        if changers is not None:
+            factory = _changed_call_sources
+        for file, changed_file in parallelchanges.changed_sources(
+                self.pycore.project, resources, get_changed_source, job_set,
+                processes, factory,
+                (self.resource.path, self.offset, changers, in_hierarchy)):
+            changes.add_change(ChangeContents(file, changed_file))
+        return changes
+
+    def _get_source_changer(self, call_changer, in_hierarchy):
         finder = occurrences.create_finder(
             self.pycore, self.name, self.pyname, instance=self.primary,
             in_hierarchy=in_hierarchy and self.is_method())
@@ -53,15 +67,11 @@ class ChangeSignature(object):
             constructor_finder = occurrences.create_finder(
                 self.pycore, name, pyname, only_calls=True)
             finder = _MultipleFinders([finder, constructor_finder])
-        for file in resources:
-            job_set.started_job(file.path)
+        def get_changed_source(resource):
             change_calls = _ChangeCallsInModule(
-                self.pycore, finder, file, call_changer)
-            changed_file = change_calls.get_changed_module()
-            if changed_file is not None:
-                changes.add_change(ChangeContents(file, changed_file))
-            job_set.finished_job()
-        return changes
+                self.pycore, finder, resource, call_changer)
+            return change_calls.get_changed_module()
+        return get_changed_source
 
     def get_args(self):
         """Get function arguments.
@@ -119,7 +129,7 @@ class ChangeSignature(object):
         return self._change_calls(changer)
 
     def get_changes(self, changers, in_hierarchy=False, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
         """Get changes caused by this refactoring
 
         `changers` is a list of `_ArgumentChanger`\s.  If `in_hierarchy`
@@ -127,13 +137,21 @@ class ChangeSignature(object):
         the class hierarchy.
         `resources` can be a list of `rope.base.resource.File`\s that
         should be searched for occurrences; if `None` all python files
-        in the project are searched.
+        in the project are searched.  If `processes` is more than one,
+        modules are changed in that many worker processes.
 
         """
         function_changer = _FunctionChangers(self.pyname.get_object(),
                                              self._definfo(), changers)
         return self._change_calls(function_changer, in_hierarchy,
-                                  resources, task_handle)
+                                  resources, task_handle, processes, changers)
+
+
+def _changed_call_sources(project, path, offset, changers, in_hierarchy):
+    signature = ChangeSignature(project, project.get_resource(path), offset)
+    function_changer = _FunctionChangers(signature.pyname.get_object(),
+                                         signature._definfo(), changers)
+    return signature._get_source_changer(function_changer, in_hierarchy)
 
 
 class _FunctionChangers(object):
@@ -1,12 +1,14 @@
 from rope.base import pynames, taskhandle, evaluate, exceptions, worder, utils
 from rope.base.change import ChangeSet, ChangeContents
-from rope.refactor import sourceutils, occurrences
+from rope.refactor import sourceutils, occurrences, parallelchanges
 
 
 class EncapsulateField(object):
 
     def __init__(self, project, resource, offset):
         self.pycore = project.pycore
+        self.original = resource
+        self.offset = offset
         self.name = worder.get_name_at(resource, offset)
         this_pymodule = self.pycore.resource_to_pyobject(resource)
         self.pyname = evaluate.eval_location(this_pymodule, offset)
@@ -16,7 +18,7 @@ class EncapsulateField(object):
         self.resource = self.pyname.get_definition_location()[0].get_resource()
 
     def get_changes(self, getter=None, setter=None, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
         """Get the changes this refactoring makes
 
         If `getter` is not `None`, that will be the name of the
@@ -26,7 +28,8 @@ class EncapsulateField(object):
 
         `resources` can be a list of `rope.base.resource.File`\s that
         the refactoring should be applied on; if `None` all python
-        files in the project are searched.
+        files in the project are searched.  If `processes` is more
+        than one, modules are changed in that many worker processes.
 
         """
         if resources is None:
@@ -38,20 +41,22 @@ class EncapsulateField(object):
             getter = 'get_' + self.name
         if setter is None:
             setter = 'set_' + self.name
+        for file, result in parallelchanges.changed_sources(
+                self.pycore.project, resources,
+                self._get_source_changer(getter, setter), job_set,
+                processes, _encapsulated_sources,
+                (self.original.path, self.offset, getter, setter)):
+            changes.add_change(ChangeContents(file, result))
+        return changes
+
+    def _get_source_changer(self, getter, setter):
         renamer = GetterSetterRenameInModule(
             self.pycore, self.name, self.pyname, getter, setter)
-        for file in resources:
-            job_set.started_job(file.path)
-            if file == self.resource:
-                result = self._change_holding_module(changes, renamer,
-                                                     getter, setter)
-                changes.add_change(ChangeContents(self.resource, result))
-            else:
-                result = renamer.get_changed_module(file)
-                if result is not None:
-                    changes.add_change(ChangeContents(file, result))
-            job_set.finished_job()
-        return changes
+        def get_changed_source(resource):
+            if resource == self.resource:
+                return self._change_holding_module(renamer, getter, setter)
+            return renamer.get_changed_module(resource)
+        return get_changed_source
 
     def get_field_name(self):
         """Get the name of the field to be encapsulated"""
@@ -79,7 +84,7 @@ class EncapsulateField(object):
         pymodule, line = self.pyname.get_definition_location()
         return pymodule.get_scope().get_inner_scope_for_line(line)
 
-    def _change_holding_module(self, changes, renamer, getter, setter):
+    def _change_holding_module(self, renamer, getter, setter):
         pymodule = self.pycore.resource_to_pyobject(self.resource)
         class_scope = self._get_defining_class_scope()
         defining_object = self._get_defining_scope().pyobject
@@ -101,6 +106,11 @@ class EncapsulateField(object):
         return new_source
 
 
+def _encapsulated_sources(project, path, offset, getter, setter):
+    encapsulate = EncapsulateField(project, project.get_resource(path), offset)
+    return encapsulate._get_source_changer(getter, setter)
+
+
 class GetterSetterRenameInModule(object):
 
     def __init__(self, pycore, name, pyname, getter, setter):
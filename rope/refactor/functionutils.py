@@ -68,6 +68,9 @@ class DefinitionInfo(object):
 
 class CallInfo(object):
 
+    __slots__ = ('function_name', 'args', 'keywords', 'args_arg',
+                 'keywords_arg', 'implicit_arg', 'constructor')
+
     def __init__(self, function_name, args, keywords, args_arg,
                  keywords_arg, implicit_arg, constructor):
         self.function_name = function_name
@@ -5,8 +5,9 @@ refactorings or as a separate task.
 
 """
 import rope.base.evaluate
+from rope.base import exceptions, taskhandle
 from rope.base.change import ChangeSet, ChangeContents
-from rope.refactor import occurrences, rename
+from rope.refactor import occurrences, rename, parallelchanges
 from rope.refactor.importutils import module_imports, actions
 from rope.refactor.importutils.importinfo import NormalImport, FromImport
 import rope.base.codeanalyze
@@ -24,9 +25,47 @@ class ImportOrganizer(object):
         self.pycore = project.pycore
         self.import_tools = ImportTools(self.pycore)
 
-    def organize_imports(self, resource, offset=None):
-        return self._perform_command_on_import_tools(
-            self.import_tools.organize_imports, resource, offset)
+    def organize_imports(self, resource, offset=None, processes=1,
+                         task_handle=taskhandle.NullTaskHandle()):
+        """Organize the imports of a module or of all modules in a folder
+
+        For folders, the changes of all of their python files are
+        returned in one `ChangeSet`; the modules found by imports are
+        looked up only once (see `PyCore.cache_module_lookups()`).
+        Modules with syntax errors are skipped.  If `processes` is
+        more than one, modules are organized in that many worker
+        processes.
+
+        """
+        if not resource.is_folder():
+            return self._perform_command_on_import_tools(
+                self.import_tools.organize_imports, resource, offset)
+        resources = [file_ for file_ in self.pycore.get_python_files()
+                     if resource.contains(file_)]
+        changes = ChangeSet('organize imports in <%s>' % resource.path)
+        job_set = task_handle.create_jobset('Organizing imports',
+                                            len(resources))
+        self.pycore.cache_module_lookups()
+        try:
+            for file_, source in parallelchanges.changed_sources(
+                self.project, resources, self._organized_source, job_set,
+                processes, _organized_sources):
+                changes.add_change(ChangeContents(file_, source))
+        finally:
+            self.pycore.cache_module_lookups(False)
+        if changes.changes:
+            return changes
+
+    def _organized_source(self, resource):
+        if 'import' not in resource.read():
+            return None
+        try:
+            pymodule = self.pycore.resource_to_pyobject(resource)
+        except exceptions.ModuleSyntaxError:
+            return None
+        result = self.import_tools.organize_imports(pymodule)
+        if result is not None and result != pymodule.source_code:
+            return result
 
     def expand_star_imports(self, resource, offset=None):
         return self._perform_command_on_import_tools(
@@ -64,6 +103,11 @@ class ImportOrganizer(object):
         return import_filter
 
 
+def _organized_sources(project):
+    project.pycore.cache_module_lookups()
+    return ImportOrganizer(project)._organized_source
+
+
 class ImportTools(object):
 
     def __init__(self, pycore):
@@ -175,7 +219,7 @@ class ImportTools(object):
             if duplicates:
                 module_imports.remove_duplicates()
             source = module_imports.get_changed_source()
-            if source is not None:
+            if source is not None and source != pymodule.source_code:
                 pymodule = self.pycore.get_string_module(
                     source, pymodule.get_resource())
         if selfs:
@@ -199,7 +243,7 @@ class ImportTools(object):
         module_imports = self.module_imports(pymodule, import_filter)
         module_imports.get_self_import_fix_and_rename_list()
         source = module_imports.get_changed_source()
-        if source is not None:
+        if source is not None and source != pymodule.source_code:
             pymodule = self.pycore.get_string_module(source, pymodule.get_resource())
         return pymodule
 
@@ -264,6 +308,16 @@ def get_module_imports(pycore, pymodule):
 
 def add_import(pycore, pymodule, module_name, name=None):
     imports = get_module_imports(pycore, pymodule)
+    imported_name = add_module_import(pycore, imports, module_name, name)
+    return imports.get_changed_source(), imported_name
+
+
+def add_module_import(pycore, imports, module_name, name=None):
+    """Add an import for `module_name` or `name` to `imports`
+
+    `imports` is a `module_imports.ModuleImports`.  It returns the
+    name with which the module or `name` can be accessed.
+    """
     candidates = []
     names = []
     # from mod import name
@@ -295,5 +349,4 @@ def add_import(pycore, pymodule, module_name, name=None):
             selected_import = visitor.import_info
             break
     imports.add_import(selected_import)
-    imported_name = names[candidates.index(selected_import)]
-    return imports.get_changed_source(), imported_name
+    return names[candidates.index(selected_import)]
@@ -30,12 +30,41 @@ class ModuleImports(object):
         return visitor.unbound
 
     def remove_unused_imports(self):
+        if self._are_all_imports_used():
+            return
         can_select = _OneTimeSelector(self._get_unbound_names(self.pymodule))
         visitor = actions.RemovingVisitor(
             self.pycore, self._current_folder(), can_select)
         for import_statement in self.imports:
             import_statement.accept(visitor)
 
+    def _are_all_imports_used(self):
+        """Return `True` if `remove_unused_imports()` changes nothing
+
+        Finding unbound names needs the scopes of the module.  But a
+        name bound only by the imports of the module body is unbound
+        wherever it is used; if all imports are used that way, we can
+        skip that.  `False` means it is not known.
+
+        """
+        names = _find_imported_names_in_use(self.pymodule.get_ast())
+        if names is None:
+            return False
+        can_select = _OneTimeSelector(names)
+        for import_stmt in self.imports:
+            import_info = import_stmt.import_info
+            if isinstance(import_info, importinfo.FromImport):
+                if import_info.is_star_import():
+                    return False
+                if actions._is_future(import_info):
+                    continue
+            for name, alias in import_info.names_and_aliases:
+                if alias is not None:
+                    name = alias
+                if not can_select(name):
+                    return False
+        return True
+
     def get_used_imports(self, defined_pyobject):
         result = []
         can_select = _OneTimeSelector(self._get_unbound_names(defined_pyobject))
@@ -47,9 +76,16 @@ class ModuleImports(object):
                 result.append(new_import)
         return result
 
-    def get_changed_source(self):
+    def get_changed_source(self, source=None):
+        """Return the source of the module with changed imports
+
+        If `source` is given, it is used instead of the source of the
+        module; it should have the same lines and import statements.
+        """
+        if source is None:
+            source = self.pymodule.source_code
         imports = self.imports
-        after_removing = self._remove_imports(imports)
+        after_removing = self._remove_imports(imports, source)
         imports = [stmt for stmt in imports
                    if not stmt.import_info.is_empty()]
 
@@ -88,8 +124,8 @@ class ModuleImports(object):
                 return stmt.get_old_location()[0]
         return cmp(get_location(stmt1), get_location(stmt2))
 
-    def _remove_imports(self, imports):
-        lines = self.pymodule.source_code.splitlines(True)
+    def _remove_imports(self, imports, source):
+        lines = source.splitlines(True)
         after_removing = []
         last_index = 0
         for stmt in imports:
@@ -372,6 +408,93 @@ class _LocalUnboundNameFinder(_UnboundNameFinder):
         self.parent.add_unbound(name)
 
 
+def _find_imported_names_in_use(node):
+    """Return the used primaries whose names are bound only by imports
+
+    Only the imports of the module body are considered.  `None` is
+    returned if names might be bound in ways we cannot see, like by
+    ``exec`` or star imports.
+
+    """
+    finder = _UsedNameFinder()
+    for child in node.body:
+        if isinstance(child, (ast.Import, ast.ImportFrom)):
+            finder._check_star_import(child)
+        else:
+            ast.walk(child, finder)
+    if finder.unknown:
+        return None
+    result = set()
+    for primary in finder.used:
+        if primary.split('.')[0] not in finder.bound:
+            result.add(primary)
+    return result
+
+
+class _UsedNameFinder(object):
+
+    def __init__(self):
+        self.used = set()
+        self.bound = set()
+        self.unknown = False
+
+    def _walk_children(self, node):
+        for child in ast.get_child_nodes(node):
+            ast.walk(child, self)
+
+    def _FunctionDef(self, node):
+        self.bound.add(node.name)
+        self._walk_children(node)
+
+    def _ClassDef(self, node):
+        self.bound.add(node.name)
+        self._walk_children(node)
+
+    def _arguments(self, node):
+        self.bound.update([node.vararg, node.kwarg])
+        self._walk_children(node)
+
+    def _Global(self, node):
+        self.bound.update(node.names)
+
+    def _Exec(self, node):
+        self.unknown = True
+
+    def _Import(self, node):
+        for alias in node.names:
+            self.bound.add((alias.asname or alias.name).split('.')[0])
+
+    def _ImportFrom(self, node):
+        self._check_star_import(node)
+        self._Import(node)
+
+    def _check_star_import(self, node):
+        for alias in node.names:
+            if alias.name == '*':
+                self.unknown = True
+
+    def _Name(self, node):
+        if isinstance(node.ctx, ast.Load):
+            self._add_used(node.id)
+        else:
+            self.bound.add(node.id)
+
+    def _Attribute(self, node):
+        tokens = []
+        while isinstance(node, ast.Attribute):
+            tokens.append(node.attr)
+            node = node.value
+        if isinstance(node, ast.Name):
+            tokens.append(node.id)
+            self._add_used('.'.join(reversed(tokens)))
+        ast.walk(node, self)
+
+    def _add_used(self, primary):
+        tokens = primary.split('.')
+        for index in range(len(tokens)):
+            self.used.add('.'.join(tokens[:index + 1]))
+
+
 class _GlobalImportFinder(object):
 
     def __init__(self, pymodule, pycore):
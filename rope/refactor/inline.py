@@ -23,8 +23,8 @@ import rope.refactor.functionutils
 from rope.base import (pynames, pyobjects, codeanalyze,
                        taskhandle, evaluate, worder, utils)
 from rope.base.change import ChangeSet, ChangeContents
-from rope.refactor import (occurrences, rename, sourceutils,
-                           importutils, move, change_signature)
+from rope.refactor import (occurrences, rename, sourceutils, importutils,
+                           move, change_signature, parallelchanges)
 
 def unique_prefix():
     n = 0
@@ -112,12 +112,13 @@ class InlineMethod(_Inliner):
         return (start_offset, end_offset)
 
     def get_changes(self, remove=True, only_current=False, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
         """Get the changes this refactoring makes
 
         If `remove` is `False` the definition will not be removed.  If
         `only_current` is `True`, the the current occurrence will be
-        inlined, only.
+        inlined, only.  If `processes` is more than one, modules are
+        changed in that many worker processes.
         """
         changes = ChangeSet('Inline method <%s>' % self.name)
         if resources is None:
@@ -128,29 +129,33 @@ class InlineMethod(_Inliner):
                 resources.append(self.resource)
         job_set = task_handle.create_jobset('Collecting Changes',
                                             len(resources))
-        for file in resources:
-            job_set.started_job(file.path)
-            if file == self.resource:
-                changes.add_change(self._defining_file_changes(
-                        changes, remove=remove, only_current=only_current))
-            else:
-                aim = None
-                if only_current and self.original == file:
-                    aim = self.offset
-                handle = _InlineFunctionCallsForModuleHandle(
-                    self.pycore, file, self.others_generator, aim)
-                result = move.ModuleSkipRenamer(
-                    self.occurrence_finder, file, handle).get_changed_module()
-                if result is not None:
-                    result = _add_imports(self.pycore, result,
-                                          file, self.imports)
-                    if remove:
-                        result = _remove_from(self.pycore, self.pyname,
-                                              result, file)
-                    changes.add_change(ChangeContents(file, result))
-            job_set.finished_job()
+        def get_changed_source(resource):
+            return self._get_changed_source(resource, remove, only_current)
+        for file, result in parallelchanges.changed_sources(
+                self.project, resources, get_changed_source, job_set,
+                processes, _inline_method_sources,
+                (self.original.path, self.offset, remove, only_current)):
+            changes.add_change(ChangeContents(file, result))
         return changes
 
+    def _get_changed_source(self, file, remove, only_current):
+        if file == self.resource:
+            return self._defining_file_source(remove, only_current)
+        aim = None
+        if only_current and self.original == file:
+            aim = self.offset
+        handle = _InlineFunctionCallsForModuleHandle(
+            self.pycore, file, self.others_generator, aim)
+        result = move.ModuleSkipRenamer(
+            self.occurrence_finder, file, handle).get_changed_module()
+        if result is not None:
+            result = _add_imports(self.pycore, result,
+                                  file, self.imports)
+            if remove:
+                result = _remove_from(self.pycore, self.pyname,
+                                      result, file)
+        return result
+
     def _get_removed_range(self):
         scope = self.pyfunction.get_scope()
         lines = self.pymodule.lines
@@ -167,7 +172,7 @@ class InlineMethod(_Inliner):
                   len(self.pymodule.source_code))
         return (start, end)
 
-    def _defining_file_changes(self, changes, remove, only_current):
+    def _defining_file_source(self, remove, only_current):
         start_offset, end_offset = self._get_removed_range()
         aim = None
         if only_current:
@@ -182,10 +187,9 @@ class InlineMethod(_Inliner):
         replacement = None
         if remove:
             replacement = self._get_method_replacement()
-        result = move.ModuleSkipRenamer(
+        return move.ModuleSkipRenamer(
             self.occurrence_finder, self.resource, handle, start_offset,
             end_offset, replacement).get_changed_module()
-        return ChangeContents(self.resource, result)
 
     def _get_method_replacement(self):
         if self._is_the_last_method_of_a_class():
@@ -601,6 +605,12 @@ def _add_imports(pycore, source, resource, imports):
     import_tools = importutils.ImportTools(pycore)
     return import_tools.organize_imports(pymodule, unused=False, sort=False)
 
+def _inline_method_sources(project, path, offset, remove, only_current):
+    inliner = InlineMethod(project, project.get_resource(path), offset)
+    def get_changed_source(resource):
+        return inliner._get_changed_source(resource, remove, only_current)
+    return get_changed_source
+
 def _get_pyname(pycore, resource, offset):
     pymodule = pycore.resource_to_pyobject(resource)
     pyname = evaluate.eval_location(pymodule, offset)
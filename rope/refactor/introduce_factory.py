@@ -2,7 +2,8 @@ import rope.base.exceptions
 import rope.base.pyobjects
 from rope.base import taskhandle, evaluate
 from rope.base.change import (ChangeSet, ChangeContents)
-from rope.refactor import rename, occurrences, sourceutils, importutils
+from rope.refactor import (rename, occurrences, sourceutils,
+                           importutils, parallelchanges)
 
 
 class IntroduceFactory(object):
@@ -10,6 +11,7 @@ class IntroduceFactory(object):
     def __init__(self, project, resource, offset):
         self.pycore = project.pycore
         self.offset = offset
+        self.original = resource
 
         this_pymodule = self.pycore.resource_to_pyobject(resource)
         self.old_pyname = evaluate.eval_location(this_pymodule, offset)
@@ -22,7 +24,7 @@ class IntroduceFactory(object):
         self.resource = self.pymodule.get_resource()
 
     def get_changes(self, factory_name, global_factory=False, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
         """Get the changes this refactoring makes
 
         `factory_name` indicates the name of the factory function to
@@ -31,7 +33,8 @@ class IntroduceFactory(object):
 
         `resources` can be a list of `rope.base.resource.File`\s that
         this refactoring should be applied on; if `None` all python
-        files in the project are searched.
+        files in the project are searched.  If `processes` is more
+        than one, modules are changed in that many worker processes.
 
         """
         if resources is None:
@@ -39,41 +42,39 @@ class IntroduceFactory(object):
         changes = ChangeSet('Introduce factory method <%s>' % factory_name)
         job_set = task_handle.create_jobset('Collecting Changes',
                                             len(resources))
-        self._change_module(resources, changes, factory_name,
-                            global_factory, job_set)
+        def get_changed_source(resource):
+            return self._change_module(resource, factory_name,
+                                       global_factory)
+        for file_, result in parallelchanges.changed_sources(
+                self.pycore.project, resources, get_changed_source, job_set,
+                processes, _factory_sources,
+                (self.original.path, self.offset, factory_name,
+                 global_factory)):
+            changes.add_change(ChangeContents(file_, result))
         return changes
 
     def get_name(self):
         """Return the name of the class"""
         return self.old_name
 
-    def _change_module(self, resources, changes,
-                       factory_name, global_, job_set):
+    def _change_module(self, file_, factory_name, global_):
+        if file_ == self.resource:
+            return self._change_resource(factory_name, global_)
         if global_:
             replacement = '__rope_factory_%s_' % factory_name
         else:
             replacement = self._new_function_name(factory_name, global_)
-
-        for file_ in resources:
-            job_set.started_job(file_.path)
-            if file_ == self.resource:
-                self._change_resource(changes, factory_name, global_)
-                job_set.finished_job()
-                continue
-            changed_code = self._rename_occurrences(file_, replacement,
-                                                    global_)
-            if changed_code is not None:
-                if global_:
-                    new_pymodule = self.pycore.get_string_module(changed_code,
-                                                                 self.resource)
-                    modname = self.pycore.modname(self.resource)
-                    changed_code, imported = importutils.add_import(
-                        self.pycore, new_pymodule, modname, factory_name)
-                    changed_code = changed_code.replace(replacement, imported)
-                changes.add_change(ChangeContents(file_, changed_code))
-            job_set.finished_job()
-
-    def _change_resource(self, changes, factory_name, global_):
+        changed_code = self._rename_occurrences(file_, replacement, global_)
+        if changed_code is not None and global_:
+            new_pymodule = self.pycore.get_string_module(changed_code,
+                                                         self.resource)
+            modname = self.pycore.modname(self.resource)
+            changed_code, imported = importutils.add_import(
+                self.pycore, new_pymodule, modname, factory_name)
+            changed_code = changed_code.replace(replacement, imported)
+        return changed_code
+
+    def _change_resource(self, factory_name, global_):
         class_scope = self.old_pyname.get_object().get_scope()
         source_code = self._rename_occurrences(
             self.resource, self._new_function_name(factory_name,
@@ -89,7 +90,7 @@ class IntroduceFactory(object):
         result += self._get_factory_method(lines, class_scope,
                                            factory_name, global_)
         result += source_code[start:]
-        changes.add_change(ChangeContents(self.resource, result))
+        return result
 
     def _get_insertion_offset(self, class_scope, lines):
         start_line = class_scope.get_end()
@@ -130,4 +131,12 @@ class IntroduceFactory(object):
                                          replace_primary=global_factory)
         return result
 
+
+def _factory_sources(project, path, offset, factory_name, global_):
+    introducer = IntroduceFactory(project, project.get_resource(path), offset)
+    def get_changed_source(resource):
+        return introducer._change_module(resource, factory_name, global_)
+    return get_changed_source
+
+
 IntroduceFactoryRefactoring = IntroduceFactory
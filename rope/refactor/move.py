@@ -225,8 +225,6 @@ class MoveGlobal(object):
 
     def get_changes(self, dest, resources=None,
                     task_handle=taskhandle.NullTaskHandle()):
-        if resources is None:
-            resources = self.pycore.get_python_files()
         if dest is None or not dest.exists():
             raise exceptions.RefactoringError(
                 'Move destination does not exist.')
@@ -238,6 +236,10 @@ class MoveGlobal(object):
         if self.source == dest:
             raise exceptions.RefactoringError(
                 'Moving global elements to the same module.')
+        if resources is None:
+            resources = self.pycore.import_graph.get_dependents(self.source)
+            if dest.project == self.pycore.project and dest not in resources:
+                resources.append(dest)
         return self._calculate_changes(dest, resources, task_handle)
 
     def _calculate_changes(self, dest, resources, task_handle):
@@ -251,27 +253,47 @@ class MoveGlobal(object):
             elif file_ == dest:
                 changes.add_change(self._dest_module_changes(dest))
             elif self.tools.occurs_in_module(resource=file_):
-                pymodule = self.pycore.resource_to_pyobject(file_)
-                # Changing occurrences
-                placeholder = '__rope_renaming_%s_' % self.old_name
-                source = self.tools.rename_in_module(placeholder,
-                                                     resource=file_)
-                should_import = source is not None
-                # Removing out of date imports
-                pymodule = self.tools.new_pymodule(pymodule, source)
-                source = self.tools.remove_old_imports(pymodule)
-                # Adding new import
-                if should_import:
-                    pymodule = self.tools.new_pymodule(pymodule, source)
-                    source, imported = importutils.add_import(
-                        self.pycore, pymodule, self._new_modname(dest), self.old_name)
-                    source = source.replace(placeholder, imported)
-                source = self.tools.new_source(pymodule, source)
-                if source != file_.read():
-                    changes.add_change(ChangeContents(file_, source))
+                change = self._importing_module_changes(file_, dest)
+                if change is not None:
+                    changes.add_change(change)
             job_set.finished_job()
         return changes
 
+    def _importing_module_changes(self, resource, dest):
+        """Change a module that uses the moving element
+
+        The module is usually parsed only once.  Renaming occurrences
+        outside the lines of import statements does not change the
+        lines of the module or its import statements; so they are
+        changed on the renamed source.
+        """
+        pymodule = self.pycore.resource_to_pyobject(resource)
+        old_source = pymodule.source_code
+        # Changing occurrences
+        placeholder = '__rope_renaming_%s_' % self.old_name
+        source = self.tools.rename_in_module(placeholder, pymodule=pymodule)
+        should_import = source is not None
+        source = self.tools.new_source(pymodule, source)
+        module_imports = self.import_tools.module_imports(pymodule)
+        if source != old_source and \
+           _changes_import_lines(module_imports, old_source, source):
+            pymodule = self.tools.new_pymodule(pymodule, source)
+            module_imports = self.import_tools.module_imports(pymodule)
+        # Removing out of date imports
+        changed = self.tools.filter_old_imports(pymodule, module_imports)
+        # Adding new import
+        if should_import:
+            imported = importutils.add_module_import(
+                self.pycore, module_imports,
+                self._new_modname(dest), self.old_name)
+            changed = True
+        if changed:
+            source = module_imports.get_changed_source(source)
+        if should_import:
+            source = source.replace(placeholder, imported)
+        if source != old_source:
+            return ChangeContents(resource, source)
+
     def _source_module_changes(self, dest):
         placeholder = '__rope_moving_%s_' % self.old_name
         handle = _ChangeMoveOccurrencesHandle(placeholder)
@@ -387,7 +409,7 @@ class MoveModule(object):
                     task_handle=taskhandle.NullTaskHandle()):
         moving_pyobject = self.old_pyname.get_object()
         if resources is None:
-            resources = self.pycore.get_python_files()
+            resources = self.pycore.import_graph.get_dependents(self.source)
         if dest is None or not dest.is_folder():
             raise exceptions.RefactoringError(
                 'Move destination for modules should be packages.')
@@ -480,6 +502,16 @@ class _MoveTools(object):
     def remove_old_imports(self, pymodule):
         old_source = pymodule.source_code
         module_with_imports = self.import_tools.module_imports(pymodule)
+        self.filter_old_imports(pymodule, module_with_imports)
+        new_source = module_with_imports.get_changed_source()
+        if old_source != new_source:
+            return new_source
+
+    def filter_old_imports(self, pymodule, module_with_imports):
+        """Remove the imports of the old name from `module_with_imports`
+
+        Returns `True` if an import is removed.
+        """
         class CanSelect(object):
             changed = False
             old_name = self.old_name
@@ -496,9 +528,7 @@ class _MoveTools(object):
                 return True
         can_select = CanSelect()
         module_with_imports.filter_names(can_select)
-        new_source = module_with_imports.get_changed_source()
-        if old_source != new_source:
-            return new_source
+        return can_select.changed
 
     def rename_in_module(self, new_name, pymodule=None,
                           imports=False, resource=None):
@@ -541,6 +571,22 @@ def _add_imports_to_module(import_tools, pymodule, new_imports):
     return module_with_imports.get_changed_source()
 
 
+def _changes_import_lines(module_imports, old_source, new_source):
+    """Return `True` if `new_source` changes lines of import statements
+
+    It also returns `True` if the number of lines is changed.
+    """
+    old_lines = old_source.split('\n')
+    new_lines = new_source.split('\n')
+    if len(old_lines) != len(new_lines):
+        return True
+    for import_stmt in module_imports.imports:
+        start, end = import_stmt.get_old_location()
+        if old_lines[start - 1:end - 1] != new_lines[start - 1:end - 1]:
+            return True
+    return False
+
+
 def moving_code_with_imports(pycore, resource, source):
     import_tools = importutils.ImportTools(pycore)
     pymodule = pycore.get_string_module(source, resource)
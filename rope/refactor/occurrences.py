@@ -1,7 +1,6 @@
-import re
-
 import rope.base.pynames
-from rope.base import pynames, pyobjects, codeanalyze, evaluate, exceptions, utils, worder
+from rope.base import (pynames, pyobjects, evaluate, exceptions,
+                       simplify, utils, worder)
 
 
 class Finder(object):
@@ -73,6 +72,14 @@ def create_finder(pycore, name, pyname, only_calls=False, imports=True,
 
 class Occurrence(object):
 
+    __slots__ = ('tools', 'offset', 'resource',
+                 utils.saved_name('get_word_range'),
+                 utils.saved_name('get_primary_range'),
+                 utils.saved_name('get_pyname'),
+                 utils.saved_name('get_primary_and_pyname'),
+                 utils.saved_name('is_in_import_statement'),
+                 utils.saved_name('lineno'))
+
     def __init__(self, tools, offset):
         self.tools = tools
         self.offset = offset
@@ -231,10 +238,6 @@ class _TextualFinder(object):
     def __init__(self, name, docs=False):
         self.name = name
         self.docs = docs
-        self.comment_pattern = _TextualFinder.any('comment', [r'#[^\n]*'])
-        self.string_pattern = _TextualFinder.any(
-            'string', [codeanalyze.get_string_pattern()])
-        self.pattern = self._get_occurrence_pattern(self.name)
 
     def find_offsets(self, source):
         if not self._fast_file_query(source):
@@ -242,15 +245,15 @@ class _TextualFinder(object):
         if self.docs:
             searcher = self._normal_search
         else:
-            searcher = self._re_search
+            searcher = self._code_search
         for matched in searcher(source):
             yield matched
 
-    def _re_search(self, source):
-        for match in self.pattern.finditer(source):
-            for key, value in match.groupdict().items():
-                if value and key == 'occurrence':
-                    yield match.start(key)
+    def _code_search(self, source):
+        simplified = simplify.analyze(source)
+        for offset in self._normal_search(source):
+            if simplified.get_ignored_region(offset) is None:
+                yield offset
 
     def _normal_search(self, source):
         current = 0
@@ -280,17 +283,6 @@ class _TextualFinder(object):
         else:
             return pymodule.source_code
 
-    def _get_occurrence_pattern(self, name):
-        occurrence_pattern = _TextualFinder.any('occurrence',
-                                                 ['\\b' + name + '\\b'])
-        pattern = re.compile(occurrence_pattern + '|' + self.comment_pattern +
-                             '|' + self.string_pattern)
-        return pattern
-
-    @staticmethod
-    def any(name, list_):
-        return '(?P<%s>' % name + '|'.join(list_) + ')'
-
 
 class _OccurrenceToolsCreator(object):
 
@@ -0,0 +1,72 @@
+"""Computing the changes of refactorings module by module
+
+Many refactorings change each module independently of the others.
+`changed_sources()` computes the new sources of these modules either
+in the current process or in a pool of worker processes (see
+`rope.base.parallel`).  The pynames of a refactoring cannot be sent
+to workers; each worker creates the refactoring again using a
+`factory` function and picklable arguments, like the path and the
+offset of the refactored name, once for all of the modules it
+changes.
+
+"""
+from rope.base import parallel
+
+
+def changed_sources(project, resources, get_changed_source, job_set,
+                    processes=1, factory=None, args=()):
+    """Generate ``(resource, new_source)`` for changed `resources`
+
+    `get_changed_source(resource)` should return the new source of a
+    module or `None` if it does not change.  If `processes` is more
+    than one and `factory` is given, modules are changed in that many
+    worker processes; ``factory(worker_project, *args)`` should return
+    a function like `get_changed_source` in a worker.  Since workers
+    read modules from disk, modules are changed in this process when
+    the project has an overlay.
+
+    """
+    if processes is None or processes <= 1 or factory is None or \
+       len(resources) < 2 or project.overlay is not None:
+        for resource in resources:
+            job_set.started_job(resource.path)
+            result = get_changed_source(resource)
+            if result is not None:
+                yield resource, result
+            job_set.finished_job()
+        return
+    results = parallel.imap_unordered(
+        project, processes, _changed_source,
+        [(resource.path,) for resource in resources],
+        _init_worker, (factory, args))
+    try:
+        for path, failed, result in results:
+            job_set.started_job(path)
+            resource = project.get_resource(path)
+            if failed:
+                # changing again to raise the same errors
+                result = get_changed_source(resource)
+            if result is not None:
+                yield resource, result
+            job_set.finished_job()
+    finally:
+        results.close()
+
+
+_factory = None
+_get_changed_source = None
+
+def _init_worker(project, factory, args):
+    global _factory, _get_changed_source
+    _factory = (factory, args)
+    _get_changed_source = None
+
+def _changed_source(project, path):
+    global _get_changed_source
+    try:
+        if _get_changed_source is None:
+            factory, args = _factory
+            _get_changed_source = factory(project, *args)
+        return path, False, _get_changed_source(project.get_resource(path))
+    except Exception:
+        return path, True, None
@@ -1,20 +1,24 @@
+import bisect
 import collections
+import cStringIO
 import re
+import tokenize
 import warnings
 
 from rope.base import ast, codeanalyze, exceptions
 
 
-def get_patched_ast(source, sorted_children=False):
+def get_patched_ast(source, sorted_children=False, lazy=False):
     """Adds ``region`` and ``sorted_children`` fields to nodes
 
     Adds ``sorted_children`` field only if `sorted_children` is True.
+    See `patch_ast()` for `lazy`.
 
     """
-    return patch_ast(ast.parse(source), source, sorted_children)
+    return patch_ast(ast.parse(source), source, sorted_children, lazy)
 
 
-def patch_ast(node, source, sorted_children=False):
+def patch_ast(node, source, sorted_children=False, lazy=False):
     """Patches the given node
 
     After calling, each node in `node` will have a new field named
@@ -26,9 +30,20 @@ def patch_ast(node, source, sorted_children=False):
     nodes as well as whitespaces and comments that occur between
     them.
 
+    If `lazy` is true, nodes are patched only when their region is
+    asked using `node_region()`; the innermost statement containing
+    the node is patched then.
+
     """
     if hasattr(node, 'region'):
         return node
+    if hasattr(node, '_patcher'):
+        if not lazy:
+            node._patcher[0].patch(node)
+        return node
+    if lazy:
+        _LazyPatcher(node, source, sorted_children)
+        return node
     walker = _PatchingASTWalker(source, children=sorted_children)
     ast.call_for_nodes(node, walker)
     return node
@@ -36,7 +51,11 @@ def patch_ast(node, source, sorted_children=False):
 
 def node_region(patched_ast_node):
     """Get the region of a patched ast node"""
-    return patched_ast_node.region
+    try:
+        return patched_ast_node.region
+    except AttributeError:
+        patched_ast_node._patcher[0].patch(patched_ast_node)
+        return patched_ast_node.region
 
 
 def write_ast(patched_ast_node):
@@ -45,6 +64,7 @@ def write_ast(patched_ast_node):
     If the node is patched with sorted_children turned off you can use
     `node_region` function for obtaining code using module source code.
     """
+    node_region(patched_ast_node)
     result = []
     for child in patched_ast_node.sorted_children:
         if isinstance(child, ast.AST):
@@ -58,11 +78,116 @@ class MismatchedTokenError(exceptions.RopeError):
     pass
 
 
+class _LazyPatcher(object):
+    """Patch statements of an AST when their regions are needed
+
+    Each node gets a ``_patcher`` field; a ``(patcher, statement,
+    positions)`` tuple in which `statement` is the innermost
+    statement containing the node and `positions` is the list of
+    ``(body, index)`` tuples of that statement and its ancestors.
+    Statements are patched independently, starting from their first
+    tokens (see `_get_start()`).
+    """
+
+    def __init__(self, node, source, sorted_children):
+        self.source = source
+        self.starts = None
+        self.walker = _PatchingASTWalker(source, children=sorted_children,
+                                         lazy=True)
+        self._set_patcher(node, (self, node, ()))
+
+    def _set_patcher(self, node, patcher):
+        node._patcher = patcher
+        for child in ast.get_children(node):
+            if isinstance(child, (list, tuple)):
+                for index, item in enumerate(child):
+                    if isinstance(item, ast.stmt):
+                        positions = patcher[2] + ((child, index),)
+                        self._set_patcher(item, (self, item, positions))
+                    elif self._is_patched(item):
+                        self._set_patcher(item, patcher)
+            elif self._is_patched(child):
+                self._set_patcher(child, patcher)
+
+    def _is_patched(self, node):
+        return isinstance(node, ast.AST) and \
+               not isinstance(node, self._singletons)
+
+    # these nodes are shared and are not patched
+    _singletons = (ast.expr_context, ast.operator, ast.boolop,
+                   ast.unaryop, ast.cmpop)
+
+    def patch(self, node):
+        """Patch the innermost statement containing `node`"""
+        statement, positions = node._patcher[1:]
+        walker = self.walker
+        if positions:
+            walker.source.offset = self._get_start(statement)
+        else:
+            walker.source.offset = 0
+        walker.children_stack = [collections.deque(body[index + 1:])
+                                 for body, index in positions]
+        ast.call_for_nodes(statement, walker)
+
+    def _get_start(self, statement):
+        """Return the offset of the first token of `statement`
+
+        The ``lineno`` and ``col_offset`` of ``elif`` statements point
+        to their conditions and those of statements that start with a
+        multi-line string point to its end; so the last offset in
+        which a statement can start is used.
+        """
+        offset = self.walker.lines.get_line_start(statement.lineno) + \
+                 statement.col_offset
+        if self.starts is None:
+            self.starts = self._find_starts()
+        index = bisect.bisect(self.starts, offset)
+        if index > 0:
+            return self.starts[index - 1]
+        return offset
+
+    def _find_starts(self):
+        """Find the offsets in which statements can start
+
+        These are the starts of logical lines and the tokens after
+        semicolons and colons outside parentheses.
+        """
+        result = []
+        lines = self.walker.lines
+        depth = 0
+        starting = True
+        readline = cStringIO.StringIO(self.source).readline
+        try:
+            for token in tokenize.generate_tokens(readline):
+                kind, text, (row, column) = token[:3]
+                if kind in (tokenize.COMMENT, tokenize.NL,
+                            tokenize.ENDMARKER):
+                    continue
+                if kind in (tokenize.NEWLINE, tokenize.INDENT,
+                            tokenize.DEDENT):
+                    starting = True
+                    continue
+                if starting:
+                    result.append(lines.get_line_start(row) + column)
+                    starting = False
+                if kind == tokenize.OP:
+                    if text in '([{':
+                        depth += 1
+                    elif text in ')]}':
+                        depth -= 1
+                    elif text in ';:' and depth == 0:
+                        starting = True
+        except (tokenize.TokenError, IndentationError):
+            pass
+        return result
+
+
 class _PatchingASTWalker(object):
 
-    def __init__(self, source, children=False):
+    def __init__(self, source, children=False, lazy=False):
         self.source = _Source(source)
         self.children = children
+        self.lazy = lazy
         self.lines = codeanalyze.SourceLinesAdapter(source)
         self.children_stack = []
 
@@ -82,6 +207,10 @@ class _PatchingASTWalker(object):
 
     def _handle(self, node, base_children, eat_parens=False, eat_spaces=False):
         if hasattr(node, 'region'):
+            if self.lazy:
+                # patched before its parent
+                self.source.offset = node.region[1]
+                return
             # ???: The same node was seen twice; what should we do?
             warnings.warn(
                 'Node <%s> has been already patched; please report!' %
@@ -82,7 +82,11 @@ class Rename(object):
         if _is_local(self.old_pyname):
             resources = [self.resource]
         if resources is None:
-            resources = self.pycore.get_python_files()
+            if self._is_renaming_a_module() and not docs and unsure is None:
+                module = self.old_pyname.get_object().get_resource()
+                resources = self.pycore.import_graph.get_dependents(module)
+            else:
+                resources = self.pycore.get_python_files()
         changes = ChangeSet('Renaming <%s> to <%s>' %
                             (self.old_name, new_name))
         finder = occurrences.create_finder(
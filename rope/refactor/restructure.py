@@ -1,7 +1,8 @@
 import warnings
 
 from rope.base import change, taskhandle, builtins, ast, codeanalyze
-from rope.refactor import patchedast, similarfinder, sourceutils
+from rope.refactor import (patchedast, similarfinder, sourceutils,
+                           parallelchanges)
 from rope.refactor.importutils import module_imports
 
 
@@ -92,12 +93,16 @@ class Restructure(object):
         self.template = similarfinder.CodeTemplate(self.goal)
 
     def get_changes(self, checks=None, imports=None, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
         """Get the changes needed by this restructuring
 
         `resources` can be a list of `rope.base.resources.File`\s to
         apply the restructuring on.  If `None`, the restructuring will
-        be applied to all python files.
+        be applied to all python files.  Modules that do not contain
+        the names, attributes and keywords of the pattern are skipped
+        without being parsed.  If `processes` is more than one, the
+        remaining modules are restructured in that many worker
+        processes unless custom `wildcards` were given.
 
         `checks` argument has been deprecated.  Use the `args` argument
         of the constructor.  The usage of::
@@ -136,22 +141,50 @@ class Restructure(object):
         else:
             files = self.pycore.get_python_files()
         job_set = task_handle.create_jobset('Collecting Changes', len(files))
+        names = similarfinder.get_literal_names(self.pattern)
+        candidates = []
         for resource in files:
-            job_set.started_job(resource.path)
-            pymodule = self.pycore.resource_to_pyobject(resource)
-            finder = similarfinder.SimilarFinder(pymodule,
-                                                 wildcards=self.wildcards)
-            matches = list(finder.get_matches(self.pattern, self.args))
-            computer = self._compute_changes(matches, pymodule)
-            result = computer.get_changed()
-            if result is not None:
-                imported_source = self._add_imports(resource, result,
-                                                    self.imports)
-                changes.add_change(change.ChangeContents(resource,
-                                                         imported_source))
-            job_set.finished_job()
+            if self._might_match(resource.read(), names):
+                candidates.append(resource)
+            else:
+                job_set.started_job(resource.path)
+                self._check_syntax(resource)
+                job_set.finished_job()
+        factory = None
+        if self.wildcards is None:
+            factory = _restructuring_sources
+        for resource, result in parallelchanges.changed_sources(
+                self.pycore.project, candidates, self._get_changed_source,
+                job_set, processes, factory,
+                (self.pattern, self.goal, self.args, self.imports)):
+            changes.add_change(change.ChangeContents(resource, result))
         return changes
 
+    def _might_match(self, source, names):
+        for name in names:
+            if name not in source:
+                return False
+        return True
+
+    def _check_syntax(self, resource):
+        """Raise `ModuleSyntaxError` for skipped modules, too
+
+        Unless ``ignore_syntax_errors`` project config is set; the
+        modules are cached, so they are parsed once in a session.
+        """
+        if not self.pycore.project.prefs.get('ignore_syntax_errors', False):
+            self.pycore.resource_to_pyobject(resource)
+
+    def _get_changed_source(self, resource):
+        pymodule = self.pycore.resource_to_pyobject(resource)
+        finder = similarfinder.SimilarFinder(pymodule,
+                                             wildcards=self.wildcards)
+        matches = list(finder.get_matches(self.pattern, self.args))
+        computer = self._compute_changes(matches, pymodule)
+        result = computer.get_changed()
+        if result is not None:
+            return self._add_imports(resource, result, self.imports)
+
     def _compute_changes(self, matches, pymodule):
         return _ChangeComputer(
             pymodule.source_code, pymodule.get_ast(),
@@ -211,7 +244,7 @@ def replace(code, pattern, goal):
     """used by other refactorings"""
     finder = similarfinder.RawSimilarFinder(code)
     matches = list(finder.get_matches(pattern))
-    ast = patchedast.get_patched_ast(code)
+    ast = patchedast.get_patched_ast(code, lazy=True)
     lines = codeanalyze.SourceLinesAdapter(code)
     template = similarfinder.CodeTemplate(goal)
     computer = _ChangeComputer(code, ast, lines, template, matches)
@@ -305,3 +338,8 @@ class _ChangeComputer(object):
                     result.extend(self._get_nearest_roots(child))
             self._nearest_roots[node] = result
         return self._nearest_roots[node]
+
+
+def _restructuring_sources(project, pattern, goal, args, imports):
+    restructuring = Restructure(project, pattern, goal, args, imports)
+    return restructuring._get_changed_source
@@ -2,7 +2,7 @@
 import re
 
 import rope.refactor.wildcards
-from rope.base import codeanalyze, evaluate, exceptions, ast, builtins
+from rope.base import codeanalyze, evaluate, exceptions, ast, builtins, utils
 from rope.refactor import (patchedast, sourceutils, occurrences,
                            wildcards, importutils)
 
@@ -77,8 +77,7 @@ class RawSimilarFinder(object):
     def _init_using_ast(self, node, source):
         self.source = source
         self._matched_asts = {}
-        if not hasattr(node, 'region'):
-            patchedast.patch_ast(node, source)
+        patchedast.patch_ast(node, source, lazy=True)
         self.ast = node
 
     def get_matches(self, code, start=0, end=None, skip=None):
@@ -103,11 +102,15 @@ class RawSimilarFinder(object):
     def _get_matched_asts(self, code):
         if code not in self._matched_asts:
             wanted = self._create_pattern(code)
-            matches = _ASTMatcher(self.ast, wanted,
-                                  self.does_match).find_matches()
+            matches = _ASTMatcher(self.ast, wanted, self.does_match,
+                                  self._get_index()).find_matches()
             self._matched_asts[code] = matches
         return self._matched_asts[code]
 
+    @utils.saveit
+    def _get_index(self):
+        return _NodeIndex(self.ast)
+
     def _create_pattern(self, expression):
         expression = self._replace_wildcards(expression)
         node = ast.parse(expression)
@@ -121,57 +124,106 @@ class RawSimilarFinder(object):
         return wanted
 
     def _replace_wildcards(self, expression):
-        ropevar = _RopeVariable()
-        template = CodeTemplate(expression)
-        mapping = {}
-        for name in template.get_names():
-            mapping[name] = ropevar.get_var(name)
-        return template.substitute(mapping)
+        return _replace_wildcards(expression)
 
 
 class _ASTMatcher(object):
 
-    def __init__(self, body, pattern, does_match):
+    def __init__(self, body, pattern, does_match, index=None):
         """Searches the given pattern in the body AST.
 
         body is an AST node and pattern can be either an AST node or
-        a list of ASTs nodes
+        a list of ASTs nodes.  `index` is the `_NodeIndex` of body;
+        it can be shared between matchers of the same body.
         """
         self.body = body
         self.pattern = pattern
         self.matches = None
         self.ropevar = _RopeVariable()
         self.matches_callback = does_match
+        if index is None:
+            index = _NodeIndex(body)
+        self.index = index
 
     def find_matches(self):
         if self.matches is None:
             self.matches = []
-            ast.call_for_nodes(self.body, self._check_node, recursive=True)
+            if isinstance(self.pattern, list):
+                self._find_statements()
+            else:
+                self._find_expressions()
         return self.matches
 
-    def _check_node(self, node):
-        if isinstance(self.pattern, list):
-            self._check_statements(node)
+    def _find_expressions(self):
+        if self._is_wildcard(self.pattern):
+            candidates = self.index.nodes
         else:
-            self._check_expression(node)
+            candidates = self.index.get_nodes(self.pattern.__class__)
+        fixed = self._get_fixed_hashes(self.pattern)
+        for node in candidates:
+            if self._might_match(fixed, node):
+                self._check_expression(node)
+
+    def _find_statements(self):
+        count = len(self.pattern)
+        first = self.pattern[0]
+        fixed = self._get_fixed_hashes(first)
+        for nodes, index in self.index.get_list_items(first.__class__):
+            if len(nodes) - index >= count and \
+               self._might_match(fixed, nodes[index]):
+                current_stmts = nodes[index:index + count]
+                mapping = {}
+                if self._match_stmts(current_stmts, mapping):
+                    self.matches.append(StatementMatch(current_stmts, mapping))
 
     def _check_expression(self, node):
         mapping = {}
         if self._match_nodes(self.pattern, node, mapping):
             self.matches.append(ExpressionMatch(node, mapping))
 
-    def _check_statements(self, node):
-        for child in ast.get_children(node):
-            if isinstance(child, (list, tuple)):
-                self.__check_stmt_list(child)
+    def _get_fixed_hashes(self, expected):
+        """Return the structural hashes `expected` requires
 
-    def __check_stmt_list(self, nodes):
-        for index in range(len(nodes)):
-            if len(nodes) - index >= len(self.pattern):
-                current_stmts = nodes[index:index + len(self.pattern)]
-                mapping = {}
-                if self._match_stmts(current_stmts, mapping):
-                    self.matches.append(StatementMatch(current_stmts, mapping))
+        If `expected` has no wildcards, a ``(None, hash)`` tuple is
+        returned; otherwise the hashes of children without wildcards
+        are returned with their indices.
+        """
+        if not self._has_wildcards(expected):
+            return [(None, self.index.get_hash(expected))]
+        result = []
+        if isinstance(expected, ast.AST) and not self._is_wildcard(expected):
+            for index, child in enumerate(self._get_children(expected)):
+                if not self._has_wildcards(child):
+                    result.append((index, self.index.get_hash(child)))
+        return result
+
+    def _might_match(self, fixed, node):
+        """Compare the hashes of `_get_fixed_hashes()` with `node`"""
+        if not fixed:
+            return True
+        if fixed[0][0] is None:
+            return self.index.get_hash(node) == fixed[0][1]
+        children = self._get_children(node)
+        for index, hash_ in fixed:
+            if index >= len(children) or \
+               self.index.get_hash(children[index]) != hash_:
+                return False
+        return True
+
+    def _is_wildcard(self, node):
+        return isinstance(node, ast.Name) and self.ropevar.is_var(node.id)
+
+    def _has_wildcards(self, node):
+        if isinstance(node, (list, tuple)):
+            for child in node:
+                if self._has_wildcards(child):
+                    return True
+            return False
+        if not isinstance(node, ast.AST):
+            return False
+        if self._is_wildcard(node):
+            return True
+        return self._has_wildcards(self._get_children(node))
 
     def _match_nodes(self, expected, node, mapping):
         if isinstance(expected, ast.Name):
@@ -227,6 +279,51 @@ class _ASTMatcher(object):
             return self._match_nodes(mapping[name], node2, {})
 
 
+class _NodeIndex(object):
+    """An index of the nodes of an AST
+
+    Nodes are indexed by their class and items of child lists by
+    their class, in the order `_ASTMatcher` used to visit them.
+    Structural hashes of nodes are computed on demand; equal nodes
+    have equal hashes, ignoring `ast.expr_context` children.
+    """
+
+    def __init__(self, body):
+        self.nodes = []
+        self.by_class = {}
+        self.list_items = {}
+        self.hashes = {}
+        ast.call_for_nodes(body, self._add_node, recursive=True)
+
+    def _add_node(self, node):
+        self.nodes.append(node)
+        self.by_class.setdefault(node.__class__, []).append(node)
+        for child in ast.get_children(node):
+            if isinstance(child, (list, tuple)):
+                for index, item in enumerate(child):
+                    self.list_items.setdefault(
+                        item.__class__, []).append((child, index))
+
+    def get_nodes(self, node_class):
+        return self.by_class.get(node_class, [])
+
+    def get_list_items(self, item_class):
+        """Return ``(list, index)`` tuples of `item_class` items"""
+        return self.list_items.get(item_class, [])
+
+    def get_hash(self, node):
+        if isinstance(node, ast.AST):
+            if node not in self.hashes:
+                children = [self.get_hash(child)
+                            for child in ast.get_children(node)
+                            if not isinstance(child, ast.expr_context)]
+                self.hashes[node] = hash((node.__class__, tuple(children)))
+            return self.hashes[node]
+        if isinstance(node, (list, tuple)):
+            return hash(tuple([self.get_hash(child) for child in node]))
+        return hash(node)
+
+
 class Match(object):
 
     def __init__(self, mapping):
@@ -247,7 +344,7 @@ class ExpressionMatch(Match):
         self.ast = ast
 
     def get_region(self):
-        return self.ast.region
+        return patchedast.node_region(self.ast)
 
 
 class StatementMatch(Match):
@@ -257,7 +354,8 @@ class StatementMatch(Match):
         self.ast_list = ast_list
 
     def get_region(self):
-        return self.ast_list[0].region[0], self.ast_list[-1].region[1]
+        return (patchedast.node_region(self.ast_list[0])[0],
+                patchedast.node_region(self.ast_list[-1])[1])
 
 
 class CodeTemplate(object):
@@ -336,6 +434,40 @@ class _RopeVariable(object):
         return name.startswith(self._any_prefix)
 
 
+def get_literal_names(code):
+    """Return the names that appear in any match of `code`
+
+    These are the names, attributes and keyword arguments of the
+    pattern that are not wildcards.  A source that does not contain
+    all of them cannot match the pattern.
+
+    """
+    ropevar = _RopeVariable()
+    result = set()
+    node = ast.parse(_replace_wildcards(code))
+    def add_names(node):
+        name = None
+        if isinstance(node, ast.Name):
+            name = node.id
+        if isinstance(node, ast.Attribute):
+            name = node.attr
+        if isinstance(node, ast.keyword):
+            name = node.arg
+        if name is not None and not ropevar.is_var(name):
+            result.add(name)
+    ast.call_for_nodes(node, add_names, recursive=True)
+    return result
+
+
+def _replace_wildcards(expression):
+    ropevar = _RopeVariable()
+    template = CodeTemplate(expression)
+    mapping = {}
+    for name in template.get_names():
+        mapping[name] = ropevar.get_var(name)
+    return template.substitute(mapping)
+
+
 def make_pattern(code, variables):
     variables = set(variables)
     collector = codeanalyze.ChangeCollector(code)
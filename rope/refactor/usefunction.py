@@ -35,15 +35,22 @@ class UseFunction(object):
                                               'be the last statement.')
 
     def get_changes(self, resources=None,
-                    task_handle=taskhandle.NullTaskHandle()):
+                    task_handle=taskhandle.NullTaskHandle(), processes=1):
+        """Get the changes this refactoring makes
+
+        If `processes` is more than one, modules other than the one
+        defining the function are changed in that many worker
+        processes.
+        """
         if resources is None:
             resources = self.project.pycore.get_python_files()
         changes = change.ChangeSet('Using function <%s>' %
                                    self.pyfunction.get_name())
+        newresources = list(resources)
         if self.resource in resources:
-            newresources = list(resources)
             newresources.remove(self.resource)
-        for c in self._restructure(newresources, task_handle).changes:
+        for c in self._restructure(newresources, task_handle,
+                                   processes=processes).changes:
             changes.add_change(c)
         if self.resource in resources:
             for c in self._restructure([self.resource], task_handle,
@@ -54,22 +61,24 @@ class UseFunction(object):
     def get_function_name(self):
         return self.pyfunction.get_name()
 
-    def _restructure(self, resources, task_handle, others=True):
+    def _restructure(self, resources, task_handle, others=True, processes=1):
         body = self._get_body()
         pattern = self._make_pattern()
         goal = self._make_goal(import_=others)
         imports = None
+        args = None
         if others:
             imports = ['import %s' % self._module_name()]
-
-        body_region = sourceutils.get_body_region(self.pyfunction)
-        args_value = {'skip': (self.resource, body_region)}
-        args = {'': args_value}
+        else:
+            body_region = sourceutils.get_body_region(self.pyfunction)
+            args_value = {'skip': (self.resource, body_region)}
+            args = {'': args_value}
 
         restructuring = restructure.Restructure(
             self.project, pattern, goal, args=args, imports=imports)
         return restructuring.get_changes(resources=resources,
-                                         task_handle=task_handle)
+                                         task_handle=task_handle,
+                                         processes=processes)
 
     def _find_temps(self):
         return find_temps(self.project, self._get_body())
@@ -12,6 +12,8 @@ import ropetest.runmodtest
 import ropetest.builtinstest
 import ropetest.historytest
 import ropetest.simplifytest
+import ropetest.importgraphtest
+import ropetest.inferencecachetest
 
 
 def suite():
@@ -27,6 +29,8 @@ def suite():
     result.addTests(ropetest.builtinstest.suite())
     result.addTests(ropetest.historytest.suite())
     result.addTests(ropetest.simplifytest.suite())
+    result.addTests(ropetest.importgraphtest.suite())
+    result.addTests(ropetest.inferencecachetest.suite())
     return result
 
 
@@ -1,7 +1,11 @@
+import logging
 import unittest
 
 import rope.base.oi
+import rope.base.pycore
 import rope.base.libutils
+from rope.base import exceptions
+from rope.base.oi import parallelsoa
 from ropetest import testutils
 
 
@@ -667,6 +671,80 @@ class NewStaticOITest(unittest.TestCase):
         p_type = f_scope['p'].get_object().get_type()
         self.assertEquals(c_class, p_type)
 
+    def test_report_change_with_background_soa(self):
+        self.project.prefs['automatic_soa'] = True
+        self.project.prefs['background_soa'] = True
+        code = 'class C(object):\n    pass\ndef f(p):\n    pass\nf(C())\n'
+        mod_file = open(self.mod.real_path, 'w')
+        mod_file.write(code)
+        mod_file.close()
+        rope.base.libutils.report_change(self.project, self.mod.real_path, '')
+        scheduler = self.pycore.get_soa_scheduler()
+        self.assertTrue(scheduler.wait_until_quiescent(10))
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        c_class = pymod['C'].get_object()
+        f_scope = pymod['f'].get_object().get_scope()
+        p_type = f_scope['p'].get_object().get_type()
+        self.assertEquals(c_class, p_type)
+        scheduler.stop()
+
+    def test_stopping_background_soa(self):
+        scheduler = self.pycore.get_soa_scheduler()
+        scheduler.stop()
+        scheduler.add(self.mod, '')
+        self.assertEquals({}, scheduler.pending)
+        self.assertTrue(scheduler.wait_until_quiescent(0))
+
+    def test_background_soa_after_stopping_schedulers(self):
+        self.pycore.get_soa_scheduler().stop()
+        code = 'class C(object):\n    pass\ndef f(p):\n    pass\nf(C())\n'
+        mod_file = open(self.mod.real_path, 'w')
+        mod_file.write(code)
+        mod_file.close()
+        scheduler = self.pycore.get_soa_scheduler()
+        scheduler.add(self.mod, '')
+        self.assertTrue(scheduler.wait_until_quiescent(10))
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        c_class = pymod['C'].get_object()
+        f_scope = pymod['f'].get_object().get_scope()
+        self.assertEquals(c_class, f_scope['p'].get_object().get_type())
+
+    def test_background_soa_holding_the_lock_of_pycore(self):
+        scheduler = self.pycore.get_soa_scheduler()
+        self.pycore.lock.acquire()
+        try:
+            scheduler.add(self.mod, '')
+            self.assertFalse(scheduler.wait_until_quiescent(0.2))
+        finally:
+            self.pycore.lock.release()
+        self.assertTrue(scheduler.wait_until_quiescent(10))
+
+    def test_logging_errors_of_background_soa(self):
+        handler = _RecordingHandler()
+        logging.getLogger('rope').addHandler(handler)
+        analyze = rope.base.pycore._analyze_changed_scopes
+        def raise_error(*args):
+            raise ValueError()
+        rope.base.pycore._analyze_changed_scopes = raise_error
+        try:
+            scheduler = self.pycore.get_soa_scheduler()
+            scheduler.add(self.mod, '')
+            self.assertTrue(scheduler.wait_until_quiescent(10))
+        finally:
+            rope.base.pycore._analyze_changed_scopes = analyze
+            logging.getLogger('rope').removeHandler(handler)
+        self.assertEquals(1, len(handler.records))
+        self.assertTrue('mod.py' in handler.records[0].getMessage())
+        self.assertEquals(ValueError, handler.records[0].exc_info[0])
+
+    def test_closing_projects_stops_background_soa(self):
+        scheduler = self.pycore.get_soa_scheduler()
+        scheduler.add(self.mod, '')
+        thread = scheduler.thread
+        self.project.close()
+        self.assertTrue(scheduler.is_stopped())
+        self.assertFalse(thread.isAlive())
+
     def test_report_libutils_and_analyze_all_modules(self):
         code = 'class C(object):\n    pass\ndef f(p):\n    pass\nf(C())\n'
         self.mod.write(code)
@@ -728,6 +806,60 @@ class NewStaticOITest(unittest.TestCase):
         x_var = pymod['x'].get_object().get_type()
         self.assertEquals(a_class, x_var)
 
+    def _analyze_calls_from_another_module(self, processes):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod.write('class C(object):\n    pass\ndef f(p):\n    pass\n')
+        mod2.write('import mod\nmod.f(mod.C())\n')
+        rope.base.libutils.analyze_modules(self.project, processes=processes)
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        c_class = pymod['C'].get_object()
+        f_scope = pymod['f'].get_object().get_scope()
+        p_type = f_scope['p'].get_object().get_type()
+        self.assertEquals(c_class, p_type)
+
+    def test_analyzing_all_modules(self):
+        self._analyze_calls_from_another_module(processes=1)
+
+    def test_analyzing_all_modules_in_other_processes(self):
+        self._analyze_calls_from_another_module(processes=2)
+
+    def test_analyzing_modules_with_syntax_errors_in_other_processes(self):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod2.write('def f(:\n')
+        self.assertRaises(
+            exceptions.ModuleSyntaxError,
+            rope.base.libutils.analyze_modules, self.project, processes=2)
+
+    def test_not_ordering_modules_analyzed_in_other_processes(self):
+        self.project.prefs['soa_followed_calls'] = 1
+        callers_first = parallelsoa.callers_first
+        def fail(*args):
+            self.fail('Modules are sorted')
+        parallelsoa.callers_first = fail
+        try:
+            self._analyze_calls_from_another_module(processes=2)
+        finally:
+            parallelsoa.callers_first = callers_first
+
+    def test_ordering_callers_before_the_modules_they_import(self):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod3 = testutils.create_module(self.project, 'mod3')
+        mod2.write('import mod\n')
+        mod3.write('from mod2 import *\n')
+        result = parallelsoa.callers_first(self.pycore,
+                                           [self.mod, mod2, mod3])
+        self.assertEquals([mod3, mod2, self.mod], result)
+
+
+class _RecordingHandler(logging.Handler):
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
 
 def suite():
     result = unittest.TestSuite()
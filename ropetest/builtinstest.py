@@ -1,6 +1,8 @@
+import sys
+import time
 import unittest
 
-from rope.base import pyobjects, builtins
+from rope.base import pyobjects, builtins, stubs
 from ropetest import testutils
 
 
@@ -442,7 +444,7 @@ class BuiltinModulesTest(unittest.TestCase):
     def setUp(self):
         super(BuiltinModulesTest, self).setUp()
         self.project = testutils.sample_project(
-            extension_modules=['time', 'invalid', 'invalid.sub'])
+            extension_modules=['time', 'audioop', 'invalid', 'invalid.sub'])
         self.pycore = self.project.pycore
         self.mod = testutils.create_module(self.project, 'mod')
 
@@ -476,6 +478,97 @@ class BuiltinModulesTest(unittest.TestCase):
         invalid = pymod['invalid'].get_object()
         self.assertTrue('sub' in invalid)
 
+    def test_not_importing_extension_modules(self):
+        sys.modules.pop('audioop', None)
+        self.mod.write('import audioop\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        self.assertTrue('add' in pymod['audioop'].get_object())
+        self.assertFalse('audioop' in sys.modules)
+
+    def test_extension_module_docs(self):
+        self.mod.write('import time\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        sleep = pymod['time'].get_object()['sleep'].get_object()
+        self.assertTrue(isinstance(sleep, builtins.BuiltinFunction))
+        self.assertEquals(time.sleep.__doc__, sleep.get_doc())
+        self.assertEquals(time.__doc__, pymod['time'].get_object().get_doc())
+
+    def test_saving_extension_stubs(self):
+        self.mod.write('import time\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        pymod['time'].get_object().get_attributes()
+        self.project.data_files.write()
+        name = 'stubs-%s.%s.%s' % sys.version_info[:3]
+        saved = self.project.data_files.read_data(name, compress=True)
+        self.assertTrue('time' in saved)
+
+    def test_describing_extension_modules_together(self):
+        result = self.pycore.extension_cache.get_stubs(['time', 'audioop',
+                                                        'invalid'])
+        self.assertEquals(None, result['invalid'])
+        self.assertTrue('sleep' in result['time'].get_attributes())
+        self.assertTrue('add' in result['audioop'].get_attributes())
+
+    def test_introspection_server(self):
+        self.project.prefs['introspection_server'] = True
+        self.mod.write('import time\nimport audioop\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        self.assertTrue('sleep' in pymod['time'].get_object())
+        server = self.pycore.extension_cache.stubs._server
+        process = server.process
+        self.assertTrue('add' in pymod['audioop'].get_object())
+        self.assertTrue(process is server.process)
+        self.project.close()
+        self.assertTrue(server.process is None)
+        self.assertNotEquals(None, process.returncode)
+
+    def test_keeping_introspection_server_when_writing_data(self):
+        self.project.prefs['introspection_server'] = True
+        self.mod.write('import time\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        self.assertTrue('sleep' in pymod['time'].get_object())
+        process = self.pycore.extension_cache.stubs._server.process
+        self.project.data_files.write()
+        self.assertEquals(None, process.poll())
+        self.project.close()
+        self.assertNotEquals(None, process.returncode)
+
+    def test_killing_describing_processes_after_timeouts(self):
+        hanging = testutils.create_module(self.project, 'hanging')
+        hanging.write('import time\ntime.sleep(30)\n')
+        sys.path.insert(0, self.project.address)
+        try:
+            start = time.time()
+            result = stubs._describe_in_process(['hanging', 'time'],
+                                                timeout=0.5)
+            self.assertTrue(time.time() - start < 10)
+        finally:
+            sys.path.remove(self.project.address)
+        self.assertEquals(None, result[0])
+        self.assertTrue('sleep' in stubs.Stub(result[1]).get_attributes())
+
+    def test_saving_stubs_of_modules_described_after_timeouts(self):
+        hanging = testutils.create_module(self.project, 'hanging')
+        hanging.write('import time\ntime.sleep(30)\n')
+        cache = stubs.StubCache(self.project, timeout=0.5)
+        sys.path.insert(0, self.project.address)
+        try:
+            result = cache.get_stubs(['time', 'hanging', 'audioop'])
+            self.assertEquals(None, result['hanging'])
+            self.assertTrue('sleep' in result['time'].get_attributes())
+            self.assertTrue('add' in result['audioop'].get_attributes())
+            start = time.time()
+            self.assertEquals(None, cache.get_stub('hanging'))
+            self.assertTrue(time.time() - start < 0.5)
+        finally:
+            sys.path.remove(self.project.address)
+
+    def test_importing_extension_modules_without_stubs(self):
+        self.project.prefs['extension_stubs'] = False
+        self.mod.write('import time\n')
+        pymod = self.pycore.resource_to_pyobject(self.mod)
+        self.assertTrue('sleep' in pymod['time'].get_object())
+
 
 def suite():
     result = unittest.TestSuite()
@@ -1,7 +1,7 @@
 import unittest
 
 import rope.base.evaluate
-from rope.base import exceptions, ast, worder, codeanalyze
+from rope.base import exceptions, ast, worder, codeanalyze, simplify
 from rope.base.codeanalyze import SourceLinesAdapter, LogicalLineFinder, get_block_start
 from ropetest import testutils
 
@@ -44,6 +44,68 @@ class SourceLinesAdapterTest(unittest.TestCase):
         to_lines = SourceLinesAdapter('line1')
         self.assertEquals(1, to_lines.get_line_number(5))
 
+    def test_source_lines_sharing_line_starts(self):
+        code = 'line1\nline2\n'
+        lines1 = SourceLinesAdapter(code)
+        lines2 = SourceLinesAdapter(code[:6] + code[6:])
+        self.assertTrue(lines1.starts is lines2.starts)
+
+
+class ChangeCollectorTest(unittest.TestCase):
+
+    def test_no_changes(self):
+        collector = codeanalyze.ChangeCollector('abc')
+        self.assertEquals(None, collector.get_changed())
+
+    def test_changes_that_keep_the_text(self):
+        collector = codeanalyze.ChangeCollector('abc')
+        collector.add_change(1, 2)
+        collector.add_change(0, 1, 'a')
+        self.assertEquals(None, collector.get_changed())
+
+    def test_unordered_changes(self):
+        collector = codeanalyze.ChangeCollector('abcd')
+        collector.add_change(3, 4, 'D')
+        collector.add_change(0, 1, 'A')
+        collector.add_change(2, 2, '-')
+        self.assertEquals('Ab-cD', collector.get_changed())
+
+    def test_insertions_at_the_same_offset_keep_their_order(self):
+        collector = codeanalyze.ChangeCollector('ab')
+        collector.add_change(1, 1, '1')
+        collector.add_change(1, 1, '2')
+        self.assertEquals('a12b', collector.get_changed())
+
+    def test_changed_chunks(self):
+        collector = codeanalyze.ChangeCollector('abcd')
+        collector.add_change(1, 3, 'X')
+        self.assertEquals(['a', 'X', 'd'],
+                          list(collector.get_changed_chunks()))
+
+    def test_changed_chunks_with_no_changes(self):
+        collector = codeanalyze.ChangeCollector('abcd')
+        self.assertEquals('abcd', ''.join(collector.get_changed_chunks()))
+
+
+class LineDiffTest(unittest.TestCase):
+
+    def test_changed_ranges(self):
+        diff = codeanalyze.LineDiff('1\n2\n3\n4\n5\n', '1\n3\n4\nx\n')
+        self.assertEquals([(2, 2), (5, 5)], diff.get_changed_ranges())
+
+    def test_changed_ranges_for_insertions(self):
+        diff = codeanalyze.LineDiff('1\n2\n', '1\nx\n2\n')
+        self.assertEquals([], diff.get_changed_ranges())
+
+    def test_unified_diff(self):
+        diff = codeanalyze.LineDiff('1\n2\n', '1\n3\n')
+        self.assertEquals('--- a\n+++ b\n@@ -1,2 +1,2 @@\n 1\n-2\n+3\n',
+                          ''.join(diff.unified_diff('a', 'b')))
+
+    def test_unified_diff_with_no_changes(self):
+        diff = codeanalyze.LineDiff('1\n', '1\n')
+        self.assertEquals([], list(diff.unified_diff('a', 'b')))
+
 
 class WordRangeFinderTest(unittest.TestCase):
 
@@ -461,6 +523,31 @@ class ScopeNameFinderTest(unittest.TestCase):
         name_finder = rope.base.evaluate.ScopeNameFinder(pymod)
         name_finder.get_pyname_at(code.index('pass'))
 
+    def test_same_expressions_in_different_scopes(self):
+        code = 'var = 1\ndef f():\n    var = 2\n    print var\nprint var\n'
+        pymod = self.pycore.get_string_module(code)
+        name_finder = rope.base.evaluate.ScopeNameFinder(pymod)
+        f_scope = pymod['f'].get_object().get_scope()
+        self.assertEquals(f_scope['var'],
+                          name_finder.get_pyname_at(code.index('print') + 7))
+        self.assertEquals(pymod['var'],
+                          name_finder.get_pyname_at(code.rindex('var')))
+
+    def test_evaluations_after_changing_imported_modules(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('a_var = 1\n')
+        code = 'import mod1\nmod1.a_var\n'
+        mod2.write(code)
+        pymod2 = self.pycore.resource_to_pyobject(mod2)
+        name_finder = rope.base.evaluate.ScopeNameFinder(pymod2)
+        name_finder.get_pyname_at(code.rindex('a_var'))
+        mod1.write('a_var = 2\n')
+        name_finder = rope.base.evaluate.ScopeNameFinder(pymod2)
+        pymod1 = self.pycore.resource_to_pyobject(mod1)
+        self.assertEquals(pymod1['a_var'],
+                          name_finder.get_pyname_at(code.rindex('a_var')))
+
     def test_one_liners(self):
         code = 'var = 1\ndef f(): var = 2\nprint var\n'
         pymod = self.pycore.get_string_module(code)
@@ -602,14 +689,25 @@ class CustomLogicalLineFinderTest(LogicalLineFinderTest):
             lines, codeanalyze.custom_generator)
 
 
+class SimplifiedLogicalLineFinderTest(LogicalLineFinderTest):
+
+    def _logical_finder(self, code):
+        lines = SourceLinesAdapter(code)
+        return codeanalyze.CachingLogicalLineFinder(
+            lines, simplify.logical_line_generator)
+
+
 def suite():
     result = unittest.TestSuite()
     result.addTests(unittest.makeSuite(SourceLinesAdapterTest))
+    result.addTests(unittest.makeSuite(ChangeCollectorTest))
+    result.addTests(unittest.makeSuite(LineDiffTest))
     result.addTests(unittest.makeSuite(WordRangeFinderTest))
     result.addTests(unittest.makeSuite(ScopeNameFinderTest))
     result.addTests(unittest.makeSuite(LogicalLineFinderTest))
     result.addTests(unittest.makeSuite(TokenizerLogicalLineFinderTest))
     result.addTests(unittest.makeSuite(CustomLogicalLineFinderTest))
+    result.addTests(unittest.makeSuite(SimplifiedLogicalLineFinderTest))
     return result
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@ import unittest
 import ropetest.contrib.autoimporttest
 import ropetest.contrib.changestacktest
 import ropetest.contrib.codeassisttest
+import ropetest.contrib.duplicatestest
 import ropetest.contrib.finderrorstest
 import ropetest.contrib.findittest
 import ropetest.contrib.fixmodnamestest
@@ -23,6 +24,8 @@ def suite():
                                        FixModuleNamesTest))
     result.addTests(unittest.makeSuite(ropetest.contrib.finderrorstest.
                                        FindErrorsTest))
+    result.addTests(unittest.makeSuite(ropetest.contrib.duplicatestest.
+                                       FindDuplicatesTest))
     return result
 
 
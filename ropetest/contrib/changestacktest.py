@@ -1,8 +1,11 @@
+import os
 import unittest
 
+import rope.base.exceptions
 import rope.base.history
 import rope.contrib.changestack
 from rope.base.change import *
+from rope.refactor.rename import Rename
 from ropetest import testutils
 
 
@@ -30,6 +33,93 @@ class ChangeStackTest(unittest.TestCase):
         self.project.do(changes)
         self.assertEquals('3', myfile.read())
 
+    def test_not_writing_pushed_changes_to_disk(self):
+        myfile = self.project.root.create_file('myfile.txt')
+        myfile.write('1')
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        stack.push(ChangeContents(myfile, '2'))
+        self.assertEquals('2', myfile.read())
+        self.assertEquals('1', open(myfile.real_path).read())
+        stack.pop_all()
+        self.assertEquals(None, self.project.overlay)
+        self.assertEquals('1', myfile.read())
+
+    def test_removing_the_overlay_when_first_changes_fail(self):
+        myfile = self.project.root.create_file('myfile.txt')
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        self.assertRaises(
+            rope.base.exceptions.RopeError,
+            stack.push, CreateFile(self.project.root, 'myfile.txt'))
+        self.assertEquals(None, self.project.overlay)
+        myfile.write('1')
+        self.assertEquals('1', open(myfile.real_path).read())
+        self.assertEquals([], stack.merged().changes)
+
+    def test_not_pushing_failed_changes(self):
+        myfile = self.project.root.create_file('myfile.txt')
+        myfile.write('1')
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        stack.push(ChangeContents(myfile, '2'))
+        self.assertRaises(
+            rope.base.exceptions.RopeError,
+            stack.push, CreateFile(self.project.root, 'myfile.txt'))
+        self.assertEquals('2', myfile.read())
+        stack.pop_all()
+        self.assertEquals(None, self.project.overlay)
+        self.assertEquals('1', myfile.read())
+        self.assertEquals(1, len(stack.merged().changes))
+
+    def test_moving_resources_in_memory(self):
+        folder = self.project.root.create_folder('folder')
+        myfile = folder.create_file('myfile.txt')
+        myfile.write('1')
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        stack.push(MoveResource(folder, 'newfolder'))
+        newfile = self.project.get_resource('newfolder/myfile.txt')
+        stack.push(ChangeContents(newfile, '2'))
+        self.assertFalse(folder.exists())
+        self.assertEquals('2', newfile.read())
+        self.assertEquals(set([newfile]), self.project.get_files())
+        self.assertTrue(os.path.exists(myfile.real_path))
+        self.assertFalse(os.path.exists(newfile.real_path))
+        stack.pop_all()
+        self.assertTrue(folder.exists())
+        self.assertEquals(set([myfile]), self.project.get_files())
+        self.project.do(stack.merged())
+        self.assertEquals('2', open(newfile.real_path).read())
+        self.assertFalse(os.path.exists(folder.real_path))
+
+    def test_creating_resources_in_memory(self):
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        folder = self.project.get_folder('folder')
+        myfile = self.project.get_file('folder/myfile.txt')
+        stack.push(CreateFolder(self.project.root, 'folder'))
+        stack.push(CreateFile(folder, 'myfile.txt'))
+        stack.push(ChangeContents(myfile, '1'))
+        self.assertEquals([myfile], folder.get_children())
+        self.assertEquals('1', myfile.read())
+        self.assertFalse(os.path.exists(folder.real_path))
+        stack.pop_all()
+        self.assertFalse(folder.exists())
+
+    def test_analyzing_modules_in_memory(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('def f():\n    pass\n')
+        mod2.write('import mod1\nmod1.f()\n')
+        stack = rope.contrib.changestack.ChangeStack(self.project)
+        stack.push(Rename(self.project, mod1).get_changes('newmod'))
+        newmod = self.project.get_resource('newmod.py')
+        stack.push(Rename(self.project, newmod).get_changes('newmod2'))
+        self.assertEquals('import newmod2\nnewmod2.f()\n', mod2.read())
+        self.assertEquals('import mod1\nmod1.f()\n',
+                          open(mod2.real_path).read())
+        stack.pop_all()
+        self.assertEquals('import mod1\nmod1.f()\n', mod2.read())
+        self.project.do(stack.merged())
+        self.assertEquals('import newmod2\nnewmod2.f()\n', mod2.read())
+        self.assertTrue(self.project.get_resource('newmod2.py').exists())
+
 
 if __name__ == '__main__':
     unittest.main()
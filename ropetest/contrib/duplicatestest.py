@@ -0,0 +1,138 @@
+import unittest
+
+from rope.contrib import duplicates
+from ropetest import testutils
+
+
+class FindDuplicatesTest(unittest.TestCase):
+
+    def setUp(self):
+        super(FindDuplicatesTest, self).setUp()
+        self.project = testutils.sample_project()
+        self.mod1 = testutils.create_module(self.project, 'mod1')
+        self.mod2 = testutils.create_module(self.project, 'mod2')
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super(FindDuplicatesTest, self).tearDown()
+
+    def _regions(self, group):
+        return [(resource, resource.read()[start:end])
+                for resource, (start, end) in group.occurrences]
+
+    def test_no_duplicates(self):
+        self.mod1.write('a = 1\n')
+        self.assertEquals([], duplicates.find_duplicates(self.project))
+
+    def test_duplicate_expressions_with_renamed_variables(self):
+        self.mod1.write('a = x.f(1, x + 2) * [x, 3]\n')
+        self.mod2.write('print(y.f(1, y + 2) * [y, 3])\n')
+        result = duplicates.find_duplicates(self.project, min_size=13)
+        self.assertEquals(1, len(result))
+        self.assertEquals([(self.mod1, 'x.f(1, x + 2) * [x, 3]'),
+                           (self.mod2, 'y.f(1, y + 2) * [y, 3]')],
+                          self._regions(result[0]))
+
+    def test_not_matching_inconsistently_renamed_variables(self):
+        self.mod1.write('a = x.f(1, x + 2) * [x, 3]\n')
+        self.mod2.write('print(y.f(1, y + 2) * [z, 3])\n')
+        result = duplicates.find_duplicates(self.project, min_size=13)
+        self.assertEquals([], result)
+
+    def test_not_matching_different_attributes(self):
+        self.mod1.write('a = x.f(1, x + 2) * [x, 3]\n')
+        self.mod2.write('print(x.g(1, x + 2) * [x, 3])\n')
+        result = duplicates.find_duplicates(self.project, min_size=13)
+        self.assertEquals([], result)
+
+    def test_duplicate_statements(self):
+        code = 'def f(p):\n    %s = p + 1\n    print(%s * 2)\n    return 1\n'
+        self.mod1.write(code % ('a', 'a'))
+        self.mod2.write(code % ('b', 'b') + 'print(2)\n')
+        result = duplicates.find_duplicates(self.project, min_size=10)
+        self.assertEquals(1, len(result))
+        self.assertEquals([self.mod1.read().rstrip(),
+                           self.mod2.read()[:len(self.mod1.read()) - 1]],
+                          [code for resource, code
+                           in self._regions(result[0])])
+
+    def test_duplicates_in_elif_statements(self):
+        self.mod1.write('if a:\n    pass\nelif b:\n'
+                        '    c = x.f(1, x + 2) * [x, 3]\n')
+        self.mod2.write('if a:\n    pass\nelif y.f(1, y + 2) * [y, 3]:\n'
+                        '    pass\n')
+        result = duplicates.find_duplicates(self.project, min_size=13)
+        self.assertEquals([(self.mod1, 'x.f(1, x + 2) * [x, 3]'),
+                           (self.mod2, 'y.f(1, y + 2) * [y, 3]')],
+                          self._regions(result[0]))
+
+    def test_skipping_fragments_that_cannot_be_patched(self):
+        mod3 = testutils.create_module(self.project, 'mod3')
+        self.mod1.write('with open([1, 2, 3, 4, 5]) as b, c as d:\n'
+                        '    pass\n')
+        self.mod2.write('y = open([1, 2, 3, 4, 5])\n')
+        mod3.write('z = open([1, 2, 3, 4, 5])\n')
+        result = duplicates.find_duplicates(self.project, min_size=3)
+        self.assertEquals([(self.mod2, 'y = open([1, 2, 3, 4, 5])'),
+                           (mod3, 'z = open([1, 2, 3, 4, 5])')],
+                          self._regions(result[0]))
+        # the call in the with statement of mod1 is skipped
+        self.assertEquals([(self.mod1, '[1, 2, 3, 4, 5]'),
+                           (self.mod2, '[1, 2, 3, 4, 5]'),
+                           (mod3, '[1, 2, 3, 4, 5]')],
+                          self._regions(result[1]))
+        self.assertEquals(2, len(result))
+
+    def test_checking_modules_changed_after_hashing(self):
+        self.mod1.write('a = 1\n')
+        self.assertEquals(
+            ('mod1.py', []),
+            duplicates._check_fragments(self.project, 'mod1.py',
+                                        [(10, 0), (3, 3)], 3))
+        self.mod1.write('a = (\n')
+        self.assertEquals(
+            ('mod1.py', []),
+            duplicates._check_fragments(self.project, 'mod1.py',
+                                        [(1, 0)], 3))
+
+    def test_duplicates_starting_with_multiline_strings(self):
+        self.mod1.write('a = 1\n"""doc\nmore""".join(x.f(1, x + 2))\n')
+        self.mod2.write('"""doc\nmore""".join(y.f(1, y + 2))\n')
+        result = duplicates.find_duplicates(self.project, min_size=10)
+        self.assertEquals([(self.mod1, '"""doc\nmore""".join(x.f(1, x + 2))'),
+                           (self.mod2, '"""doc\nmore""".join(y.f(1, y + 2))')],
+                          self._regions(result[0]))
+
+    def test_duplicates_in_the_same_module(self):
+        self.mod1.write('a = [1, 2, 3, 4]\nb = [1, 2, 3, 4]\n')
+        result = duplicates.find_duplicates(self.project, min_size=5)
+        self.assertEquals(1, len(result))
+        self.assertEquals([(self.mod1, 'a = [1, 2, 3, 4]'),
+                           (self.mod1, 'b = [1, 2, 3, 4]')],
+                          self._regions(result[0]))
+
+    def test_ignoring_small_fragments(self):
+        self.mod1.write('a = x + 1\n')
+        self.mod2.write('b = x + 1\n')
+        result = duplicates.find_duplicates(self.project, min_size=10)
+        self.assertEquals([], result)
+
+    def test_ignoring_modules_with_syntax_errors(self):
+        self.mod1.write('a = [1, 2, 3, 4]\n')
+        self.mod2.write('b = [1, 2, 3, 4\n')
+        result = duplicates.find_duplicates(self.project, min_size=5)
+        self.assertEquals([], result)
+
+    def test_finding_duplicates_in_worker_processes(self):
+        self.mod1.write('a = x.f(1, x + 2) * [x, 3]\n')
+        self.mod2.write('print(y.f(1, y + 2) * [y, 3])\n')
+        result = duplicates.find_duplicates(self.project, min_size=13,
+                                            processes=2)
+        self.assertEquals(1, len(result))
+        self.assertEquals([self.mod1, self.mod2],
+                          [resource for resource, region
+                           in result[0].occurrences])
+
+
+if __name__ == '__main__':
+    unittest.main()
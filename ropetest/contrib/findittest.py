@@ -1,8 +1,9 @@
-from rope.base import exceptions
+from rope.base import exceptions, taskhandle
 import unittest
 
 from rope.contrib.findit import (find_occurrences, find_implementations,
-                                 find_definition)
+                                 find_definition, iter_occurrences,
+                                 iter_implementations)
 from ropetest import testutils
 
 
@@ -93,6 +94,65 @@ class FindItTest(unittest.TestCase):
         offset = mod1.read().index('A')
         result = find_implementations(self.project, mod1, offset)
 
+    def test_iterating_occurrences(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('a_var = 1\n')
+        mod2.write('import mod1\nmy_var = mod1.a_var\n')
+        result = list(iter_occurrences(self.project, mod2, 27))
+        self.assertEquals([(mod2, 26), (mod1, 0)],
+                          [(location.resource, location.offset)
+                           for location in result])
+
+    def test_iterating_occurrences_in_nearer_modules_first(self):
+        amod = testutils.create_module(self.project, 'amod')
+        bmod = testutils.create_module(self.project, 'bmod')
+        zmod = testutils.create_module(self.project, 'zmod')
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod = testutils.create_module(self.project, 'mod', pkg)
+        mod.write('a_var = 1\n')
+        amod.write('import bmod\nbmod.mod.a_var\n')
+        bmod.write('from pkg import mod\nmod.a_var\n')
+        zmod.write('from pkg import mod\nmod.a_var\n')
+        init = pkg.get_child('__init__.py')
+        init.write('from pkg import mod\nmod.a_var\n')
+        result = iter_occurrences(self.project, mod, 1)
+        self.assertEquals([mod, init, bmod, zmod, amod],
+                          [location.resource for location in result])
+
+    def test_limiting_iterated_occurrences(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('a_var = 1\na_var = 2\n')
+        mod2.write('import mod1\nmod1.a_var\n')
+        result = list(iter_occurrences(self.project, mod1, 1, limit=1))
+        self.assertEquals([0], [location.offset for location in result])
+        result = list(iter_occurrences(self.project, mod1, 1, limit=3))
+        self.assertEquals(3, len(result))
+
+    def test_stopping_iterating_occurrences(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('a_var = 1\n')
+        mod2.write('import mod1\nmod1.a_var\n')
+        handle = taskhandle.TaskHandle()
+        result = iter_occurrences(self.project, mod1, 1, task_handle=handle)
+        self.assertEquals(mod1, result.next().resource)
+        result.close()
+        self.assertEquals(1, handle.current_jobset().done)
+
+    def test_iterating_implementations(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod1.write('class A(object):\n    def f(self):\n        pass\n'
+                   'class B(A):\n    def f(self):\n        pass\n')
+        offset = mod1.read().rindex('f(')
+        result = list(iter_implementations(self.project, mod1, offset))
+        self.assertEquals([], result)
+        offset = mod1.read().index('f(')
+        result = list(iter_implementations(self.project, mod1, offset))
+        self.assertEquals([mod1.read().rindex('f(')],
+                          [location.offset for location in result])
+
     def test_trivial_find_definition(self):
         code = 'def a_func():\n    pass\na_func()'
         result = find_definition(self.project, code, code.rindex('a_func'))
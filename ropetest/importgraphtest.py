@@ -0,0 +1,153 @@
+import unittest
+
+import rope.base.project
+from rope.refactor import move, rename
+from ropetest import testutils
+
+
+class ImportGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        super(ImportGraphTest, self).setUp()
+        self.project = testutils.sample_project()
+        self.graph = self.project.pycore.import_graph
+        self.mod1 = testutils.create_module(self.project, 'mod1')
+        self.mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod3 = testutils.create_module(self.project, 'mod3')
+
+    def tearDown(self):
+        testutils.remove_project(self.project)
+        super(ImportGraphTest, self).tearDown()
+
+    def test_trivial_case(self):
+        self.assertEquals([], self.graph.get_imports(self.mod1))
+        self.assertEquals([], self.graph.get_importers(self.mod1))
+
+    def test_simple_imports(self):
+        self.mod2.write('import mod1\n')
+        self.assertEquals([self.mod1], self.graph.get_imports(self.mod2))
+        self.assertEquals([self.mod2], self.graph.get_importers(self.mod1))
+
+    def test_from_imports_and_imports_in_functions(self):
+        self.mod2.write('def f():\n    from mod1 import a_var\n')
+        self.mod3.write('import os\nclass C(object):\n    import mod2\n')
+        self.assertEquals([self.mod1], self.graph.get_imports(self.mod2))
+        self.assertEquals([self.mod2], self.graph.get_imports(self.mod3))
+
+    def test_importing_packages(self):
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod4 = testutils.create_module(self.project, 'mod4', pkg)
+        self.mod1.write('import pkg.mod4\n')
+        self.mod2.write('from pkg import mod4\n')
+        init = pkg.get_child('__init__.py')
+        self.assertEquals([init, mod4], self.graph.get_imports(self.mod1))
+        self.assertEquals([init, mod4], self.graph.get_imports(self.mod2))
+        self.assertEquals([self.mod1, self.mod2],
+                          self.graph.get_importers(pkg))
+
+    def test_relative_imports(self):
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod4 = testutils.create_module(self.project, 'mod4', pkg)
+        mod5 = testutils.create_module(self.project, 'mod5', pkg)
+        mod5.write('from . import mod4\n')
+        init = pkg.get_child('__init__.py')
+        self.assertEquals([init, mod4], self.graph.get_imports(mod5))
+
+    def test_transitive_importers(self):
+        self.mod2.write('import mod1\n')
+        self.mod3.write('from mod2 import mod1\n')
+        self.assertEquals([self.mod2, self.mod3],
+                          self.graph.get_transitive_importers(self.mod1))
+        self.assertEquals([self.mod1, self.mod2],
+                          self.graph.get_transitive_imports(self.mod3))
+
+    def test_import_cycles(self):
+        self.mod1.write('import mod2\n')
+        self.mod2.write('import mod1\n')
+        self.assertEquals([self.mod1, self.mod2],
+                          self.graph.get_transitive_importers(self.mod1))
+
+    def test_updating_after_changes(self):
+        self.mod2.write('import mod1\n')
+        self.assertEquals([self.mod2], self.graph.get_importers(self.mod1))
+        self.mod2.write('import mod3\n')
+        self.mod3.write('import mod1\n')
+        self.assertEquals([self.mod3], self.graph.get_importers(self.mod1))
+
+    def test_updating_after_creating_imported_modules(self):
+        self.mod1.write('import mod4\n')
+        self.assertEquals([], self.graph.get_imports(self.mod1))
+        mod4 = testutils.create_module(self.project, 'mod4')
+        self.assertEquals([mod4], self.graph.get_imports(self.mod1))
+        mod4.move('mod5.py')
+        self.assertEquals([], self.graph.get_imports(self.mod1))
+
+    def test_dependents(self):
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod4 = testutils.create_module(self.project, 'mod4', pkg)
+        self.mod1.write('import pkg\n')
+        self.mod2.write('import mod1\n')
+        self.assertEquals([self.mod1, self.mod2, mod4],
+                          self.graph.get_dependents(mod4))
+
+    def test_used_modules(self):
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod4 = testutils.create_module(self.project, 'mod4', pkg)
+        self.mod1.write('import pkg\n')
+        self.mod2.write('import mod1\n')
+        init = pkg.get_child('__init__.py')
+        self.assertEquals([self.mod1, self.mod2, init, mod4],
+                          self.graph.get_used_modules(self.mod2))
+
+    def test_distances(self):
+        self.mod2.write('import mod1\n')
+        self.mod3.write('import mod2\n')
+        mod4 = testutils.create_module(self.project, 'mod4')
+        self.assertEquals({self.mod1: 2, self.mod2: 1, self.mod3: 0},
+                          self.graph.get_distances(self.mod3))
+        self.assertEquals({mod4: 0}, self.graph.get_distances(mod4))
+
+    def test_modules_with_syntax_errors_as_dependents(self):
+        self.mod2.write('import mod1\n')
+        self.mod3.write('def f(:\n')
+        self.assertEquals([self.mod1, self.mod2, self.mod3],
+                          self.graph.get_dependents(self.mod1))
+
+    def test_saving_imported_names(self):
+        self.mod2.write('import mod1\n')
+        self.assertEquals([self.mod2], self.graph.get_importers(self.mod1))
+        self.project.close()
+        project = rope.base.project.Project(self.project.address)
+        graph = project.pycore.import_graph
+        graph._update()
+        self.assertEquals([('mod1', 0)], graph._names['mod2.py'][1])
+        mod1 = project.get_resource('mod1.py')
+        self.assertEquals([project.get_resource('mod2.py')],
+                          graph.get_importers(mod1))
+
+    def test_renaming_modules_only_changes_dependents(self):
+        self.mod2.write('import mod1\nmod1.f()\n')
+        self.mod3.write('mod1 = None\n')
+        changes = rename.Rename(self.project, self.mod1).get_changes('newmod')
+        self.assertFalse(self.mod3 in changes.get_changed_resources())
+        self.project.do(changes)
+        self.assertEquals('import newmod\nnewmod.f()\n', self.mod2.read())
+
+    def test_moving_globals_through_other_modules(self):
+        self.mod1.write('def f():\n    pass\n')
+        self.mod2.write('from mod1 import f\n')
+        self.mod3.write('import mod2\nmod2.f()\n')
+        mover = move.create_move(self.project, self.mod1, 5)
+        self.project.do(mover.get_changes(
+            testutils.create_module(self.project, 'mod4')))
+        self.assertEquals('import mod2\nimport mod4\nmod4.f()\n',
+                          self.mod3.read())
+
+
+def suite():
+    result = unittest.TestSuite()
+    result.addTests(unittest.makeSuite(ImportGraphTest))
+    return result
+
+if __name__ == '__main__':
+    unittest.main()
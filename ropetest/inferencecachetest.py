@@ -0,0 +1,167 @@
+import os
+import unittest
+
+import rope.base.project
+from rope.base.oi import soi
+from ropetest import testutils
+
+
+class InferenceCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        super(InferenceCacheTest, self).setUp()
+        self.project = testutils.sample_project()
+        self.pycore = self.project.pycore
+        self.mod1 = testutils.create_module(self.project, 'mod1')
+        self.mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod3 = testutils.create_module(self.project, 'mod3')
+        self.inferred = []
+        self._infer_assignment = soi._infer_assignment
+        def infer_assignment(assignment, pymodule):
+            self.inferred.append(assignment)
+            return self._infer_assignment(assignment, pymodule)
+        soi._infer_assignment = infer_assignment
+
+    def tearDown(self):
+        soi._infer_assignment = self._infer_assignment
+        testutils.remove_project(self.project)
+        super(InferenceCacheTest, self).tearDown()
+
+    def _get_type(self, resource, name):
+        pymodule = self.pycore.resource_to_pyobject(resource)
+        return pymodule[name].get_object().get_type()
+
+    def test_inferring_again_after_forgetting_data(self):
+        self.mod1.write('class C(object):\n    pass\n')
+        self.mod2.write('import mod1\na_var = mod1.C()\n')
+        c_class = self.pycore.resource_to_pyobject(self.mod1)['C'].get_object()
+        self.assertEquals(c_class, self._get_type(self.mod2, 'a_var'))
+        self.assertEquals(1, len(self.inferred))
+        self.mod3.write('b_var = 1\n')
+        self.pycore.module_cache.forget_all_data()
+        self.assertEquals(c_class, self._get_type(self.mod2, 'a_var'))
+        self.assertEquals(1, len(self.inferred))
+
+    def test_inferring_again_after_changing_used_modules(self):
+        self.mod1.write('class C(object):\n    pass\n')
+        self.mod2.write('from mod1 import C as D\n')
+        self.mod3.write('import mod2\na_var = mod2.D()\n')
+        self._get_type(self.mod3, 'a_var')
+        self.mod1.write('class C(object):\n    pass\nclass D(object):\n'
+                        '    pass\n')
+        self.mod2.write('from mod1 import D\n')
+        d_class = self.pycore.resource_to_pyobject(self.mod1)['D'].get_object()
+        self.assertEquals(d_class, self._get_type(self.mod3, 'a_var'))
+        self.assertEquals(2, len(self.inferred))
+
+    def test_inferring_again_after_changes_keeping_indicators(self):
+        self.mod1.write('class A(object):\n    pass\n'
+                        'class B(object):\n    pass\nx = A()\n')
+        self.mod2.write('import mod1\ny = mod1.x\n')
+        mtime = int(os.path.getmtime(self.mod1.real_path))
+        os.utime(self.mod1.real_path, (mtime, mtime))
+        self._get_type(self.mod2, 'y')
+        self.mod1.write('class A(object):\n    pass\n'
+                        'class B(object):\n    pass\nx = B()\n')
+        os.utime(self.mod1.real_path, (mtime, mtime))
+        b_class = self.pycore.resource_to_pyobject(self.mod1)['B'].\
+                  get_object()
+        self.assertEquals(b_class, self._get_type(self.mod2, 'y'))
+
+    def test_using_child_modules_of_imported_packages(self):
+        pkg = testutils.create_package(self.project, 'pkg')
+        mod4 = testutils.create_module(self.project, 'mod4', pkg)
+        self.mod1.write('class C(object):\n    pass\nclass D(object):\n'
+                        '    pass\n')
+        mod4.write('from mod1 import C as E\n')
+        self.mod2.write('import pkg\na_var = pkg.mod4.E()\n')
+        self._get_type(self.mod2, 'a_var')
+        mod4.write('from mod1 import D as E\n')
+        d_class = self.pycore.resource_to_pyobject(self.mod1)['D'].get_object()
+        self.assertEquals(d_class, self._get_type(self.mod2, 'a_var'))
+
+    def test_not_caching_local_names_of_functions(self):
+        self.mod1.write('class C(object):\n    pass\n'
+                        'def f():\n    a_var = C()\n')
+        pymodule = self.pycore.resource_to_pyobject(self.mod1)
+        scope = pymodule['f'].get_object().get_scope()
+        scope['a_var'].get_object()
+        self.pycore.module_cache.forget_all_data()
+        scope['a_var'].get_object()
+        self.assertEquals(2, len(self.inferred))
+        self.assertEquals({}, self.pycore.inference_cache._get_entries())
+
+    def test_caching_attributes_assigned_in_methods(self):
+        self.mod1.write('class C(object):\n    pass\nclass A(object):\n'
+                        '    def __init__(self):\n        self.attr = C()\n')
+        pymodule = self.pycore.resource_to_pyobject(self.mod1)
+        a_class = pymodule['A'].get_object()
+        c_class = pymodule['C'].get_object()
+        self.assertEquals(c_class, a_class['attr'].get_object().get_type())
+        self.pycore.module_cache.forget_all_data()
+        self.assertEquals(c_class, a_class['attr'].get_object().get_type())
+        self.assertEquals(1, len(self.inferred))
+
+    def test_not_caching_string_modules(self):
+        code = 'class C(object):\n    pass\na_var = C()\n'
+        pymodule = self.pycore.get_string_module(code, self.mod1)
+        pymodule['a_var'].get_object()
+        self.assertEquals({}, self.pycore.inference_cache._get_entries())
+
+    def test_inferring_again_after_changing_objectdb(self):
+        self.mod1.write('class A(object):\n    def __init__(self, p):\n'
+                        '        self.attr = p\n')
+        self.mod2.write('import mod1\nclass C(object):\n    pass\n'
+                        'mod1.A(C())\n')
+        self.pycore.analyze_module(self.mod2)
+        pymod2 = self.pycore.resource_to_pyobject(self.mod2)
+        a_class = self.pycore.resource_to_pyobject(self.mod1)['A'].\
+                  get_object()
+        self.assertEquals(pymod2['C'].get_object(),
+                          a_class['attr'].get_object().get_type())
+        self.mod2.write('import mod1\nclass C(object):\n    pass\n'
+                        'class D(object):\n    pass\nmod1.A(D())\n')
+        self.pycore.analyze_module(self.mod2)
+        pymod2 = self.pycore.resource_to_pyobject(self.mod2)
+        self.assertEquals(pymod2['D'].get_object(),
+                          a_class['attr'].get_object().get_type())
+
+    def test_inferring_again_after_creating_modules(self):
+        self.mod1.write('class C(object):\n    pass\na_var = C()\n')
+        self._get_type(self.mod1, 'a_var')
+        testutils.create_module(self.project, 'mod4')
+        self.pycore.module_cache.forget_all_data()
+        self._get_type(self.mod1, 'a_var')
+        self.assertEquals(2, len(self.inferred))
+
+    def test_saving_inferred_objects(self):
+        self.project.prefs['save_inferred_objects'] = True
+        self.mod1.write('class C(object):\n    pass\n')
+        self.mod2.write('import mod1\na_var = mod1.C()\n')
+        self._get_type(self.mod2, 'a_var')
+        self.project.close()
+        self.project = rope.base.project.Project(
+            self.project.address, save_inferred_objects=True)
+        self.pycore = self.project.pycore
+        mod1 = self.project.get_resource('mod1.py')
+        mod2 = self.project.get_resource('mod2.py')
+        c_class = self.pycore.resource_to_pyobject(mod1)['C'].get_object()
+        self.assertEquals(c_class, self._get_type(mod2, 'a_var'))
+        self.assertEquals(1, len(self.inferred))
+
+    def test_disabling_the_cache(self):
+        self.project.prefs['cache_inferred_objects'] = False
+        self.mod1.write('class C(object):\n    pass\na_var = C()\n')
+        self._get_type(self.mod1, 'a_var')
+        self.pycore.module_cache.forget_all_data()
+        self._get_type(self.mod1, 'a_var')
+        self.assertEquals(2, len(self.inferred))
+
+
+def suite():
+    result = unittest.TestSuite()
+    result.addTests(unittest.makeSuite(InferenceCacheTest))
+    return result
+
+if __name__ == '__main__':
+    unittest.main()
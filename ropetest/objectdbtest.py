@@ -1,3 +1,4 @@
+import pickle
 import unittest
 
 from rope.base.oi import objectdb, memorydb
@@ -149,6 +150,29 @@ class ObjectDBTest(unittest.TestCase):
         db.validate_files()
         self.assertEquals('removed invalid ', observer.log)
 
+    @_do_for_all_dbs
+    def test_restoring_snapshots(self, db):
+        db.add_callinfo('file', 'key', (1, 2), 3)
+        db.add_pername('file', 'key', 'name', 4)
+        snapshot = pickle.loads(pickle.dumps(db.snapshot()))
+        new_db = objectdb.ObjectDB(memorydb.MemoryDB(self.project),
+                                   _MockValidation())
+        new_db.restore(snapshot)
+        self.assertEquals(['file'], new_db.get_files())
+        self.assertEquals(3, new_db.get_returned('file', 'key', (1, 2)))
+        self.assertEquals(4, new_db.get_pername('file', 'key', 'name'))
+
+    @_do_for_all_dbs
+    def test_file_list_observers_when_restoring_snapshots(self, db):
+        db.add_callinfo('file', 'key', (1, 2), 3)
+        new_db = objectdb.ObjectDB(memorydb.MemoryDB(self.project),
+                                   _MockValidation())
+        new_db.add_callinfo('old_file', 'key', (1, 2), 3)
+        observer = _MockFileListObserver()
+        new_db.add_file_list_observer(observer)
+        new_db.restore(db.snapshot())
+        self.assertEquals('removed old_file added file ', observer.log)
+
 
 def suite():
     result = unittest.TestSuite()
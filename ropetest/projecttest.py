@@ -929,6 +929,37 @@ class RopeFolderTest(unittest.TestCase):
         mod.write('xyz print')
         pymod = pycore.resource_to_pyobject(mod)
 
+    def test_ignored_folders_and_get_files(self):
+        self.project = testutils.sample_project(
+            ignored_resources=['node_modules'], ropefolder=None)
+        folder = self.project.root.create_folder('node_modules')
+        folder.create_file('mod.py')
+        self.project.root.create_file('mod.py')
+        self.assertEquals(set([self.project.get_file('mod.py')]),
+                          self.project.get_files())
+
+    def test_many_ignored_resources_patterns(self):
+        patterns = ['file%s.*' % index for index in range(200)]
+        self.project = testutils.sample_project(ignored_resources=patterns)
+        self.assertTrue(self.project.is_ignored(
+                        self.project.get_file('folder/file150.txt')))
+        self.assertFalse(self.project.is_ignored(
+                         self.project.get_file('file200.txt')))
+
+    def test_reusing_folder_listings_with_the_same_mtime(self):
+        self.project = testutils.sample_project(ropefolder=None)
+        folder = self.project.root.create_folder('folder')
+        folder.create_file('mod1.py')
+        os.utime(folder.real_path, (1000000, 1000000))
+        self.assertEquals(1, len(self.project.get_files()))
+        open(os.path.join(folder.real_path, 'mod2.py'), 'w').close()
+        os.utime(folder.real_path, (1000000, 1000000))
+        self.project.validate()
+        self.assertEquals(1, len(self.project.get_files()))
+        os.utime(folder.real_path, (1000001, 1000001))
+        self.project.validate()
+        self.assertEquals(2, len(self.project.get_files()))
+
     def test_compressed_history(self):
         self.project = testutils.sample_project(compress_history=True)
         mod = testutils.create_module(self.project, 'mod')
@@ -24,6 +24,14 @@ class PyCoreTest(unittest.TestCase):
         self.assertEquals(get_base_type('Module'), result.type)
         self.assertEquals(0, len(result.get_attributes()))
 
+    def test_names_and_docs_of_locked_methods(self):
+        analyze_module = self.pycore.analyze_module
+        self.assertEquals('analyze_module', analyze_module.__name__)
+        self.assertTrue('static object inference' in analyze_module.__doc__)
+        self.assertEquals('get_string_module',
+                          self.pycore.get_string_module.__name__)
+        self.assertTrue(self.pycore.get_string_module.__doc__)
+
     def test_nested_modules(self):
         pkg = testutils.create_package(self.project, 'pkg')
         mod = testutils.create_module(self.project, 'mod', pkg)
@@ -15,6 +15,25 @@ class PyCoreScopesTest(unittest.TestCase):
         testutils.remove_project(self.project)
         super(PyCoreScopesTest, self).tearDown()
 
+    def test_scopes_and_pynames_without_instance_dicts(self):
+        code = 'import os\nimport os.path as p\nfrom os import path\n' \
+               'a_var = 1\nfor i in range(2):\n    pass\n' \
+               'class C(object):\n    def f(self, arg):\n' \
+               '        self.attr = arg\n        return lambda: arg\n'
+        scope = self.pycore.get_string_scope(code)
+        c_class = scope['C'].get_object()
+        f_scope = c_class['f'].get_object().get_scope()
+        a_var = scope['a_var']
+        objects = [scope, c_class.get_scope(), f_scope, scope['os'],
+                   scope['p'], scope['path'], a_var, scope['i'],
+                   scope['C'], f_scope['arg'], c_class['attr'],
+                   a_var.assignments[0], a_var.pyobject]
+        objects.extend(f_scope.get_scopes())
+        a_var.get_object()
+        c_class['attr'].get_object()
+        for obj in objects:
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+
     def test_simple_scope(self):
         scope = self.pycore.get_string_scope('def sample_func():\n    pass\n')
         sample_func = scope['sample_func'].get_object()
@@ -110,6 +129,27 @@ class PyCoreScopesTest(unittest.TestCase):
         inner_scope = func_scope.get_scopes()[0]
         self.assertTrue('var' in inner_scope)
 
+    def test_scopes_in_compound_statements_of_function_scopes(self):
+        scope = self.pycore.get_string_scope(
+            'def func():\n    if True:\n        def f1():\n            pass\n'
+            '    try:\n        pass\n    except Exception:\n'
+            '        class C2(object):\n            pass\n'
+            '    for i in range(2):\n        def f3():\n            pass\n')
+        func_scope = scope.get_scopes()[0]
+        self.assertEquals(['f1', 'C2', 'f3'],
+                          [inner.pyobject.get_name()
+                           for inner in func_scope.get_scopes()])
+
+    def test_scopes_and_names_in_function_scopes(self):
+        scope = self.pycore.get_string_scope(
+            'def func():\n    def inner():\n        pass\n'
+            '    class C(object):\n        pass\n')
+        func_scope = scope.get_scopes()[0]
+        inner_scope, c_scope = func_scope.get_scopes()
+        self.assertEquals(inner_scope.pyobject,
+                          func_scope['inner'].get_object())
+        self.assertEquals(c_scope.pyobject, func_scope['C'].get_object())
+
     def test_for_variables_in_scopes(self):
         scope = self.pycore.get_string_scope(
             'for a_var in range(10):\n    pass\n')
@@ -205,6 +245,45 @@ class PyCoreScopesTest(unittest.TestCase):
         f_in_c = c_scope.get_scopes()[0]
         self.assertEquals(f_in_c, scope.get_inner_scope_for_line(7))
 
+    def test_get_inner_scope_for_nested_blocks(self):
+        scope = self.pycore.get_string_scope(
+            'def f():\n    if a:\n        for b in c:\n'
+            '            d = 1\n\n    # comment\n'
+            '        # comment\n\n'
+            'class C(object):\n    def g(self):\n        pass\n'
+            '    # comment\n    h = 1\n')
+        f_scope, c_scope = scope.get_scopes()
+        g_scope = c_scope.get_scopes()[0]
+        self.assertEquals(4, f_scope.get_end())
+        self.assertEquals(f_scope, scope.get_inner_scope_for_line(4))
+        self.assertEquals(scope, scope.get_inner_scope_for_line(8))
+        self.assertEquals(11, g_scope.get_end())
+        self.assertEquals(g_scope, scope.get_inner_scope_for_line(11))
+        self.assertEquals(c_scope, scope.get_inner_scope_for_line(13))
+        self.assertEquals(13, c_scope.get_end())
+
+    def test_get_inner_scope_for_many_scopes(self):
+        code = ''.join(['def f%s():\n    pass\n' % index
+                        for index in range(20)])
+        scope = self.pycore.get_string_scope(code + 'a = 1\n')
+        scopes = scope.get_scopes()
+        for index in range(20):
+            self.assertEquals(scopes[index],
+                              scope.get_inner_scope_for_line(index * 2 + 1))
+            self.assertEquals(scopes[index],
+                              scope.get_inner_scope_for_line(index * 2 + 2))
+        self.assertEquals(scope, scope.get_inner_scope_for_line(41))
+
+    def test_get_inner_scope_for_one_liners(self):
+        scope = self.pycore.get_string_scope(
+            'class C(object):\n    def f(self): pass\n'
+            '    def g(self): pass\na = 1\n')
+        c_scope = scope.get_scopes()[0]
+        f_scope, g_scope = c_scope.get_scopes()
+        self.assertEquals(f_scope, scope.get_inner_scope_for_line(2))
+        self.assertEquals(g_scope, scope.get_inner_scope_for_line(3))
+        self.assertEquals(scope, scope.get_inner_scope_for_line(4))
+
     def test_getting_defined_names_for_classes(self):
         scope = self.pycore.get_string_scope(
             'class A(object):\n    def a(self):\n        pass\n'
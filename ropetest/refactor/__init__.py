@@ -347,6 +347,31 @@ class IntroduceFactoryTest(unittest.TestCase):
         self.assertEquals(expected1, mod1.read())
         self.assertEquals(expected2, mod2.read())
 
+    def test_introducing_factories_in_other_processes(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('class AClass(object):\n    an_attr = 10\n')
+        mod2.write('from mod1 import AClass\npair = AClass(), AClass\n')
+        self._introduce_factory(mod1, mod1.read().index('AClass') + 1,
+                                'create', global_factory=True, processes=2)
+        expected1 = 'class AClass(object):\n' \
+                    '    an_attr = 10\n\n' \
+                    'def create(*args, **kwds):\n' \
+                    '    return AClass(*args, **kwds)\n'
+        expected2 = 'from mod1 import AClass, create\n' \
+                    'pair = create(), AClass\n'
+        self.assertEquals(expected1, mod1.read())
+        self.assertEquals(expected2, mod2.read())
+
+    @testutils.assert_raises(RefactoringError)
+    def test_raising_errors_of_other_processes(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod1.write('class A(object):\n    class B(object):\n        pass\n')
+        mod2.write('import mod1\nb = mod1.A.B()\n')
+        self._introduce_factory(mod1, mod1.read().index('B') + 1,
+                                'create', global_factory=True, processes=2)
+
     def test_changing_occurances_for_renamed_classes(self):
         code = 'class AClass(object):\n    an_attr = 10\na_class = AClass\na_var = a_class()'
         mod = testutils.create_module(self.project, 'mod')
@@ -474,6 +499,38 @@ class EncapsulateFieldTest(unittest.TestCase):
                    'range(a_var.get_attr())\n'
         self.assertEquals(expected, self.mod1.read())
 
+    def test_changing_other_modules_in_other_processes(self):
+        code = 'import mod\n' \
+               'a_var = mod.A()\n' \
+               'a_var.attr = a_var.attr + 1\n'
+        self.mod1.write(code)
+        self.mod.write(self.a_class)
+        self._encapsulate(self.mod, self.mod.read().index('attr') + 1,
+                          processes=2)
+        expected = 'import mod\n' \
+                   'a_var = mod.A()\n' \
+                   'a_var.set_attr(a_var.get_attr() + 1)\n'
+        self.assertEquals(self.encapsulated, self.mod.read())
+        self.assertEquals(expected, self.mod1.read())
+
+    def test_using_the_objectdb_in_other_processes(self):
+        self.mod.write(self.a_class)
+        self.mod1.write('def f(p):\n    print p.attr\n')
+        mod2 = testutils.create_module(self.project, 'mod2')
+        mod2.write('import mod, mod1\nmod1.f(mod.A())\n')
+        self.pycore.analyze_module(mod2)
+        encapsulate = EncapsulateField(self.project, self.mod,
+                                       self.mod.read().index('attr') + 1)
+        serial = encapsulate.get_changes(processes=1)
+        parallel = encapsulate.get_changes(processes=2)
+        self.assertEquals(self._new_contents(serial),
+                          self._new_contents(parallel))
+        self.assertTrue(self.mod1 in self._new_contents(parallel))
+
+    def _new_contents(self, changes):
+        return dict((change.resource, change.new_contents)
+                    for change in changes.changes)
+
     def test_changing_setters_in_other_modules(self):
         code = 'import mod\n' \
                'a_var = mod.A()\n' \
@@ -894,8 +951,7 @@ def suite():
     result.addTests(unittest.makeSuite(
                     ropetest.refactor.movetest.MoveRefactoringTest))
     result.addTests(ropetest.refactor.inlinetest.suite())
-    result.addTests(unittest.makeSuite(
-                    ropetest.refactor.patchedasttest.PatchedASTTest))
+    result.addTests(ropetest.refactor.patchedasttest.suite())
     result.addTests(unittest.makeSuite(EncapsulateFieldTest))
     result.addTests(unittest.makeSuite(LocalToFieldTest))
     result.addTests(unittest.makeSuite(
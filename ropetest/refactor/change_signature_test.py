@@ -1,7 +1,7 @@
 import unittest
 
 import rope.base.exceptions
-from rope.refactor import change_signature
+from rope.refactor import change_signature, functionutils
 from rope.refactor.change_signature import *
 from ropetest import testutils
 
@@ -122,6 +122,25 @@ class ChangeSignatureTest(unittest.TestCase):
         self.assertEquals('def a_func(p2):\n    pass\na_func(2)\n',
                           self.mod.read())
 
+    def test_call_infos_without_instance_dicts(self):
+        call_info = functionutils.CallInfo('f', ['1'], [], None, None,
+                                           False, False)
+        self.assertEquals('f(1)', call_info.to_string())
+        self.assertFalse(hasattr(call_info, '__dict__'))
+
+    def test_changing_signatures_in_other_processes(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        self.mod.write('def a_func(p1, p2):\n    pass\na_func(1, 2)\n')
+        mod1.write('import mod\nmod.a_func(3, p2=4)\n')
+        signature = ChangeSignature(self.project, self.mod,
+                                    self.mod.read().index('a_func') + 1)
+        changers = [ArgumentRemover(0), ArgumentAdder(1, 'p3', None, '5')]
+        self.project.do(signature.get_changes(changers, processes=2))
+        self.assertEquals('def a_func(p2, p3):\n    pass\na_func(2, 5)\n',
+                          self.mod.read())
+        self.assertEquals('import mod\nmod.a_func(4, 5)\n',
+                          mod1.read())
+
     def test_removing_arguments_passed_as_keywords(self):
         self.mod.write('def a_func(p1):\n    pass\na_func(p1=1)\n')
         signature = ChangeSignature(self.project, self.mod,
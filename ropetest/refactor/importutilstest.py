@@ -1,6 +1,7 @@
 import unittest
 
-from rope.refactor.importutils import ImportTools, importinfo, add_import
+from rope.refactor.importutils import (ImportTools, importinfo, add_import,
+                                       ImportOrganizer)
 from ropetest import testutils
 
 
@@ -432,6 +433,15 @@ class ImportUtilsTest(unittest.TestCase):
         self.assertEquals('def a_func(pkg1):\n    my_var = pkg1\n',
                           module_with_imports.get_changed_source())
 
+    def test_removing_unused_imports_and_names_bound_in_functions(self):
+        self.mod.write('import pkg1\ndef a_func():\n'
+                       '    pkg1 = 1\n    return pkg1\n')
+        pymod = self.pycore.get_module('mod')
+        module_with_imports = self.import_tools.module_imports(pymod)
+        module_with_imports.remove_unused_imports()
+        self.assertEquals('def a_func():\n    pkg1 = 1\n    return pkg1\n',
+                          module_with_imports.get_changed_source())
+
     def test_trivial_expanding_star_imports(self):
         self.mod1.write('def a_func():\n    pass\ndef another_func():\n    pass\n')
         self.mod.write('from pkg1.mod1 import *\n')
@@ -911,6 +921,54 @@ class ImportUtilsTest(unittest.TestCase):
         imports = module_with_imports.get_used_imports(pymod)
         self.assertEquals(1, len(imports))
 
+    def test_organizing_imports_of_folders(self):
+        self.mod1.write('import pkg2\nimport os\nos.getcwd()\n')
+        self.mod2.write('import os\n\n\nos.getcwd()\n')
+        self.mod3.write('import sys\nimport os\nos.sep\nsys.path\n')
+        organizer = ImportOrganizer(self.project)
+        changes = organizer.organize_imports(self.project.root)
+        self.assertEquals(set([self.mod1, self.mod3]),
+                          set(changes.get_changed_resources()))
+        self.project.do(changes)
+        self.assertEquals('import os\n\n\nos.getcwd()\n', self.mod1.read())
+        self.assertEquals('import os\nimport sys\n\n\nos.sep\nsys.path\n',
+                          self.mod3.read())
+
+    def test_organizing_imports_of_packages(self):
+        self.mod1.write('import os\n')
+        self.mod2.write('import os\n')
+        organizer = ImportOrganizer(self.project)
+        changes = organizer.organize_imports(self.pkg2)
+        self.assertEquals(set([self.mod2]), changes.get_changed_resources())
+        self.assertEquals(None, organizer.organize_imports(self.pkg1.parent
+                                                           .get_child('p1')))
+
+    def test_organizing_imports_of_folders_with_syntax_errors(self):
+        self.mod1.write('import os\ndef f(:\n')
+        self.mod2.write('import os\n')
+        organizer = ImportOrganizer(self.project)
+        changes = organizer.organize_imports(self.project.root)
+        self.assertEquals(set([self.mod2]), changes.get_changed_resources())
+
+    def test_organizing_imports_of_folders_in_processes(self):
+        self.mod1.write('import pkg2\nimport os\nos.getcwd()\n')
+        self.mod2.write('import os\n\n\nos.getcwd()\n')
+        self.mod3.write('import sys\n')
+        organizer = ImportOrganizer(self.project)
+        changes = organizer.organize_imports(self.project.root, processes=2)
+        self.project.do(changes)
+        self.assertEquals('import os\n\n\nos.getcwd()\n', self.mod1.read())
+        self.assertEquals('import os\n\n\nos.getcwd()\n', self.mod2.read())
+        self.assertEquals('', self.mod3.read())
+
+    def test_caching_module_lookups(self):
+        self.pycore.cache_module_lookups()
+        self.assertEquals(None, self.pycore.find_module('mod4'))
+        mod4 = testutils.create_module(self.project, 'mod4')
+        self.assertEquals(None, self.pycore.find_module('mod4'))
+        self.pycore.cache_module_lookups(False)
+        self.assertEquals(mod4, self.pycore.find_module('mod4'))
+
 
 class AddImportTest(unittest.TestCase):
 
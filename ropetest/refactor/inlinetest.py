@@ -132,6 +132,15 @@ class InlineTest(unittest.TestCase):
         self.assertEquals('import mod\nprint(1)\n', mod1.read())
         self.assertEquals('class A(object):\n    var = 10\n', self.mod.read())
 
+    def test_inlining_functions_in_other_processes(self):
+        self.mod.write('def a_func():\n    print(1)\na_func()\n')
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod1.write('import mod\nmod.a_func()\n')
+        self._inline2(self.mod, self.mod.read().index('a_func') + 1,
+                      processes=2)
+        self.assertEquals('print(1)\n', self.mod.read())
+        self.assertEquals('import mod\nprint(1)\n', mod1.read())
+
     def test_replacing_calls_with_function_definition_in_defining_module(self):
         self.mod.write('def a_func():\n    print(1)\na_func()\n')
         self._inline2(self.mod, self.mod.read().index('a_func') + 1)
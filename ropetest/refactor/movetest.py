@@ -43,6 +43,13 @@ class MoveRefactoringTest(unittest.TestCase):
         self.assertEquals('import mod1\nimport mod2\na_var = mod2.AClass()\n',
                           self.mod3.read())
 
+    def test_changing_other_modules_with_occurrences_in_import_lines(self):
+        self.mod1.write('def f():\n    pass\n')
+        self.mod3.write('import mod1; mod1.f()\n')
+        self._move(self.mod1, self.mod1.read().index('f()') + 1, self.mod2)
+        self.assertEquals('import mod1; mod2.f()\nimport mod2\n',
+                          self.mod3.read())
+
     def test_changing_other_modules_removing_from_imports(self):
         self.mod1.write('class AClass(object):\n    pass\n')
         self.mod3.write('from mod1 import AClass\na_var = AClass()\n')
@@ -51,6 +58,23 @@ class MoveRefactoringTest(unittest.TestCase):
         self.assertEquals('import mod2\na_var = mod2.AClass()\n',
                           self.mod3.read())
 
+    def test_changing_other_modules_with_code_before_imports(self):
+        self.mod1.write('class AClass(object):\n    pass\n')
+        self.mod3.write('"""doc"""\na_var = 1\nfrom mod1 import AClass\n'
+                        'b_var = AClass()\n')
+        self._move(self.mod1, self.mod1.read().index('AClass') + 1,
+                   self.mod2)
+        self.assertEquals('"""doc"""\nimport mod2\na_var = 1\n'
+                          'b_var = mod2.AClass()\n', self.mod3.read())
+
+    def test_changing_other_modules_with_occurrences_in_many_lines(self):
+        self.mod1.write('class AClass(object):\n    pass\n')
+        self.mod3.write('import mod1\na_var = mod1.\\\n    AClass()\n')
+        self._move(self.mod1, self.mod1.read().index('AClass') + 1,
+                   self.mod2)
+        self.assertEquals('import mod1\nimport mod2\na_var = mod2.AClass()\n',
+                          self.mod3.read())
+
     def test_changing_source_module(self):
         self.mod1.write('class AClass(object):\n    pass\na_var = AClass()\n')
         self._move(self.mod1, self.mod1.read().index('AClass') + 1,
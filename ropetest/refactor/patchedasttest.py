@@ -785,6 +785,73 @@ class PatchedASTTest(unittest.TestCase):
             'Delete', ['del', ' ', 'Name', '', ',', ' ', 'Name'])
 
 
+class LazyPatchedASTTest(unittest.TestCase):
+
+    source = 'import os\n\n@decorator(1)\ndef f(p, (a, b)=(1, 2)):\n' \
+             '    """doc"""\n    if p:\n        x = "a"\n' \
+             '    else:\n        "b" \'c\'\n    try:\n' \
+             '        x = (p +\n             1)  # comment\n' \
+             '    except (IOError, OSError), e:\n        pass\n' \
+             '    return x; y = [i for i in (p)]\n' \
+             'class C(object):\n    def g(self):\n        pass\n'
+
+    def _get_nodes(self, node):
+        result = []
+        def add(child):
+            if not isinstance(child, (ast.expr_context, ast.operator,
+                                      ast.boolop, ast.unaryop, ast.cmpop)):
+                result.append(child)
+        ast.call_for_nodes(node, add, recursive=True)
+        return result
+
+    def test_same_regions_as_normal_patching(self):
+        expected = self._get_nodes(patchedast.get_patched_ast(self.source))
+        patched = patchedast.get_patched_ast(self.source, lazy=True)
+        nodes = self._get_nodes(patched)
+        self.assertEquals(len(expected), len(nodes))
+        for node, expected_node in reversed(zip(nodes, expected)):
+            self.assertEquals(expected_node.region,
+                              patchedast.node_region(node))
+
+    def test_patching_only_the_innermost_statement(self):
+        node = patchedast.get_patched_ast(self.source, lazy=True)
+        method = node.body[-1].body[0]
+        patchedast.node_region(method.args)
+        self.assertTrue(hasattr(method, 'region'))
+        self.assertFalse(hasattr(node.body[-1], 'region'))
+        self.assertFalse(hasattr(node.body[0], 'region'))
+
+    def test_patching_parents_of_patched_statements(self):
+        node = patchedast.get_patched_ast(self.source, True, lazy=True)
+        for child in self._get_nodes(node)[::3]:
+            patchedast.node_region(child)
+        self.assertEquals(self.source, patchedast.write_ast(node))
+
+    def _assert_same_regions(self, source):
+        expected = self._get_nodes(patchedast.get_patched_ast(source))
+        nodes = self._get_nodes(patchedast.get_patched_ast(source, lazy=True))
+        pairs = zip(nodes, expected)
+        for node, expected_node in pairs[::-2] + pairs[-2::-2]:
+            self.assertEquals(expected_node.region,
+                              patchedast.node_region(node))
+
+    def test_elif_statements_in_any_order(self):
+        self._assert_same_regions(
+            'if a:\n    pass\nelif b > 1:\n    pass\n'
+            'elif c: d = 1\nelse:\n    if e: pass\n    elif f: pass\n')
+
+    def test_statements_starting_with_multiline_strings_in_any_order(self):
+        self._assert_same_regions(
+            '"""doc\nmore"""\nx = 1\n"""doc\nmore""".strip()\n'
+            'def f():\n    """doc\n    more"""\n    a = 1; \'\'\'\n\'\'\'\n')
+
+    def test_patching_lazily_patched_nodes_normally(self):
+        node = patchedast.get_patched_ast(self.source, lazy=True)
+        patchedast.patch_ast(node, self.source)
+        self.assertEquals((0, len(self.source)), node.region)
+        self.assertTrue(hasattr(node.body[1].body[0], 'region'))
+
+
 class _ResultChecker(object):
 
     def __init__(self, test_case, ast):
@@ -839,5 +906,12 @@ class _ResultChecker(object):
                     (expected, child.__class__.__name__))
 
 
+def suite():
+    result = unittest.TestSuite()
+    result.addTests(unittest.makeSuite(PatchedASTTest))
+    result.addTests(unittest.makeSuite(LazyPatchedASTTest))
+    return result
+
+
 if __name__ == '__main__':
     unittest.main()
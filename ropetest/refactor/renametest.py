@@ -327,6 +327,17 @@ class RenameRefactoringTest(unittest.TestCase):
             finder, 'new_var', pymodule=pymod, replace_primary=True)
         self.assertEquals('new_var = 10\nprint(1+new_var)\n', refactored)
 
+    def test_occurrences_without_instance_dicts(self):
+        mod1 = testutils.create_module(self.project, 'mod1')
+        mod1.write('a = 10\nprint(1+a)\n')
+        pymod = self.pycore.get_module('mod1')
+        finder = rope.refactor.occurrences.create_finder(
+            self.pycore, 'a', pymod['a'])
+        occurrences = list(finder.find_occurrences(pymodule=pymod))
+        self.assertEquals(2, len(occurrences))
+        for occurrence in occurrences:
+            self.assertFalse(hasattr(occurrence, '__dict__'))
+
     def test_renaming_for_loop_variable(self):
         code = 'for var in range(10):\n    print(var)\n'
         refactored = self._local_rename(code, code.find('var') + 1, 'new_var')
@@ -1,3 +1,4 @@
+from rope.base import exceptions
 from rope.refactor import restructure
 from ropetest import testutils
 
@@ -182,6 +183,49 @@ class RestructureTest(unittest.TestCase):
         self.project.do(refactoring.get_changes())
         self.assertEquals(mod_text, self.mod.read())
 
+    def test_skipping_modules_without_pattern_names(self):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod.write('a = pow(1)\n')
+        mod2.write('b = 1\n')
+        refactoring = restructure.Restructure(self.project,
+                                              'pow(${a})', 'g(${a})')
+        changes = refactoring.get_changes()
+        self.assertEquals([self.mod],
+                          [change.resource for change in changes.changes])
+        self.project.do(changes)
+        self.assertEquals('a = g(1)\n', self.mod.read())
+
+    def test_reporting_syntax_errors_of_modules_without_pattern_names(self):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod.write('a = pow(1)\n')
+        mod2.write('def g(:\n')
+        refactoring = restructure.Restructure(self.project,
+                                              'pow(${a})', 'g(${a})')
+        self.assertRaises(exceptions.ModuleSyntaxError,
+                          refactoring.get_changes)
+
+    def test_ignoring_syntax_errors_of_modules_without_pattern_names(self):
+        self.project.prefs['ignore_syntax_errors'] = True
+        mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod.write('a = pow(1)\n')
+        mod2.write('def g(:\n')
+        refactoring = restructure.Restructure(self.project,
+                                              'pow(${a})', 'g(${a})')
+        self.project.do(refactoring.get_changes())
+        self.assertEquals('a = g(1)\n', self.mod.read())
+
+    def test_restructuring_in_other_processes(self):
+        mod2 = testutils.create_module(self.project, 'mod2')
+        self.mod.write('def f(*a):\n    pass\na = f(1)\n')
+        mod2.write('import mod\nb = mod.f(2)\n')
+        refactoring = restructure.Restructure(
+            self.project, '${f}(${a})', '${f}(${a}, 0)',
+            args={'f': 'name=mod.f'})
+        self.project.do(refactoring.get_changes(processes=2))
+        self.assertEquals('def f(*a):\n    pass\na = f(1, 0)\n',
+                          self.mod.read())
+        self.assertEquals('import mod\nb = mod.f(2, 0)\n', mod2.read())
+
 
 if __name__ == '__main__':
     unittest.main()
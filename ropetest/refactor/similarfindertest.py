@@ -1,5 +1,6 @@
 import unittest
 
+from rope.base import ast
 from rope.refactor import similarfinder
 from ropetest import testutils
 
@@ -24,6 +25,21 @@ class SimilarFinderTest(unittest.TestCase):
         finder = self._create_finder('')
         self.assertEquals([], list(finder.get_match_regions('10')))
 
+    def test_matching_inside_elif_statements(self):
+        source = 'if a:\n    pass\nelif b > 1:\n    pass\n'
+        finder = self._create_finder(source)
+        self.assertEquals([(20, 25)],
+                          list(finder.get_match_regions('${x} > 1')))
+
+    def test_matching_statements_starting_with_multiline_strings(self):
+        source = 'x = 1\n"""doc\nmore""".strip()\n'
+        finder = self._create_finder(source)
+        self.assertEquals([(6, 28)],
+                          list(finder.get_match_regions('${a}.strip()')))
+        finder = self._create_finder('"""doc\nmore"""\nx = 1\n')
+        self.assertEquals((0, 14),
+                          list(finder.get_match_regions('${a}\n'))[0])
+
     def test_constant_integer(self):
         source = 'a = 10\n'
         finder = self._create_finder(source)
@@ -156,6 +172,41 @@ class SimilarFinderTest(unittest.TestCase):
         finder = self._create_finder(source)
         self.assertEquals(1, len(list(finder.get_matches(pattern))))
 
+    def test_matches_in_source_order_with_partial_patterns(self):
+        source = 'a = f(1, x)\nb = [f(1, y), f(2, z)]\n'
+        finder = self._create_finder(source)
+        result = list(finder.get_match_regions('f(1, ${a})'))
+        self.assertEquals([(4, 11), (17, 24)], result)
+
+    def test_matching_statements_after_other_statements(self):
+        source = 'def f():\n    a = 1\n    b = 2\n    a = 1\n'
+        finder = self._create_finder(source)
+        result = list(finder.get_matches('a = 1\n'))
+        self.assertEquals(2, len(result))
+
+    def test_matching_names_with_different_contexts(self):
+        source = 'a.b = 1\nc = a.b\n'
+        finder = self._create_finder(source)
+        self.assertEquals(2, len(list(finder.get_matches('a.b'))))
+
+
+class NodeIndexTest(unittest.TestCase):
+
+    def test_equal_nodes_having_equal_hashes(self):
+        node = ast.parse('a = f(1)\nb = f(1)\nc = f(2)\n')
+        index = similarfinder._NodeIndex(node)
+        calls = index.get_nodes(ast.Call)
+        self.assertEquals(3, len(calls))
+        self.assertEquals(index.get_hash(calls[0]), index.get_hash(calls[1]))
+        self.assertNotEquals(index.get_hash(calls[0]),
+                             index.get_hash(calls[2]))
+
+    def test_list_items(self):
+        node = ast.parse('a = 1\nif a:\n    b = 2\n')
+        index = similarfinder._NodeIndex(node)
+        items = index.get_list_items(ast.Assign)
+        self.assertEquals([(node.body, 0), (node.body[1].body, 0)], items)
+
 
 class CheckingFinderTest(unittest.TestCase):
 
@@ -273,11 +324,24 @@ class TemplateTest(unittest.TestCase):
         self.assertEquals('1, 2\n', template.substitute({'a': '1', 'b': '2'}))
 
 
+class LiteralNamesTest(unittest.TestCase):
+
+    def test_names_attributes_and_keywords(self):
+        names = similarfinder.get_literal_names(
+            '${pyobject}.get_attribute(name, default=${d})')
+        self.assertEquals(set(['get_attribute', 'name', 'default']), names)
+
+    def test_patterns_with_only_wildcards(self):
+        self.assertEquals(set(), similarfinder.get_literal_names('${a}'))
+
+
 def suite():
     result = unittest.TestSuite()
     result.addTests(unittest.makeSuite(SimilarFinderTest))
+    result.addTests(unittest.makeSuite(NodeIndexTest))
     result.addTests(unittest.makeSuite(CheckingFinderTest))
     result.addTests(unittest.makeSuite(TemplateTest))
+    result.addTests(unittest.makeSuite(LiteralNamesTest))
     return result
 
 if __name__ == '__main__':
@@ -75,6 +75,29 @@ class UseFunctionTest(unittest.TestCase):
         self.assertEquals('import mod1\nprint(mod1.f(2))\n',
                           self.mod2.read())
 
+    def test_occurrences_in_other_modules_in_other_processes(self):
+        code = 'def f(p):\n    return p + 1\nprint(1 + 1)\n'
+        self.mod1.write(code)
+        user = UseFunction(self.project, self.mod1, code.index('f'))
+        self.mod2.write('print(2 + 1)\n')
+        mod3 = testutils.create_module(self.project, 'mod3')
+        mod3.write('print(3 + 1)\n')
+        self.project.do(user.get_changes(processes=2))
+        self.assertEquals('def f(p):\n    return p + 1\nprint(f(1))\n',
+                          self.mod1.read())
+        self.assertEquals('import mod1\nprint(mod1.f(2))\n',
+                          self.mod2.read())
+        self.assertEquals('import mod1\nprint(mod1.f(3))\n', mod3.read())
+
+    def test_passing_resources_without_the_defining_module(self):
+        code = 'def f(p):\n    return p + 1\n'
+        self.mod1.write(code)
+        user = UseFunction(self.project, self.mod1, code.index('f'))
+        self.mod2.write('print(2 + 1)\n')
+        self.project.do(user.get_changes(resources=[self.mod2]))
+        self.assertEquals('import mod1\nprint(mod1.f(2))\n',
+                          self.mod2.read())
+
     @testutils.assert_raises(exceptions.RefactoringError)
     def test_when_performing_on_non_functions(self):
         code = 'var = 1\n'
@@ -1,6 +1,6 @@
 import unittest
 
-from rope.base import simplify
+from rope.base import simplify, utils
 
 
 class SimplifyTest(unittest.TestCase):
@@ -58,10 +58,69 @@ class SimplifyTest(unittest.TestCase):
         code = 'a = 1;b = 2\n'
         self.assertEquals('a = 1\nb = 2\n', simplify.real_code(code))
 
+    def test_caching_real_code_for_equal_sources(self):
+        code = 'a = "1"\n'
+        hits = simplify.analyze.hits
+        result = simplify.real_code(code)
+        self.assertTrue(result is simplify.real_code(code[:-1] + '\n'))
+        self.assertEquals(hits + 1, simplify.analyze.hits)
+
+    def test_finding_ignored_regions(self):
+        code = 'a = "b"  # c\n'
+        simplified = simplify.analyze(code)
+        self.assertEquals([(4, 7), (9, 12)], simplified.ignored)
+        self.assertEquals((4, 7), simplified.get_ignored_region(5))
+        self.assertEquals(None, simplified.get_ignored_region(7))
+        self.assertEquals((9, 12), simplified.get_ignored_region(9))
+
+    def test_logical_lines(self):
+        code = 'a = 1\n\nb = (1,\n     2)\nc = 1 + \\\n  2\n'
+        self.assertEquals([(1, 1), (3, 4), (5, 6)],
+                          simplify.analyze(code).logical_lines)
+
+    def test_logical_lines_and_multiline_strs_and_comments(self):
+        code = '# c\ns = """\n"""\n  \nd = 1\n'
+        self.assertEquals([(1, 1), (2, 3), (5, 5)],
+                          simplify.analyze(code).logical_lines)
+
+    def test_logical_lines_and_unterminated_long_strs(self):
+        code = 'a = 1\ns = """\nb = 1\n'
+        self.assertEquals([(1, 1), (2, 4)],
+                          simplify.analyze(code).logical_lines)
+
+
+class LRUCachedTest(unittest.TestCase):
+
+    def test_evicting_least_recently_used_keys(self):
+        calls = []
+        @utils.lru_cached(2)
+        def func(key):
+            calls.append(key)
+            return key.upper()
+        func('a')
+        func('b')
+        func('a')
+        func('c')
+        self.assertEquals('A', func('a'))
+        self.assertEquals('B', func('b'))
+        self.assertEquals(['a', 'b', 'c', 'b'], calls)
+        self.assertEquals(2, func.hits)
+        self.assertEquals(4, func.misses)
+
+    def test_clearing_lru_caches(self):
+        @utils.lru_cached(2)
+        def func(key):
+            return key
+        func('a')
+        func.clear()
+        self.assertEquals(0, len(func.cache))
+        self.assertEquals(0, func.misses)
+
 
 def suite():
     result = unittest.TestSuite()
     result.addTests(unittest.makeSuite(SimplifyTest))
+    result.addTests(unittest.makeSuite(LRUCachedTest))
     return result
 
 if __name__ == '__main__':